@@ -0,0 +1,119 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark checking whether chart data is cached, with and without the metadata
+sidecar of the query cache manager.
+
+Runs against a Redis server given by ``--redis-url``, or an in-process fakeredis
+server otherwise (``pip install fakeredis``).
+"""
+
+import time
+from typing import Any, Callable, Optional
+
+import click
+import numpy as np
+import pandas as pd
+from cachelib.redis import RedisCache
+
+
+class BenchmarkCache:  # pylint: disable=too-few-public-methods
+    """
+    The subset of the Flask-Caching API used by the query cache manager.
+    """
+
+    def __init__(self, cache: RedisCache) -> None:
+        self.cache = cache
+        self.get = cache.get
+        self.set = cache.set
+        self.delete_many = cache.delete_many
+
+
+def get_redis_cache(redis_url: Optional[str]) -> RedisCache:
+    if redis_url:
+        # pylint: disable=import-outside-toplevel
+        from redis import Redis  # type: ignore
+
+        client = Redis.from_url(redis_url)
+    else:
+        # pylint: disable=import-outside-toplevel
+        from fakeredis import FakeStrictRedis
+
+        client = FakeStrictRedis()
+    return RedisCache(host=client, key_prefix="benchmark_cache_metadata_")
+
+
+def measure(func: Callable[..., Any], args: tuple[Any, ...], repeat: int) -> float:
+    """
+    Return the mean wall time in seconds.
+    """
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(*args)
+    return (time.perf_counter() - start) / repeat
+
+
+@click.command()
+@click.option("--rows", default=100_000, help="Number of rows of the cached data.")
+@click.option("--repeat", default=50, help="Number of checks per implementation.")
+@click.option("--redis-url", default=None, help="Redis server, instead of fakeredis.")
+def main(rows: int, repeat: int, redis_url: Optional[str]) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.common.utils import query_cache_manager
+    from superset.common.utils.query_cache_manager import QueryCacheManager
+    from superset.constants import CacheRegion
+
+    redis_cache = get_redis_cache(redis_url)
+    query_cache_manager._cache[CacheRegion.DATA] = BenchmarkCache(  # type: ignore
+        redis_cache
+    )
+
+    rng = np.random.default_rng(42)
+    df = pd.DataFrame(
+        {
+            "ds": pd.date_range("2020-01-01", periods=rows, freq="min"),
+            "name": [f"name {i}" for i in rng.integers(0, 1000, rows)],
+            "value": rng.random(rows),
+        }
+    )
+    QueryCacheManager.set("key", {"df": df, "query": "SELECT"}, region=CacheRegion.DATA)
+    # as cached before the Arrow codec and the metadata sidecar
+    redis_cache.set("pickled_key", {"df": df, "query": "SELECT"})
+    print(f"Checking a cached value of {rows} rows, {repeat} times")
+
+    implementations: dict[str, Callable[[], bool]] = {
+        "loading the pickled value": lambda: bool(redis_cache.get("pickled_key")),
+        "loading the Arrow value": lambda: bool(redis_cache.get("key")),
+        "loading the metadata sidecar": lambda: QueryCacheManager.has(
+            "key", region=CacheRegion.DATA
+        ),
+    }
+    for label, has in implementations.items():
+        assert has()
+        print(f"- {label}: {measure(has, (), repeat) * 1000:.2f} ms")
+
+    QueryCacheManager.delete("key", region=CacheRegion.DATA)
+    redis_cache.delete("pickled_key")
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
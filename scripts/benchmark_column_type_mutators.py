@@ -0,0 +1,134 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark applying the ``column_type_mutators`` of an engine to fetched rows.
+
+Compares the previous implementation, which copied each row into a list and
+applied the mutators cell by cell, with ``BaseEngineSpec._mutate_data``, which
+mutates whole columns and rebuilds the rows once, on a result set with a decimal
+column returned as strings and as ``Decimal``.
+"""
+
+import time
+from decimal import Decimal
+from typing import Any, Callable
+
+import click
+from sqlalchemy import types
+
+from superset.db_engine_specs.base import BaseEngineSpec
+from superset.superset_typing import DbapiDescription
+
+
+class DecimalEngineSpec(BaseEngineSpec):
+    """
+    An engine mutating its decimal columns like MySQL.
+    """
+
+    column_type_mutators = {
+        types.Numeric: lambda val: Decimal(val) if isinstance(val, str) else val
+    }
+    column_type_vectorized_mutators = {
+        types.Numeric: lambda values: (
+            [Decimal(val) if isinstance(val, str) else val for val in values]
+            if any(isinstance(val, str) for val in values)
+            else values
+        )
+    }
+
+    @classmethod
+    def get_datatype(cls, type_code: Any) -> str:
+        return type_code
+
+
+def generate_rows(num_rows: int, as_strings: bool) -> list[tuple[Any, ...]]:
+    """
+    Generate rows with an integer, a decimal and a string column.
+    """
+    return [
+        (i, f"{i}.25" if as_strings else Decimal(f"{i}.25"), f"name {i % 1000}")
+        for i in range(num_rows)
+    ]
+
+
+def legacy_mutate(
+    data: list[tuple[Any, ...]], description: DbapiDescription
+) -> list[tuple[Any, ...]]:
+    """
+    The previous implementation, mutating the rows cell by cell.
+    """
+    column_mutators = {
+        row[0]: func
+        for row in description
+        if (
+            func := DecimalEngineSpec.column_type_mutators.get(
+                type(DecimalEngineSpec.get_sqla_column_type(row[1]))
+            )
+        )
+    }
+    if column_mutators:
+        indexes = {row[0]: idx for idx, row in enumerate(description)}
+        for row_idx, row in enumerate(data):
+            new_row = list(row)
+            for col, func in column_mutators.items():
+                col_idx = indexes[col]
+                new_row[col_idx] = func(row[col_idx])
+            data[row_idx] = tuple(new_row)
+
+    return data
+
+
+def measure(
+    func: Callable[..., Any],
+    rows: list[tuple[Any, ...]],
+    description: DbapiDescription,
+    repeat: int,
+) -> tuple[float, Any]:
+    """
+    Return the best wall time (seconds) and the result of the last run.
+    """
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        data = list(rows)
+        start = time.perf_counter()
+        result = func(data, description)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+@click.command()
+@click.option("--rows", default=1_000_000, help="Number of rows mutated.")
+@click.option("--repeat", default=3, help="Number of timed runs per path.")
+def main(rows: int, repeat: int) -> None:
+    description = [("id", "INTEGER"), ("amount", "DECIMAL"), ("name", "VARCHAR")]
+    for label, as_strings in (("strings", True), ("decimals", False)):
+        print(f"\n{rows} rows with decimals returned as {label}")
+        data = generate_rows(rows, as_strings)
+        legacy = measure(legacy_mutate, data, description, repeat)
+        # pylint: disable=protected-access
+        columnar = measure(DecimalEngineSpec._mutate_data, data, description, repeat)
+        assert legacy[1] == columnar[1]
+
+        print(f"- legacy: {legacy[0]:.2f} s")
+        print(f"- columnar: {columnar[0]:.2f} s")
+        print(f"Speedup: {legacy[0] / columnar[0]:.2f}x")
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
@@ -0,0 +1,103 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the codecs of the dataframes cached in the chart data cache region.
+
+Compares the size of a cached value, and the time to store and load it, when the
+dataframe is pickled as is and when it's encoded by the Arrow codec, as the cache
+backend pickles the whole value in both cases.
+"""
+
+import pickle
+import time
+from typing import Any, Callable, Optional
+
+import click
+import numpy as np
+import pandas as pd
+
+from superset.common.utils.query_cache_codecs import ArrowQueryCacheCodec
+
+
+def generate_dataframe(num_rows: int) -> pd.DataFrame:
+    """
+    Generate a dataframe typical of a chart query: a time column, a few string
+    dimensions and numeric metrics.
+    """
+    rng = np.random.default_rng(42)
+    return pd.DataFrame(
+        {
+            "ds": pd.date_range("2020-01-01", periods=num_rows, freq="min"),
+            "country": rng.choice(["France", "Germany", "Italy", "Spain"], num_rows),
+            "product": [f"product {i}" for i in rng.integers(0, 1000, num_rows)],
+            "count": rng.integers(0, 1_000_000, num_rows),
+            "revenue": rng.random(num_rows) * 1000,
+        }
+    )
+
+
+def store(df: pd.DataFrame, codec: Optional[ArrowQueryCacheCodec]) -> bytes:
+    value: dict[str, Any] = {"df": df, "query": "SELECT ..."}
+    if codec:
+        value = {**value, "df": codec.encode(df), "df_codec": codec.name}
+    return pickle.dumps(value)
+
+
+def load(blob: bytes, codec: Optional[ArrowQueryCacheCodec]) -> pd.DataFrame:
+    value = pickle.loads(blob)  # noqa: S301
+    return codec.decode(value["df"]) if codec else value["df"]
+
+
+def measure(func: Callable[..., Any], args: tuple[Any, ...], repeat: int) -> float:
+    """
+    Return the best wall time in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@click.command()
+@click.option("--rows", default=1_000_000, help="Number of rows of the dataframe.")
+@click.option("--repeat", default=5, help="Number of timed runs per codec.")
+def main(rows: int, repeat: int) -> None:
+    df = generate_dataframe(rows)
+    print(f"Caching a dataframe of {rows} rows")
+
+    codecs: dict[str, Optional[ArrowQueryCacheCodec]] = {
+        "pickle": None,
+        "arrow": ArrowQueryCacheCodec(),
+        "arrow lz4": ArrowQueryCacheCodec(compression="lz4"),
+        "arrow zstd": ArrowQueryCacheCodec(compression="zstd"),
+    }
+    for label, codec in codecs.items():
+        blob = store(df, codec)
+        assert load(blob, codec).equals(df)
+        store_time = measure(store, (df, codec), repeat)
+        load_time = measure(load, (blob, codec), repeat)
+        print(
+            f"- {label}: {len(blob) / 2**20:.1f} MiB, "
+            f"store {store_time * 1000:.0f} ms, load {load_time * 1000:.0f} ms"
+        )
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
@@ -0,0 +1,82 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Micro-benchmark the CSV formula-injection escaping of a string column.
+
+Compares calling ``escape_value`` on every value with the vectorized
+``escape_values`` used by the CSV and Excel exports.
+"""
+
+import time
+from typing import Any, Callable
+
+import click
+import pandas as pd
+
+from superset.utils.csv import escape_value, escape_values
+
+
+def generate_column(num_rows: int, ratio: float) -> pd.Series:
+    """
+    Generate a string column where ``ratio`` of the values need escaping.
+    """
+    every = max(int(1 / ratio), 1) if ratio else num_rows + 1
+    return pd.Series(
+        [
+            f"=SUM(A{i}:B{i})|x" if i % every == 0 else f"value {i}"
+            for i in range(num_rows)
+        ],
+        dtype=object,
+    )
+
+
+def value_by_value(values: pd.Series) -> pd.Series:
+    return values.map(lambda v: escape_value(v) if isinstance(v, str) else v)
+
+
+def measure(func: Callable[..., Any], args: tuple[Any, ...], repeat: int) -> float:
+    """
+    Return the best wall time in seconds.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+@click.command()
+@click.option("--rows", default=1_000_000, help="Number of values in the column.")
+@click.option("--ratio", default=0.01, help="Fraction of values needing escaping.")
+@click.option("--repeat", default=3, help="Number of timed runs per implementation.")
+def main(rows: int, ratio: float, repeat: int) -> None:
+    values = generate_column(rows, ratio)
+    print(f"Escaping {rows} values, {ratio:.1%} of which need escaping")
+
+    assert value_by_value(values).equals(escape_values(values))
+
+    legacy = measure(value_by_value, (values,), repeat)
+    vectorized = measure(escape_values, (values,), repeat)
+    print(f"- value by value: {legacy:.3f} s")
+    print(f"- vectorized: {vectorized:.3f} s")
+    print(f"Speedup: {legacy / vectorized:.2f}x")
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
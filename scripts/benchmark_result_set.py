@@ -0,0 +1,136 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark the construction of ``SupersetResultSet`` from DBAPI rows.
+
+Compares the columnar path (rows transposed straight into Arrow arrays) with
+the previous implementation, which first built a NumPy structured array of
+objects, on a tall and a wide result set. The full ``SupersetResultSet``
+construction, including the temporal and nested column handling, is reported
+as well.
+"""
+
+import datetime
+import time
+import tracemalloc
+from typing import Any, Callable
+
+import click
+import numpy as np
+import pyarrow as pa
+
+from superset.db_engine_specs.base import BaseEngineSpec
+from superset.result_set import SupersetResultSet
+
+SHAPES = {
+    "tall": (1_000_000, 8),
+    "wide": (20_000, 400),
+}
+
+
+def generate_rows(num_rows: int, num_columns: int) -> list[tuple[Any, ...]]:
+    """
+    Generate rows cycling through integer, float, string and datetime columns.
+    """
+    start = datetime.datetime(2024, 1, 1)
+    generators: list[Callable[[int], Any]] = [
+        lambda i: i,
+        lambda i: i * 0.5,
+        lambda i: f"value {i % 1000}",
+        lambda i: start + datetime.timedelta(minutes=i),
+    ]
+    return [
+        tuple(generators[j % len(generators)](i) for j in range(num_columns))
+        for i in range(num_rows)
+    ]
+
+
+def legacy_arrays(data: list[tuple[Any, ...]], column_names: list[str]) -> pa.Table:
+    """
+    The previous construction path, via a NumPy structured array of objects.
+    """
+    array = np.array(data, dtype=[(name, "object") for name in column_names])
+    return pa.Table.from_arrays(
+        [pa.array(array[name].tolist()) for name in column_names],
+        names=column_names,
+    )
+
+
+def columnar_arrays(data: list[tuple[Any, ...]], column_names: list[str]) -> pa.Table:
+    """
+    The columnar path used by ``SupersetResultSet``.
+    """
+    # pylint: disable=protected-access
+    return pa.Table.from_arrays(
+        SupersetResultSet._arrays_from_rows(data, len(column_names)),
+        names=column_names,
+    )
+
+
+def measure(
+    func: Callable[..., Any], args: tuple[Any, ...], repeat: int
+) -> tuple[float, float]:
+    """
+    Return the best wall time (seconds) and the peak traced memory (MiB).
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    func(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return best, peak / 1024**2
+
+
+@click.command()
+@click.option("--shape", type=click.Choice(list(SHAPES)), multiple=True)
+@click.option("--scale", default=1.0, help="Multiplier applied to the row count.")
+@click.option("--repeat", default=3, help="Number of timed runs per path.")
+def main(shape: tuple[str, ...], scale: float, repeat: int) -> None:
+    for name in shape or SHAPES:
+        num_rows, num_columns = SHAPES[name]
+        num_rows = int(num_rows * scale)
+        print(f"\n{name}: {num_rows} rows x {num_columns} columns")
+
+        data = generate_rows(num_rows, num_columns)
+        description = [(f"col_{i}", None) for i in range(num_columns)]
+        column_names = [column[0] for column in description]
+
+        results = {
+            "legacy": measure(legacy_arrays, (data, column_names), repeat),
+            "columnar": measure(columnar_arrays, (data, column_names), repeat),
+            "result set": measure(
+                SupersetResultSet,
+                (data, description, BaseEngineSpec),
+                repeat,
+            ),
+        }
+        for label, (duration, peak) in results.items():
+            print(f"- {label}: {duration:.2f} s, peak {peak:.1f} MiB")
+
+        speedup = results["legacy"][0] / results["columnar"][0]
+        print(f"Speedup: {speedup:.2f}x")
+
+
+if __name__ == "__main__":
+    # pylint: disable=no-value-for-parameter
+    main()
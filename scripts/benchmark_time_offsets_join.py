@@ -0,0 +1,133 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Benchmark joining time comparison offsets with ``join_offset_dfs``.
+
+Compares generating the temporal join keys row by row, as was done before, with
+the vectorized ``generate_join_keys``, on a weekly time series with many groups.
+"""
+
+import time
+from typing import Any, Callable
+from unittest.mock import patch
+
+import click
+import numpy as np
+import pandas as pd
+
+from superset.constants import TimeGrain
+
+
+def generate_dataframes(
+    num_rows: int, metric: str, offset: str
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """
+    Generate a weekly main dataframe and its offset dataframe, one year earlier.
+    """
+    num_groups = 1000
+    weeks = pd.date_range("2020-01-06", periods=num_rows // num_groups, freq="W-MON")
+    index = pd.MultiIndex.from_product(
+        [weeks, [f"group {i}" for i in range(num_groups)]],
+        names=["ds", "group"],
+    )
+    df = pd.DataFrame({metric: np.arange(len(index))}, index=index).reset_index()
+
+    offset_df = df.rename(columns={metric: f"{metric}__{offset}"})
+    offset_df["ds"] = offset_df["ds"] - pd.DateOffset(years=1)
+    return df, offset_df
+
+
+def legacy_join(processor: Any, *args: Any) -> pd.DataFrame:
+    """
+    Join with the join keys generated row by row.
+    """
+    with patch.object(type(processor), "generate_join_keys", return_value=None):
+        return processor.join_offset_dfs(*args)
+
+
+def vectorized_join(processor: Any, *args: Any) -> pd.DataFrame:
+    return processor.join_offset_dfs(*args)
+
+
+def measure(
+    func: Callable[..., pd.DataFrame], args: tuple[Any, ...], repeat: int
+) -> tuple[float, Any]:
+    """
+    Return the best wall time in seconds, and the last result.
+    """
+    best, result = float("inf"), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+@click.command()
+@click.option("--rows", default=500_000, help="Number of rows of each dataframe.")
+@click.option("--repeat", default=3, help="Number of timed runs per path.")
+def main(rows: int, repeat: int) -> None:
+    # pylint: disable=import-outside-toplevel
+    from superset.common.chart_data import (
+        ChartDataResultFormat,
+        ChartDataResultType,
+    )
+    from superset.common.query_context import QueryContext
+    from superset.common.query_context_processor import QueryContextProcessor
+    from superset.connectors.sqla.models import BaseDatasource
+
+    processor = QueryContextProcessor(
+        QueryContext(
+            datasource=BaseDatasource(),
+            queries=[],
+            result_type=ChartDataResultType.FULL,
+            form_data={},
+            slice_=None,
+            result_format=ChartDataResultFormat.JSON,
+            cache_values={},
+        )
+    )
+    offset = "1 year ago"
+    df, offset_df = generate_dataframes(rows, "sum__num", offset)
+    print(f"Joining {len(df)} rows with an offset of {len(offset_df)} rows")
+
+    results = {}
+    for label, func in (("legacy", legacy_join), ("vectorized", vectorized_join)):
+        results[label] = measure(
+            func,
+            (
+                processor,
+                df.copy(),
+                {offset: offset_df.copy()},
+                TimeGrain.WEEK,
+                ["ds", "group"],
+            ),
+            repeat,
+        )
+        print(f"- {label}: {results[label][0]:.2f} s")
+
+    pd.testing.assert_frame_equal(results["legacy"][1], results["vectorized"][1])
+    print(f"Speedup: {results['legacy'][0] / results['vectorized'][0]:.2f}x")
+
+
+if __name__ == "__main__":
+    from superset.app import create_app
+
+    app = create_app()
+    with app.app_context():
+        # pylint: disable=no-value-for-parameter
+        main()
@@ -93,6 +93,9 @@ class CacheRestApi(BaseSupersetModelRestApi):
             if ds_obj:
                 datasource_uids.add(ds_obj.uid)
 
+        for datasource_uid in datasource_uids:
+            cache_manager.local_data_cache.invalidate(datasource_uid)
+
         cache_key_objs = (
             db.session.query(CacheKey)
             .filter(CacheKey.datasource_uid.in_(datasource_uids))
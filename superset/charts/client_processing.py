@@ -24,6 +24,7 @@ data they would see on Explore.
 In order to do that, we reproduce the post-processing in Python for these chart types.
 """
 
+from collections.abc import Iterator
 from io import StringIO
 from typing import Any, Optional, TYPE_CHECKING, Union
 
@@ -317,6 +318,10 @@ def apply_client_processing(  # noqa: C901
 
         data = query["data"]
 
+        if isinstance(data, Iterator):
+            # CSV data is streamed in chunks, but post-processing needs all of it
+            data = "".join(data)
+
         if isinstance(data, str):
             data = data.strip()
 
@@ -18,19 +18,32 @@ from __future__ import annotations
 
 import contextlib
 import logging
-from typing import Any, TYPE_CHECKING
-
-from flask import current_app, g, make_response, request, Response
+from collections.abc import Iterator
+from datetime import timedelta
+from functools import wraps
+from typing import Any, Callable, TYPE_CHECKING
+
+from flask import (
+    current_app,
+    g,
+    make_response,
+    request,
+    Response,
+    stream_with_context,
+)
 from flask_appbuilder.api import expose, protect
 from flask_babel import gettext as _
 from marshmallow import ValidationError
 
-from superset import is_feature_enabled, security_manager
+from superset import db, is_feature_enabled, security_manager
 from superset.async_events.async_query_manager import AsyncQueryTokenException
 from superset.charts.api import ChartRestApi
 from superset.charts.client_processing import apply_client_processing
 from superset.charts.data.query_context_cache_loader import QueryContextCacheLoader
-from superset.charts.schemas import ChartDataQueryContextSchema
+from superset.charts.schemas import (
+    ChartDataBatchQueryContextSchema,
+    ChartDataQueryContextSchema,
+)
 from superset.commands.chart.data.create_async_job_command import (
     CreateAsyncChartDataJobCommand,
 )
@@ -40,18 +53,21 @@ from superset.commands.chart.exceptions import (
     ChartDataQueryFailedError,
 )
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.common.query_context_processor import share_df_payloads
 from superset.connectors.sqla.models import BaseDatasource
 from superset.daos.exceptions import DatasourceNotFound
-from superset.exceptions import QueryObjectValidationError
+from superset.exceptions import QueryObjectValidationError, SupersetException
 from superset.extensions import event_logger
 from superset.models.sql_lab import Query
 from superset.utils import json
 from superset.utils.core import (
     create_zip,
     DatasourceType,
+    error_msg_from_exception,
     get_user_id,
 )
 from superset.utils.decorators import logs_context
+from superset.utils.tracing import get_server_timing, span, start_trace
 from superset.views.base import CsvResponse, generate_download_headers, XlsxResponse
 from superset.views.base_api import statsd_metrics
 
@@ -61,8 +77,37 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def trace_chart_data(f: Callable[..., Response]) -> Callable[..., Response]:
+    """
+    Trace where a chart data request spends its time when `CHART_DATA_TRACING` is
+    enabled, logging the spans as a `chart_data_trace` event and, if
+    `CHART_DATA_SERVER_TIMING` is enabled, returning their durations in the
+    Server-Timing header of the response.
+    """
+
+    @wraps(f)
+    def wrapper(*args: Any, **kwargs: Any) -> Response:
+        if not current_app.config["CHART_DATA_TRACING"]:
+            return f(*args, **kwargs)
+
+        with start_trace("total") as trace:
+            response = f(*args, **kwargs)
+
+        event_logger.log_with_context(
+            action="chart_data_trace",
+            duration=timedelta(milliseconds=trace.duration_ms),
+            log_to_statsd=False,
+            trace=trace.to_dict(),
+        )
+        if current_app.config["CHART_DATA_SERVER_TIMING"]:
+            response.headers["Server-Timing"] = get_server_timing(trace)
+        return response
+
+    return wrapper
+
+
 class ChartDataRestApi(ChartRestApi):
-    include_route_methods = {"get_data", "data", "data_from_cache"}
+    include_route_methods = {"get_data", "data", "data_batch", "data_from_cache"}
 
     @expose("/<int:pk>/data/", methods=("GET",))
     @protect()
@@ -71,6 +116,7 @@ class ChartDataRestApi(ChartRestApi):
         action=lambda self, *args, **kwargs: f"{self.__class__.__name__}.data",
         log_to_statsd=False,
     )
+    @trace_chart_data
     def get_data(self, pk: int) -> Response:
         """
         Take a chart ID and uses the query context stored when the chart was saved
@@ -184,6 +230,7 @@ class ChartDataRestApi(ChartRestApi):
         action=lambda self, *args, **kwargs: f"{self.__class__.__name__}.data",
         log_to_statsd=False,
     )
+    @trace_chart_data
     def data(self) -> Response:
         """
         Take a query context constructed in the client and return payload
@@ -261,6 +308,102 @@ class ChartDataRestApi(ChartRestApi):
             command, form_data=form_data, datasource=query_context.datasource
         )
 
+    @expose("/data/batch", methods=("POST",))
+    @protect()
+    @statsd_metrics
+    @event_logger.log_this_with_context(
+        action=lambda self, *args, **kwargs: f"{self.__class__.__name__}.data_batch",
+        log_to_statsd=False,
+    )
+    def data_batch(self) -> Response:
+        """
+        Take the query contexts of many charts, e.g. all the charts of a dashboard,
+        and stream the payload data response of each
+        ---
+        post:
+          summary: Return payload data responses for many query contexts
+          description: >-
+            Takes the query contexts of many charts and streams the payload data
+            response of each as a line of newline delimited JSON, in the order of
+            the request. Datasources and row level security filters are only looked
+            up once, and identical queries of different charts only run once.
+          requestBody:
+            required: true
+            content:
+              application/json:
+                schema:
+                  $ref: "#/components/schemas/ChartDataBatchQueryContextSchema"
+          responses:
+            200:
+              description: Query results
+              content:
+                application/x-ndjson:
+                  schema:
+                    $ref: "#/components/schemas/ChartDataBatchResponseSchema"
+            400:
+              $ref: '#/components/responses/400'
+            401:
+              $ref: '#/components/responses/401'
+            500:
+              $ref: '#/components/responses/500'
+        """
+        if not request.is_json:
+            return self.response_400(message=_("Request is not JSON"))
+        try:
+            query_contexts = ChartDataBatchQueryContextSchema().load(
+                request.json or {}
+            )["query_contexts"]
+        except ValidationError as error:
+            return self.response_400(
+                message=_(
+                    "Request is incorrect: %(error)s", error=error.normalized_messages()
+                )
+            )
+
+        max_query_contexts = current_app.config["CHART_DATA_BATCH_MAX_QUERY_CONTEXTS"]
+        if len(query_contexts) > max_query_contexts:
+            return self.response_400(
+                message=_(
+                    "A batch request can have at most %(max)s query contexts",
+                    max=max_query_contexts,
+                )
+            )
+
+        def generate() -> Iterator[str]:
+            # pylint: disable=import-outside-toplevel
+            from superset.common.query_context_factory import QueryContextFactory
+
+            schema = ChartDataQueryContextSchema()
+            schema.query_context_factory = QueryContextFactory(share_datasources=True)
+            with security_manager.share_rls_filters(), share_df_payloads():
+                for index, json_body in enumerate(query_contexts):
+                    # an error must not cut the response of the other query contexts
+                    try:
+                        status, response = self._get_batch_data_response(
+                            schema, json_body
+                        )
+                        line = json.dumps(
+                            {"index": index, "status": status, **response},
+                            default=json.json_int_dttm_ser,
+                            ignore_nan=True,
+                        )
+                    except Exception as ex:  # pylint: disable=broad-except
+                        logger.exception(ex)
+                        db.session.rollback()
+                        line = json.dumps(
+                            {
+                                "index": index,
+                                "status": 500,
+                                "message": error_msg_from_exception(ex),
+                            }
+                        )
+                    yield line + "\n"
+
+        return Response(
+            stream_with_context(generate()),
+            mimetype="application/x-ndjson",
+        )
+
     @expose("/data/<cache_key>", methods=("GET",))
     @protect()
     @statsd_metrics
@@ -269,6 +412,7 @@ class ChartDataRestApi(ChartRestApi):
         f".data_from_cache",
         log_to_statsd=False,
     )
+    @trace_chart_data
     def data_from_cache(self, cache_key: str) -> Response:
         """
         Take a query context cache key and return payload
@@ -343,6 +487,83 @@ class ChartDataRestApi(ChartRestApi):
         result = async_command.run(form_data, get_user_id())
         return self.response(202, **result)
 
+    def _get_batch_data_response(
+        self,
+        schema: ChartDataQueryContextSchema,
+        json_body: dict[str, Any],
+    ) -> tuple[int, dict[str, Any]]:
+        """
+        Get the status and the payload data response of a query context of a batch
+        request, as the chart data endpoint would return them.
+        """
+        try:
+            query_context = self._create_query_context_from_form(json_body, schema)
+            command = ChartDataCommand(query_context)
+            command.validate()
+        except DatasourceNotFound:
+            return 404, {"message": _("Not found")}
+        except ValidationError as error:
+            return 400, {
+                "message": _(
+                    "Request is incorrect: %(error)s", error=error.normalized_messages()
+                )
+            }
+        except SupersetException as ex:
+            return ex.status, {"message": ex.message}
+
+        if query_context.result_format != ChartDataResultFormat.JSON:
+            return 400, {
+                "message": _(
+                    "Unsupported result_format: %(result_format)s",
+                    result_format=query_context.result_format,
+                )
+            }
+
+        if (
+            is_feature_enabled("GLOBAL_ASYNC_QUERIES")
+            and query_context.result_type == ChartDataResultType.FULL
+        ):
+            return self._run_batch_async(json_body, command)
+
+        try:
+            result = command.run()
+        except ChartDataCacheLoadError as exc:
+            return 422, {"message": exc.message}
+        except ChartDataQueryFailedError as exc:
+            return 400, {"message": exc.message}
+
+        if query_context.result_type == ChartDataResultType.POST_PROCESSED:
+            result = apply_client_processing(
+                result, json_body.get("form_data"), query_context.datasource
+            )
+        return 200, {"result": self._get_json_queries(result)}
+
+    def _run_batch_async(
+        self, json_body: dict[str, Any], command: ChartDataCommand
+    ) -> tuple[int, dict[str, Any]]:
+        """
+        Execute the command of a query context of a batch request as an async query.
+        """
+        with contextlib.suppress(ChartDataCacheLoadError):
+            result = command.run(force_cached=True)
+            if result is not None:
+                return 200, {"result": self._get_json_queries(result)}
+
+        async_command = CreateAsyncChartDataJobCommand()
+        try:
+            async_command.validate(request)
+        except AsyncQueryTokenException:
+            return 401, {"message": _("Not authorized")}
+        return 202, async_command.run(json_body, get_user_id())
+
+    def _get_json_queries(self, result: dict[Any, Any]) -> list[dict[str, Any]]:
+        queries = result["queries"]
+        if security_manager.is_guest_user():
+            for query in queries:
+                with contextlib.suppress(KeyError):
+                    del query["query"]
+        return queries
+
     def _send_chart_response(  # noqa: C901
         self,
         result: dict[Any, Any],
@@ -380,6 +601,8 @@ class ChartDataRestApi(ChartRestApi):
             def _process_data(query_data: Any) -> Any:
                 if result_format == ChartDataResultFormat.CSV:
                     encoding = current_app.config["CSV_EXPORT"].get("encoding", "utf-8")
+                    if not isinstance(query_data, str):
+                        query_data = "".join(query_data)
                     return query_data.encode(encoding)
                 return query_data
 
@@ -394,12 +617,11 @@ class ChartDataRestApi(ChartRestApi):
             )
 
         if result_format == ChartDataResultFormat.JSON:
-            queries = result["queries"]
-            if security_manager.is_guest_user():
-                for query in queries:
-                    with contextlib.suppress(KeyError):
-                        del query["query"]
-            with event_logger.log_context(f"{self.__class__.__name__}.json_dumps"):
+            queries = self._get_json_queries(result)
+            with (
+                span("serialization"),
+                event_logger.log_context(f"{self.__class__.__name__}.json_dumps"),
+            ):
                 response_data = json.dumps(
                     {"result": queries},
                     default=json.json_int_dttm_ser,
@@ -449,17 +671,20 @@ class ChartDataRestApi(ChartRestApi):
 
     @logs_context(context_func=_map_form_data_datasource_to_dataset_id)
     def _create_query_context_from_form(
-        self, form_data: dict[str, Any]
+        self,
+        form_data: dict[str, Any],
+        schema: ChartDataQueryContextSchema | None = None,
     ) -> QueryContext:
         """
         Create the query context from the form data.
 
         :param form_data: The chart form data
+        :param schema: The schema loading the query context, if not a new one
         :returns: The query context
         :raises ValidationError: If the request is incorrect
         """
 
         try:
-            return ChartDataQueryContextSchema().load(form_data)
+            return (schema or ChartDataQueryContextSchema()).load(form_data)
         except KeyError as ex:
             raise ValidationError("Request is incorrect") from ex
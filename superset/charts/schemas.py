@@ -1435,6 +1435,13 @@ class ChartDataResponseResult(Schema):
         required=True,
         allow_none=None,
     )
+    is_stale = fields.Boolean(
+        metadata={
+            "description": "Is the cached result past its cache timeout, and being "
+            "refreshed in the background"
+        },
+        allow_none=True,
+    )
     query = fields.String(
         metadata={"description": "The executed query statement"},
         required=True,
@@ -1499,6 +1506,45 @@ class ChartDataResponseSchema(Schema):
     )
 
 
+class ChartDataBatchQueryContextSchema(Schema):
+    query_contexts = fields.List(
+        fields.Dict(),
+        required=True,
+        validate=Length(min=1),
+        metadata={
+            "description": "The query contexts of the charts, each following "
+            "the ChartDataQueryContextSchema."
+        },
+    )
+
+
+class ChartDataBatchResponseSchema(Schema):
+    index = fields.Integer(
+        metadata={
+            "description": "The position of the query context in the request. "
+            "Results are streamed as newline delimited JSON, one line per query "
+            "context."
+        },
+    )
+    status = fields.Integer(
+        metadata={
+            "description": "The HTTP status code the chart data endpoint would return "
+            "for the query context. With a 202 status, the line holds the async job "
+            "details instead of the result."
+        },
+    )
+    result = fields.List(
+        fields.Nested(ChartDataResponseResult),
+        metadata={
+            "description": "A list of results for each corresponding query in the "
+            "query context."
+        },
+    )
+    message = fields.String(
+        metadata={"description": "The error message, for unsuccessful statuses"},
+    )
+
+
 class ChartDataAsyncResponseSchema(Schema):
     channel_id = fields.String(
         metadata={"description": "Unique session async channel ID"},
@@ -1593,6 +1639,8 @@ CHART_SCHEMAS = (
     ChartCacheWarmUpResponseSchema,
     ChartDataQueryContextSchema,
     ChartDataResponseSchema,
+    ChartDataBatchQueryContextSchema,
+    ChartDataBatchResponseSchema,
     ChartDataAsyncResponseSchema,
     # TODO: These should optimally be included in the QueryContext schema as an `anyOf`
     #  in ChartDataPostProcessingOperation.options, but since `anyOf` is not
@@ -16,11 +16,19 @@
 # under the License.
 import logging
 from abc import abstractmethod
+from collections.abc import Iterable, Iterator
 from functools import partial
-from typing import Any, Optional, TypedDict
+from typing import Any, Callable, Optional, TypedDict
 
 import pandas as pd
 from flask_babel import lazy_gettext as _
+from pandas.api.types import (
+    is_bool,
+    is_bool_dtype,
+    is_float_dtype,
+    is_integer_dtype,
+    is_object_dtype,
+)
 from werkzeug.datastructures import FileStorage
 
 from superset import db
@@ -60,6 +68,60 @@ class FileMetadata(TypedDict, total=False):
     items: list[FileMetadataItem]
 
 
+def lock_dtypes(df: pd.DataFrame, dtypes: pd.Series) -> pd.DataFrame:
+    """
+    Conform a chunk of a file to the columns and types of its first chunk, which the
+    table it's uploaded to is created from.
+
+    :param df: The chunk
+    :param dtypes: The types of the columns of the first chunk
+    :throws DatabaseUploadFailed: if the chunk doesn't match the first chunk
+    """
+    if extra_columns := [column for column in df.columns if column not in dtypes]:
+        raise DatabaseUploadFailed(
+            message=_(
+                "Columns %(columns)s are missing from the first rows of the file",
+                columns=", ".join(map(str, extra_columns)),
+            )
+        )
+    df = df.reindex(columns=dtypes.index)
+
+    for column, dtype in dtypes.items():
+        series = df[column]
+        if series.dtype == dtype:
+            continue
+        if is_object_dtype(dtype):
+            df[column] = series.astype(object).where(series.isna(), series.astype(str))
+            continue
+        try:
+            if is_integer_dtype(dtype) and is_float_dtype(series.dtype):
+                # integers with missing values are read as floats, and inserted as
+                # integers and NULLs, while fractional values would be truncated
+                if not (series.dropna() % 1 == 0).all():
+                    raise ValueError("Cannot cast fractional values to integers")
+                continue
+            if is_bool_dtype(dtype) and series.isna().any():
+                # booleans with missing values are read as objects, or floats when
+                # they're all missing, and inserted as booleans and NULLs
+                if not series.dropna().map(lambda value: is_bool(value)).all():
+                    raise ValueError("Cannot cast non boolean values to booleans")
+                df[column] = series.astype(object).where(series.notna(), None)
+                continue
+            df[column] = series.astype(dtype)
+        except (TypeError, ValueError) as ex:
+            raise DatabaseUploadFailed(
+                message=_(
+                    "Column %(column)s has values not matching the type %(type)s "
+                    "inferred from the first rows of the file, set its type "
+                    "explicitly: %(error)s",
+                    column=column,
+                    type=dtype,
+                    error=str(ex),
+                )
+            ) from ex
+    return df
+
+
 class BaseDataReader:
     """
     Base class for reading data from a file and uploading it to a database
@@ -73,6 +135,16 @@ class BaseDataReader:
     @abstractmethod
     def file_to_dataframe(self, file: FileStorage) -> pd.DataFrame: ...
 
+    def file_to_dataframes(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read a file into chunks of `UPLOAD_ROWS_PER_CHUNK` rows, so that it's
+        uploaded without being read into memory at once, when its format allows it.
+
+        :return: the DataFrames of the chunks
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        yield self.file_to_dataframe(file)
+
     @abstractmethod
     def file_metadata(self, file: FileStorage) -> FileMetadata: ...
 
@@ -82,24 +154,52 @@ class BaseDataReader:
         database: Database,
         table_name: str,
         schema_name: Optional[str],
+        progress: Optional[Callable[[int], None]] = None,
     ) -> None:
-        self._dataframe_to_database(
-            self.file_to_dataframe(file), database, table_name, schema_name
+        """
+        Upload a file to a database, chunk by chunk.
+
+        :param progress: Called with the number of rows uploaded after each chunk
+        """
+        self._dataframes_to_database(
+            self.file_to_dataframes(file),
+            database,
+            table_name,
+            schema_name,
+            progress,
         )
 
-    def _dataframe_to_database(
+    def _dataframes_to_database(
         self,
-        df: pd.DataFrame,
+        dfs: Iterable[pd.DataFrame],
         database: Database,
         table_name: str,
         schema_name: Optional[str],
+        progress: Optional[Callable[[int], None]] = None,
     ) -> None:
         """
-        Upload DataFrame to database
+        Upload the chunks of a file to a database, creating the table from the first
+        chunk and appending the others to it, all in a single transaction where the
+        engine allows it
 
-        :param df:
-        :throws DatabaseUploadFailed: if there is an error uploading the DataFrame
+        :param dfs: The chunks of the file
+        :param progress: Called with the number of rows uploaded after each chunk
+        :throws DatabaseUploadFailed: if there is an error uploading the DataFrames
         """
+
+        def get_chunks() -> Iterator[pd.DataFrame]:
+            dtypes = None
+            rows = 0
+            for df in dfs:
+                if dtypes is None:
+                    dtypes = df.dtypes
+                else:
+                    df = lock_dtypes(df, dtypes)
+                yield df
+                rows += len(df)
+                if progress:
+                    progress(rows)
+
         try:
             data_table = Table(table=table_name, schema=schema_name)
             to_sql_kwargs = {
@@ -111,12 +211,14 @@ class BaseDataReader:
                 "dataframe_index"
             ):
                 to_sql_kwargs["index_label"] = self._options.get("index_label")
-            database.db_engine_spec.df_to_sql(
+            database.db_engine_spec.dfs_to_sql(
                 database,
                 data_table,
-                df,
+                get_chunks(),
                 to_sql_kwargs=to_sql_kwargs,
             )
+        except DatabaseUploadFailed:
+            raise
         except ValueError as ex:
             raise DatabaseUploadFailed(
                 message=_(
@@ -151,7 +253,13 @@ class UploadCommand(BaseCommand):
         if not self._model:
             return
 
-        self._reader.read(self._file, self._model, self._table_name, self._schema)
+        self._reader.read(
+            self._file,
+            self._model,
+            self._table_name,
+            self._schema,
+            progress=self._log_progress,
+        )
 
         sqla_table = (
             db.session.query(SqlaTable)
@@ -174,6 +282,14 @@ class UploadCommand(BaseCommand):
 
         sqla_table.fetch_metadata()
 
+    def _log_progress(self, rows: int) -> None:
+        logger.info(
+            "Uploaded %d rows to table %s of database %s",
+            rows,
+            Table(table=self._table_name, schema=self._schema),
+            self._model_id,
+        )
+
     def validate(self) -> None:
         self._model = DatabaseDAO.find_by_id(self._model_id)
         if not self._model:
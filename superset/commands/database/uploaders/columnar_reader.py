@@ -15,7 +15,7 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
-from collections.abc import Generator
+from collections.abc import Generator, Iterator
 from io import BytesIO
 from pathlib import Path
 from typing import Any, IO, Optional
@@ -23,6 +23,7 @@ from zipfile import BadZipfile, is_zipfile, ZipFile
 
 import pandas as pd
 import pyarrow.parquet as pq
+from flask import current_app
 from flask_babel import lazy_gettext as _
 from pyarrow.lib import ArrowException
 from werkzeug.datastructures import FileStorage
@@ -114,6 +115,41 @@ class ColumnarReader(BaseDataReader):
             self._read_buffer_to_dataframe(buffer) for buffer in self._yield_files(file)
         )
 
+    def file_to_dataframes(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read Columnar file into DataFrames of up to `UPLOAD_ROWS_PER_CHUNK` rows, read
+        from the row groups of each file
+
+        :return: the DataFrames of the chunks
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        empty_df: Optional[pd.DataFrame] = None
+        yielded = False
+        for buffer in self._yield_files(file):
+            try:
+                parquet_file = pq.ParquetFile(buffer)
+                columns = self._options.get("columns_read") or None
+                batches = parquet_file.iter_batches(
+                    batch_size=current_app.config["UPLOAD_ROWS_PER_CHUNK"],
+                    columns=columns,
+                )
+                for batch in batches:
+                    yielded = True
+                    yield batch.to_pandas()
+                if empty_df is None:
+                    schema = parquet_file.schema_arrow
+                    empty_df = (
+                        schema.empty_table().select(columns or schema.names).to_pandas()
+                    )
+            except (ArrowException, ValueError, KeyError) as ex:
+                raise DatabaseUploadFailed(
+                    message=_("Parsing error: %(error)s", error=str(ex))
+                ) from ex
+
+        # files without rows still create the table, from their schema
+        if not yielded and empty_df is not None:
+            yield empty_df
+
     def file_metadata(self, file: FileStorage) -> FileMetadata:
         column_names = set()
         try:
@@ -15,9 +15,12 @@
 # specific language governing permissions and limitations
 # under the License.
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any, Optional
 
 import pandas as pd
+from flask import current_app
 from flask_babel import lazy_gettext as _
 from werkzeug.datastructures import FileStorage
 
@@ -61,19 +64,10 @@ class CSVReader(BaseDataReader):
         )
 
     @staticmethod
-    def _read_csv(file: FileStorage, kwargs: dict[str, Any]) -> pd.DataFrame:
+    @contextmanager
+    def _handle_read_errors() -> Iterator[None]:
         try:
-            if "chunksize" in kwargs:
-                return pd.concat(
-                    pd.read_csv(
-                        filepath_or_buffer=file.stream,
-                        **kwargs,
-                    )
-                )
-            return pd.read_csv(
-                filepath_or_buffer=file.stream,
-                **kwargs,
-            )
+            yield
         except (
             pd.errors.ParserError,
             pd.errors.EmptyDataError,
@@ -86,6 +80,21 @@ class CSVReader(BaseDataReader):
         except Exception as ex:
             raise DatabaseUploadFailed(_("Error reading CSV file")) from ex
 
+    @staticmethod
+    def _read_csv(file: FileStorage, kwargs: dict[str, Any]) -> pd.DataFrame:
+        with CSVReader._handle_read_errors():
+            if "chunksize" in kwargs:
+                return pd.concat(
+                    pd.read_csv(
+                        filepath_or_buffer=file.stream,
+                        **kwargs,
+                    )
+                )
+            return pd.read_csv(
+                filepath_or_buffer=file.stream,
+                **kwargs,
+            )
+
     def file_to_dataframe(self, file: FileStorage) -> pd.DataFrame:
         """
         Read CSV file into a DataFrame
@@ -93,8 +102,23 @@ class CSVReader(BaseDataReader):
         :return: pandas DataFrame
         :throws DatabaseUploadFailed: if there is an error reading the file
         """
-        kwargs = {
-            "chunksize": READ_CSV_CHUNK_SIZE,
+        return self._read_csv(file, self._get_read_kwargs(READ_CSV_CHUNK_SIZE))
+
+    def file_to_dataframes(self, file: FileStorage) -> Iterator[pd.DataFrame]:
+        """
+        Read CSV file into DataFrames of `UPLOAD_ROWS_PER_CHUNK` rows
+
+        :return: the DataFrames of the chunks
+        :throws DatabaseUploadFailed: if there is an error reading the file
+        """
+        kwargs = self._get_read_kwargs(current_app.config["UPLOAD_ROWS_PER_CHUNK"])
+        with self._handle_read_errors():
+            with pd.read_csv(filepath_or_buffer=file.stream, **kwargs) as reader:
+                yield from reader
+
+    def _get_read_kwargs(self, chunksize: int) -> dict[str, Any]:
+        return {
+            "chunksize": chunksize,
             "encoding": "utf-8",
             "header": self._options.get("header_row", 0),
             "decimal": self._options.get("decimal_character", "."),
@@ -118,7 +142,6 @@ class CSVReader(BaseDataReader):
             if self._options.get("column_data_types")
             else None,
         }
-        return self._read_csv(file, kwargs)
 
     def file_metadata(self, file: FileStorage) -> FileMetadata:
         """
@@ -17,7 +17,8 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, cast, TypedDict
+from collections.abc import Iterator
+from typing import cast, TypedDict
 
 import pandas as pd
 from flask_babel import gettext as __
@@ -40,7 +41,7 @@ logger = logging.getLogger(__name__)
 class SqlExportResult(TypedDict):
     query: Query
     count: int
-    data: list[Any]
+    data: Iterator[str]
 
 
 class SqlResultExportCommand(BaseCommand):
@@ -132,7 +133,12 @@ class SqlResultExportCommand(BaseCommand):
                 self._query.schema,
             )[:limit]
 
-        csv_data = csv.df_to_escaped_csv(df, index=False, **config["CSV_EXPORT"])
+        csv_data = csv.df_to_escaped_csv_chunks(
+            df,
+            chunk_size=config["CSV_EXPORT_CHUNK_SIZE"],
+            index=False,
+            **config["CSV_EXPORT"],
+        )
 
         return {
             "query": self._query,
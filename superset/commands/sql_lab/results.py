@@ -41,6 +41,7 @@ logger = logging.getLogger(__name__)
 class SqlExecutionResultsCommand(BaseCommand):
     _key: str
     _rows: int | None
+    _chunk: int | None
     _blob: Any
     _query: Query
 
@@ -48,9 +49,11 @@ class SqlExecutionResultsCommand(BaseCommand):
         self,
         key: str,
         rows: int | None = None,
+        chunk: int | None = None,
     ) -> None:
         self._key = key
         self._rows = rows
+        self._chunk = chunk
 
     def validate(self) -> None:
         if not results_backend:
@@ -108,7 +111,11 @@ class SqlExecutionResultsCommand(BaseCommand):
         )
         try:
             obj = _deserialize_results_payload(
-                payload, self._query, cast(bool, results_backend_use_msgpack)
+                payload,
+                self._query,
+                cast(bool, results_backend_use_msgpack),
+                chunk=self._chunk,
+                rows=self._rows,
             )
         except SerializationError as ex:
             raise SupersetErrorException(
@@ -34,15 +34,40 @@ if TYPE_CHECKING:
 config = app.config
 
 
-def create_query_object_factory() -> QueryObjectFactory:
-    return QueryObjectFactory(config, DatasourceDAO())
+def create_query_object_factory(
+    datasources: dict[tuple[str, int], BaseDatasource] | None = None,
+) -> QueryObjectFactory:
+    return QueryObjectFactory(config, DatasourceDAO(), datasources)
 
 
 class QueryContextFactory:  # pylint: disable=too-few-public-methods
     _query_object_factory: QueryObjectFactory
-
-    def __init__(self) -> None:
-        self._query_object_factory = create_query_object_factory()
+    _datasources: dict[tuple[str, int], BaseDatasource] | None
+    _slices: dict[str, Slice | None] | None
+
+    def __init__(self, share_datasources: bool = False) -> None:
+        """
+        :param share_datasources: Look up each datasource and chart only once for all
+            the query contexts, and query objects, created by this factory, e.g. the
+            charts of a batch request or of a dashboard
+        """
+        self._datasources = {} if share_datasources else None
+        self._slices = {} if share_datasources else None
+        self._query_object_factory = create_query_object_factory(self._datasources)
+
+    def add_datasource(self, datasource: BaseDatasource) -> None:
+        """
+        Share an already loaded datasource with the query contexts of the factory.
+        """
+        if self._datasources is not None:
+            self._datasources[(datasource.type, datasource.id)] = datasource
+
+    def add_slice(self, slice_: Slice) -> None:
+        """
+        Share an already loaded chart with the query contexts of the factory.
+        """
+        if self._slices is not None:
+            self._slices[str(slice_.id)] = slice_
 
     def create(  # pylint: disable=too-many-arguments
         self,
@@ -94,13 +119,26 @@ class QueryContextFactory:  # pylint: disable=too-few-public-methods
         )
 
     def _convert_to_model(self, datasource: DatasourceDict) -> BaseDatasource:
-        return DatasourceDAO.get_datasource(
+        key = (datasource["type"], int(datasource["id"]))
+        if self._datasources is not None and key in self._datasources:
+            return self._datasources[key]
+
+        model = DatasourceDAO.get_datasource(
             datasource_type=DatasourceType(datasource["type"]),
-            datasource_id=int(datasource["id"]),
+            datasource_id=key[1],
         )
+        if self._datasources is not None:
+            self._datasources[key] = model
+        return model
 
     def _get_slice(self, slice_id: Any) -> Slice | None:
-        return ChartDAO.find_by_id(slice_id)
+        if self._slices is None:
+            return ChartDAO.find_by_id(slice_id)
+
+        key = str(slice_id)
+        if key not in self._slices:
+            self._slices[key] = ChartDAO.find_by_id(slice_id)
+        return self._slices[key]
 
     def _process_query_object(
         self,
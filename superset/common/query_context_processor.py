@@ -19,15 +19,21 @@ from __future__ import annotations
 import copy
 import logging
 import re
-from datetime import datetime
+import time
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timedelta
 from typing import Any, cast, ClassVar, TYPE_CHECKING, TypedDict
 
 import numpy as np
 import pandas as pd
+import sqlalchemy as sa
+from flask import g, has_app_context
 from flask_babel import gettext as _
 from pandas import DateOffset
 
-from superset import app
+from superset import app, db
 from superset.common.chart_data import ChartDataResultFormat
 from superset.common.db_query_status import QueryStatus
 from superset.common.query_actions import get_query_results
@@ -41,7 +47,13 @@ from superset.connectors.sqla.models import BaseDatasource
 from superset.constants import CacheRegion, TimeGrain
 from superset.daos.annotation_layer import AnnotationLayerDAO
 from superset.daos.chart import ChartDAO
+from superset.distributed_lock import (
+    acquire_cache_lock,
+    CacheDistributedLock,
+    release_cache_lock,
+)
 from superset.exceptions import (
+    CreateKeyValueDistributedLockFailedException,
     InvalidPostProcessingError,
     QueryObjectValidationError,
     SupersetException,
@@ -51,6 +63,7 @@ from superset.models.helpers import QueryResult
 from superset.models.sql_lab import Query
 from superset.utils import csv, excel
 from superset.utils.cache import generate_cache_key, set_and_log_cache
+from superset.utils.concurrency import get_database_semaphore, run_in_app_context
 from superset.utils.core import (
     DatasourceType,
     DateColumn,
@@ -62,12 +75,14 @@ from superset.utils.core import (
     get_column_names_from_columns,
     get_column_names_from_metrics,
     get_metric_names,
+    get_user_id,
     get_x_axis_label,
     normalize_dttm_col,
     TIME_COMPARISON,
 )
 from superset.utils.date_parser import get_past_or_future, normalize_time_delta
 from superset.utils.pandas_postprocessing.utils import unescape_separator
+from superset.utils.tracing import span, traced
 from superset.views.utils import get_viz
 from superset.viz import viz_types
 
@@ -80,6 +95,15 @@ config = app.config
 stats_logger: BaseStatsLogger = config["STATS_LOGGER"]
 logger = logging.getLogger(__name__)
 
+# Namespace of the distributed locks coalescing identical chart data queries
+QUERY_COALESCING_LOCK_NAMESPACE = "chart_data_query"
+
+# Seconds between two cache probes while waiting for a coalesced query result
+QUERY_COALESCING_POLL_INTERVAL = 0.5
+
+# Namespace of the distributed locks deduplicating refreshes of stale query results
+REVALIDATION_LOCK_NAMESPACE = "chart_data_revalidation"
+
 # Offset join column suffix used for joining offset results
 OFFSET_JOIN_COLUMN_SUFFIX = "__offset_join_column_"
 
@@ -101,6 +125,19 @@ AGGREGATED_JOIN_GRAINS = {
 # Right suffix used for joining offset results
 R_SUFFIX = "__right_suffix"
 
+# Pandas period aliases of the time grains supported when fetching all the time
+# offsets in a single scan. Week boundaries depend on the database, so weeks and
+# the grains not matching a pandas period are left out.
+SINGLE_SCAN_TIME_GRAINS: dict[str, str] = {
+    TimeGrain.SECOND: "S",
+    TimeGrain.MINUTE: "T",
+    TimeGrain.HOUR: "H",
+    TimeGrain.DAY: "D",
+    TimeGrain.MONTH: "M",
+    TimeGrain.QUARTER: "Q",
+    TimeGrain.YEAR: "Y",
+}
+
 
 class CachedTimeOffset(TypedDict):
     df: pd.DataFrame
@@ -108,6 +145,94 @@ class CachedTimeOffset(TypedDict):
     cache_keys: list[str | None]
 
 
+def merge_time_ranges(
+    time_ranges: list[tuple[datetime, datetime]],
+) -> list[tuple[datetime, datetime]]:
+    """
+    Merge overlapping time ranges.
+
+    :param time_ranges: The time ranges, as (start, end) tuples.
+    :returns: The sorted, non overlapping time ranges.
+    """
+    merged: list[tuple[datetime, datetime]] = []
+    for start, end in sorted(time_ranges):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+    return merged
+
+
+def get_single_scan_time_ranges(
+    query_objects: list[QueryObject],
+    index: str,
+    time_grain: str | None,
+) -> list[tuple[datetime, datetime]] | None:
+    """
+    Get the time ranges of the time offset query objects, if a single query spanning
+    all of them returns the same rows as the separate queries, and the rows of each
+    can be sliced out of it on the time index.
+
+    That is the case when the time ranges filter on the time index, when every time
+    grain bucket is either entirely in a time range or not at all, and when the
+    spanned range is at most `TIME_OFFSET_SINGLE_SCAN_MAX_SPAN_RATIO` times the length
+    covered by the ranges.
+
+    :param query_objects: The query objects of the offsets.
+    :param index: The label of the time index.
+    :param time_grain: The time grain of the time index.
+    :returns: The (start, end) time range of each query object, or None.
+    """
+    time_ranges: list[tuple[datetime, datetime]] = []
+    for query_object in query_objects:
+        if (
+            query_object.time_shift
+            or query_object.granularity != index
+            or not (query_object.from_dttm and query_object.to_dttm)
+        ):
+            return None
+        time_ranges.append((query_object.from_dttm, query_object.to_dttm))
+
+    if time_grain is not None:
+        freq = SINGLE_SCAN_TIME_GRAINS.get(time_grain)
+        if freq is None or any(
+            pd.Timestamp(dttm).to_period(freq).start_time != dttm
+            for time_range in time_ranges
+            for dttm in time_range
+        ):
+            return None
+
+    merged_time_ranges = merge_time_ranges(time_ranges)
+    covered = sum((end - start for start, end in merged_time_ranges), timedelta())
+    spanned = merged_time_ranges[-1][1] - merged_time_ranges[0][0]
+    if spanned > config["TIME_OFFSET_SINGLE_SCAN_MAX_SPAN_RATIO"] * covered:
+        return None
+
+    return time_ranges
+
+
+@contextmanager
+def share_df_payloads() -> Iterator[None]:
+    """
+    Share the df payloads of the query objects processed within the block, so that
+    identical query objects, i.e. with the same cache key, are only loaded once.
+
+    This is used to dedupe the queries of the charts of a batch request.
+    """
+    g.shared_df_payloads = {}
+    try:
+        yield
+    finally:
+        g.pop("shared_df_payloads", None)
+
+
+def copy_df_payload(payload: dict[str, Any]) -> dict[str, Any]:
+    """
+    Copy a shared df payload, as the result type handlers modify it in place.
+    """
+    return {**payload, "df": payload["df"].copy()}
+
+
 class QueryContextProcessor:
     """
     The query context contains the query object and additional fields necessary
@@ -129,13 +254,25 @@ class QueryContextProcessor:
     ) -> dict[str, Any]:
         """Handles caching around the df payload retrieval"""
         cache_key = self.query_cache_key(query_obj)
+        shared_payloads = g.get("shared_df_payloads") if has_app_context() else None
+        if shared_payloads is not None and cache_key in shared_payloads:
+            return copy_df_payload(shared_payloads[cache_key])
+
         timeout = self.get_cache_timeout()
         force_query = self._query_context.force or timeout == -1
-        cache = QueryCacheManager.get(
-            key=cache_key,
-            region=CacheRegion.DATA,
-            force_query=force_query,
-            force_cached=force_cached,
+        stale_timeout = self.get_stale_while_revalidate() if timeout > 0 else 0
+        with span("cache_get"):
+            cache = QueryCacheManager.get(
+                key=cache_key,
+                region=CacheRegion.DATA,
+                force_query=force_query,
+                force_cached=force_cached,
+                datasource_uid=self._qc_datasource.uid,
+            )
+        is_stale = (
+            stale_timeout > 0
+            and cache_key is not None
+            and self.revalidate_if_stale(cache, cache_key, timeout)
         )
 
         if query_obj and cache_key and not cache.is_loaded:
@@ -158,15 +295,16 @@ class QueryContextProcessor:
 
                 query_result = self.get_query_result(query_obj)
                 annotation_data = self.get_annotation_data(query_obj)
-                cache.set_query_result(
-                    key=cache_key,
-                    query_result=query_result,
-                    annotation_data=annotation_data,
-                    force_query=force_query,
-                    timeout=self.get_cache_timeout(),
-                    datasource_uid=self._qc_datasource.uid,
-                    region=CacheRegion.DATA,
-                )
+                with span("cache_set"):
+                    cache.set_query_result(
+                        key=cache_key,
+                        query_result=query_result,
+                        annotation_data=annotation_data,
+                        force_query=force_query,
+                        timeout=timeout + stale_timeout,
+                        datasource_uid=self._qc_datasource.uid,
+                        region=CacheRegion.DATA,
+                    )
             except QueryObjectValidationError as ex:
                 cache.error_message = str(ex)
                 cache.status = QueryStatus.FAILED
@@ -182,7 +320,7 @@ class QueryContextProcessor:
         }
         cache.df.columns = [unescape_separator(col) for col in cache.df.columns.values]
 
-        return {
+        payload = {
             "cache_key": cache_key,
             "cached_dttm": cache.cache_dttm,
             "cache_timeout": self.get_cache_timeout(),
@@ -193,6 +331,7 @@ class QueryContextProcessor:
             "annotation_data": cache.annotation_data,
             "error": cache.error_message,
             "is_cached": cache.is_cached,
+            "is_stale": is_stale,
             "query": cache.query,
             "status": cache.status,
             "stacktrace": cache.stacktrace,
@@ -202,29 +341,230 @@ class QueryContextProcessor:
             "to_dttm": query_obj.to_dttm,
             "label_map": label_map,
         }
+        if shared_payloads is not None and cache_key:
+            shared_payloads[cache_key] = payload
+            return copy_df_payload(payload)
+        return payload
 
-    def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
+    def get_stale_while_revalidate(self) -> int:
         """
-        Returns a QueryObject cache key for objects in self.queries
+        Returns for how many seconds after their cache timeout the query results of
+        the datasource are served while being refreshed in the background
         """
         datasource = self._qc_datasource
-        extra_cache_keys = datasource.get_extra_cache_keys(query_obj.to_dict())
+        extras = [getattr(datasource, "extra_dict", {})]
+        if hasattr(datasource, "database"):
+            extras.append(datasource.database.get_extra())
+        for extra in extras:
+            if (stale_timeout := extra.get("stale_while_revalidate")) is not None:
+                try:
+                    return int(stale_timeout)
+                except (TypeError, ValueError):
+                    logger.warning(
+                        "Invalid stale_while_revalidate %r of %s",
+                        stale_timeout,
+                        datasource.uid,
+                    )
+                    break
+        return config["CHART_DATA_STALE_WHILE_REVALIDATE"]
 
-        cache_key = (
-            query_obj.cache_key(
-                datasource=datasource.uid,
-                extra_cache_keys=extra_cache_keys,
-                rls=security_manager.get_rls_cache_key(datasource),
-                changed_on=datasource.changed_on,
-                **kwargs,
+    def revalidate_if_stale(
+        self,
+        cache: QueryCacheManager,
+        cache_key: str,
+        timeout: int,
+    ) -> bool:
+        """
+        Enqueues a refresh of the query results when they were cached more than
+        `timeout` seconds ago, unless one is already pending.
+
+        :returns: Whether the query results are stale
+        """
+        if not cache.is_loaded or not cache.cache_dttm:
+            return False
+        cached_at = datetime.fromisoformat(cache.cache_dttm)
+        if datetime.utcnow() - cached_at <= timedelta(seconds=timeout):
+            return False
+
+        stats_logger.incr("loaded_from_stale_cache")
+        # pylint: disable=import-outside-toplevel
+        from superset.tasks.async_queries import refresh_chart_data_cache
+
+        # the lock is held until the refresh completes, for as long as it may run
+        if not (
+            lock_token := acquire_cache_lock(
+                REVALIDATION_LOCK_NAMESPACE,
+                config["SQLLAB_ASYNC_TIME_LIMIT_SEC"],
+                key=cache_key,
+            )
+        ):
+            logger.debug("A refresh of %s is already pending", cache_key)
+            return True
+
+        job_metadata: dict[str, Any] = {"user_id": get_user_id()}
+        if guest_user := security_manager.get_current_guest_user_if_guest():
+            job_metadata["guest_token"] = guest_user.guest_token
+        form_data = {
+            "form_data": self._query_context.form_data,
+            **self._query_context.cache_values,
+            "force": True,
+        }
+        try:
+            refresh_chart_data_cache.delay(
+                job_metadata,
+                form_data,
+                cache_key,
+                lock_token,
             )
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning("Could not enqueue a refresh of %s", cache_key)
+            logger.exception(ex)
+            release_cache_lock(REVALIDATION_LOCK_NAMESPACE, lock_token, key=cache_key)
+        return True
+
+    def query_cache_key(self, query_obj: QueryObject, **kwargs: Any) -> str | None:
+        """
+        Returns a QueryObject cache key for objects in self.queries
+        """
+        cache_key = (
+            query_obj.cache_key(**self.get_cache_key_extras(query_obj), **kwargs)
             if query_obj
             else None
         )
         return cache_key
 
+    def query_sql_cache_key(self, query_obj: QueryObject) -> str:
+        """
+        Returns the cache key of the result of a QueryObject before post-processing
+        """
+        return query_obj.sql_cache_key(**self.get_cache_key_extras(query_obj))
+
+    def get_cache_key_extras(self, query_obj: QueryObject) -> dict[str, Any]:
+        datasource = self._qc_datasource
+        return {
+            "datasource": datasource.uid,
+            "extra_cache_keys": datasource.get_extra_cache_keys(query_obj.to_dict()),
+            "rls": security_manager.get_rls_cache_key(datasource),
+            "changed_on": datasource.changed_on,
+        }
+
+    @traced("query")
     def get_query_result(self, query_object: QueryObject) -> QueryResult:
         """Returns a pandas dataframe based on the query object"""
+        if config["CHART_DATA_QUERY_COALESCING"] and not isinstance(
+            self._query_context.datasource, Query
+        ):
+            result = self.get_coalesced_query_result(query_object)
+        else:
+            result = self.run_query(query_object)
+
+        if not result.df.empty:
+            # Re-raising QueryObjectValidationError
+            try:
+                with span("post_processing"):
+                    result.df = query_object.exec_post_processing(result.df)
+            except InvalidPostProcessingError as ex:
+                raise QueryObjectValidationError(ex.message) from ex
+
+        result.from_dttm = query_object.from_dttm
+        result.to_dttm = query_object.to_dttm
+        return result
+
+    def get_coalesced_query_result(self, query_object: QueryObject) -> QueryResult:
+        """
+        Returns the result of the query object before post-processing, shared through
+        the data cache with the query objects only differing in their post-processing.
+
+        Identical queries in flight are coalesced across workers: only the worker
+        holding the distributed lock of the query runs it, while the others wait for
+        its result to land in the cache, for up to
+        `CHART_DATA_QUERY_COALESCING_TIMEOUT` seconds before running it themselves.
+        """
+        key = self.query_sql_cache_key(query_object)
+        force_query = self._query_context.force or self.get_cache_timeout() == -1
+        if not force_query and (result := self.load_shared_query_result(key)):
+            return result
+
+        timeout = config["CHART_DATA_QUERY_COALESCING_TIMEOUT"]
+        # the lock is held for as long as the query may run
+        lock_timeout = max(timeout, config["SUPERSET_WEBSERVER_TIMEOUT"])
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                with CacheDistributedLock(
+                    QUERY_COALESCING_LOCK_NAMESPACE,
+                    lock_timeout,
+                    key=key,
+                ):
+                    # the query may have completed while acquiring the lock
+                    if not force_query and (
+                        result := self.load_shared_query_result(key)
+                    ):
+                        return result
+
+                    result = self.run_query(query_object)
+                    if result.status != QueryStatus.FAILED:
+                        QueryCacheManager.set(
+                            key=key,
+                            value={
+                                "df": result.df,
+                                "query": result.query,
+                                "applied_template_filters": (
+                                    result.applied_template_filters
+                                ),
+                                "applied_filter_columns": result.applied_filter_columns,
+                                "rejected_filter_columns": (
+                                    result.rejected_filter_columns
+                                ),
+                                "sql_rowcount": result.sql_rowcount,
+                                "duration": result.duration.total_seconds(),
+                            },
+                            timeout=self.get_cache_timeout(),
+                            datasource_uid=self._qc_datasource.uid,
+                            region=CacheRegion.DATA,
+                        )
+                    return result
+            except CreateKeyValueDistributedLockFailedException:
+                stats_logger.incr("coalesced_query_wait")
+                time.sleep(QUERY_COALESCING_POLL_INTERVAL)
+                if result := self.load_shared_query_result(key):
+                    return result
+
+        logger.warning("Timed out waiting for the coalesced query %s", key)
+        return self.run_query(query_object)
+
+    def load_shared_query_result(self, key: str) -> QueryResult | None:
+        """
+        Returns the query result before post-processing stored by
+        `get_coalesced_query_result`, if cached.
+        """
+        cache = QueryCacheManager.get(
+            key=key,
+            region=CacheRegion.DATA,
+            datasource_uid=self._qc_datasource.uid,
+        )
+        if not cache.is_loaded:
+            return None
+
+        result = QueryResult(
+            df=cache.df,
+            query=cache.query,
+            duration=timedelta(
+                seconds=(cache.cache_value or {}).get("duration") or 0,
+            ),
+            applied_template_filters=cache.applied_template_filters,
+            applied_filter_columns=cache.applied_filter_columns,
+            rejected_filter_columns=cache.rejected_filter_columns,
+        )
+        if cache.sql_rowcount is not None:
+            result.sql_rowcount = cache.sql_rowcount
+        return result
+
+    def run_query(self, query_object: QueryObject) -> QueryResult:
+        """
+        Returns the result of the query object, with its time offsets joined, before
+        post-processing
+        """
         query_context = self._query_context
         # Here, we assume that all the queries will use the same datasource, which is
         # a valid assumption for current setting. In the long term, we may
@@ -255,16 +595,8 @@ class QueryContextProcessor:
                 query += ";\n\n".join(queries)
                 query += ";\n\n"
 
-            # Re-raising QueryObjectValidationError
-            try:
-                df = query_object.exec_post_processing(df)
-            except InvalidPostProcessingError as ex:
-                raise QueryObjectValidationError(ex.message) from ex
-
         result.df = df
         result.query = query
-        result.from_dttm = query_object.from_dttm
-        result.to_dttm = query_object.to_dttm
         return result
 
     def normalize_df(self, df: pd.DataFrame, query_object: QueryObject) -> pd.DataFrame:
@@ -364,6 +696,10 @@ class QueryContextProcessor:
         """
         if join_column_producer:
             df[name] = df.apply(lambda row: join_column_producer(row, 0), axis=1)
+        elif (
+            join_keys := self.generate_join_keys(df.iloc[:, 0], time_grain, time_offset)
+        ) is not None:
+            df[name] = join_keys
         else:
             df[name] = df.apply(
                 lambda row: self.generate_join_column(row, 0, time_grain, time_offset),
@@ -408,11 +744,13 @@ class QueryContextProcessor:
         query_object: QueryObject,
     ) -> CachedTimeOffset:
         query_context = self._query_context
-        # ensure query_object is immutable
-        query_object_clone = copy.copy(query_object)
         queries: list[str] = []
         cache_keys: list[str | None] = []
         offset_dfs: dict[str, pd.DataFrame] = {}
+        # offsets missing from the cache, queried together once all of them are known
+        pending_offsets: list[tuple[int, str, str, str | None, QueryCacheManager]] = []
+        query_object_clones: list[QueryObject] = []
+        query_object_clone_dcts: list[dict[str, Any]] = []
 
         outer_from_dttm, outer_to_dttm = get_since_until_from_query_object(query_object)
         if not outer_from_dttm or not outer_to_dttm:
@@ -430,7 +768,13 @@ class QueryContextProcessor:
         # use columns that are not metrics as join keys
         join_keys = [col for col in df.columns if col not in metric_names]
 
+        # Get time offset index
+        index = (get_base_axis_labels(query_object.columns) or [DTTM_ALIAS])[0]
+
         for offset in query_object.time_offsets:
+            # ensure query_object is immutable, and that the offsets are independent
+            query_object_clone = copy.copy(query_object)
+            query_object_clone.filter = copy.deepcopy(query_object.filter)
             try:
                 # pylint: disable=line-too-long
                 # Since the x-axis is also a column name for the time filter, x_axis_label will be set as granularity  # noqa: E501
@@ -466,8 +810,6 @@ class QueryContextProcessor:
             query_object_clone.inner_to_dttm = outer_to_dttm
             query_object_clone.time_offsets = []
             query_object_clone.post_processing = []
-            # Get time offset index
-            index = (get_base_axis_labels(query_object.columns) or [DTTM_ALIAS])[0]
             # The comparison is not using a temporal column so we need to modify
             # the temporal filter so we run the query with the correct time range
             if not dataframe_utils.is_datetime_series(df.get(index)):
@@ -509,7 +851,10 @@ class QueryContextProcessor:
                 time_grain=time_grain,
             )
             cache = QueryCacheManager.get(
-                cache_key, CacheRegion.DATA, query_context.force
+                cache_key,
+                CacheRegion.DATA,
+                query_context.force,
+                datasource_uid=self._qc_datasource.uid,
             )
             # whether hit on the cache
             if cache.is_loaded:
@@ -519,12 +864,6 @@ class QueryContextProcessor:
                 continue
 
             query_object_clone_dct = query_object_clone.to_dict()
-            # rename metrics: SUM(value) => SUM(value) 1 year ago
-            metrics_mapping = {
-                metric: TIME_COMPARISON.join([metric, original_offset])
-                for metric in metric_names
-            }
-
             # When the original query has limit or offset we wont apply those
             # to the subquery so we prevent data inconsistency due to missing records
             # in the dataframes when performing the join
@@ -532,14 +871,36 @@ class QueryContextProcessor:
                 query_object_clone_dct["row_limit"] = config["ROW_LIMIT"]
                 query_object_clone_dct["row_offset"] = 0
 
-            if isinstance(self._qc_datasource, Query):
-                result = self._qc_datasource.exc_query(query_object_clone_dct)
-            else:
-                result = self._qc_datasource.query(query_object_clone_dct)
-
-            queries.append(result.query)
+            pending_offsets.append(
+                (len(queries), offset, original_offset, cache_key, cache)
+            )
+            query_object_clones.append(query_object_clone)
+            query_object_clone_dcts.append(query_object_clone_dct)
+            # placeholders keeping the order of the offsets, filled in below
+            offset_dfs[offset] = pd.DataFrame()
+            queries.append("")
             cache_keys.append(None)
 
+        results = None
+        if dataframe_utils.is_datetime_series(df.get(index)):
+            results = self.run_offset_queries_in_single_scan(
+                query_object_clones, query_object_clone_dcts, index, time_grain
+            )
+        if results is None:
+            results = self.run_offset_queries(query_object_clone_dcts)
+
+        for pending_offset, query_object_clone, result in zip(
+            pending_offsets, query_object_clones, results
+        ):
+            position, offset, original_offset, cache_key, cache = pending_offset
+            queries[position] = result.query
+
+            # rename metrics: SUM(value) => SUM(value) 1 year ago
+            metrics_mapping = {
+                metric: TIME_COMPARISON.join([metric, original_offset])
+                for metric in metric_names
+            }
+
             offset_metrics_df = result.df
             if offset_metrics_df.empty:
                 offset_metrics_df = pd.DataFrame(
@@ -579,8 +940,143 @@ class QueryContextProcessor:
                 join_keys,
             )
 
+        # a single scan only reports its query once
+        queries = [query for query in queries if query]
+
         return CachedTimeOffset(df=df, queries=queries, cache_keys=cache_keys)
 
+    def run_offset_queries(
+        self, query_object_dcts: list[dict[str, Any]]
+    ) -> list[QueryResult]:
+        """
+        Run the time offset queries, concurrently when enabled.
+
+        The queries run sequentially unless `TIME_OFFSET_QUERIES_MAX_WORKERS` is
+        greater than 1, in which case they run on a thread pool bounded by it. The
+        number of offset queries running against the same database in this process
+        is bounded by `TIME_OFFSET_QUERIES_PER_DATABASE_LIMIT`.
+
+        :param query_object_dcts: The query objects of the offsets, as dictionaries.
+        :returns: The query results, in the same order.
+        """
+        max_workers = min(
+            config["TIME_OFFSET_QUERIES_MAX_WORKERS"], len(query_object_dcts)
+        )
+        if max_workers <= 1:
+            return [self._run_offset_query(dct) for dct in query_object_dcts]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(run_in_app_context(self._run_offset_query), dct)
+                for dct in query_object_dcts
+            ]
+            return [future.result() for future in futures]
+
+    def run_offset_queries_in_single_scan(
+        self,
+        query_objects: list[QueryObject],
+        query_object_dcts: list[dict[str, Any]],
+        index: str,
+        time_grain: str | None,
+    ) -> list[QueryResult] | None:
+        """
+        Run the time offset queries as a single query, spanning all their time ranges.
+
+        The result of each offset is sliced out of the combined result, on the time
+        index. This is only possible when `TIME_OFFSET_SINGLE_SCAN` is enabled, the time
+        index is the column the time ranges filter on, and the time ranges are aligned
+        to the time grain and not too far apart, which is checked before running the
+        combined query.
+
+        The combined query is limited to the row limit of an offset times the number of
+        offsets. When it reaches that limit, the offsets which might be missing rows
+        are queried separately.
+
+        :param query_objects: The query objects of the offsets.
+        :param query_object_dcts: The query objects of the offsets, as dictionaries.
+        :param index: The label of the time index.
+        :param time_grain: The time grain of the time index.
+        :returns: The query results, in the same order, or None if the offsets need
+            to be queried separately.
+        """
+        if not config["TIME_OFFSET_SINGLE_SCAN"] or len(query_objects) < 2:
+            return None
+
+        time_ranges = get_single_scan_time_ranges(query_objects, index, time_grain)
+        if time_ranges is None:
+            return None
+
+        row_limit = query_object_dcts[0].get("row_limit")
+        query_object_dct = {
+            **query_object_dcts[0],
+            "from_dttm": min(time_range[0] for time_range in time_ranges),
+            "to_dttm": max(time_range[1] for time_range in time_ranges),
+            "row_limit": row_limit * len(time_ranges) if row_limit else row_limit,
+        }
+        [result] = self.run_offset_queries([query_object_dct])
+        if result.df.empty:
+            return [result] + [QueryResult(result.df, "", result.duration)] * (
+                len(time_ranges) - 1
+            )
+
+        dttm = self.normalize_df(result.df.copy(), query_objects[0]).get(index)
+        if dttm is None or not pd.api.types.is_datetime64_dtype(dttm):
+            return None
+
+        truncated = (
+            bool(row_limit) and len(result.df.index) >= query_object_dct["row_limit"]
+        )
+        # the time filter applies to the values in the database, before the offset
+        hours = timedelta(hours=self._qc_datasource.offset or 0)
+        results: list[QueryResult | None] = []
+        pending: list[int] = []
+        reported = False
+        for start, end in time_ranges:
+            mask = ((dttm >= start + hours) & (dttm < end + hours)).to_numpy()
+            df = result.df[mask].reset_index(drop=True)
+            if row_limit and len(df.index) >= row_limit:
+                # the rows are ordered as in a separate query
+                df = df.head(row_limit)
+            elif truncated:
+                # the rows of this offset might have been cut off by the others
+                pending.append(len(results))
+                results.append(None)
+                continue
+
+            # the query is reported once, with the first offset
+            results.append(
+                QueryResult(df, "" if reported else result.query, result.duration)
+            )
+            reported = True
+
+        if pending:
+            for position, pending_result in zip(
+                pending,
+                self.run_offset_queries(
+                    [query_object_dcts[position] for position in pending]
+                ),
+            ):
+                results[position] = pending_result
+        return cast(list[QueryResult], results)
+
+    def _run_offset_query(self, query_object_dct: dict[str, Any]) -> QueryResult:
+        datasource = self._qc_datasource
+        state = sa.inspect(datasource, raiseerr=False)
+        if state is not None and state.persistent:
+            # lazy loads need to go through the session of the current thread
+            datasource = (
+                db.session.query(type(datasource)).filter_by(id=datasource.id).one()
+            )
+
+        semaphore = get_database_semaphore(
+            getattr(datasource, "database_id", None),
+            config["TIME_OFFSET_QUERIES_PER_DATABASE_LIMIT"],
+        )
+        with semaphore:
+            if isinstance(datasource, Query):
+                return datasource.exc_query(query_object_dct)
+            return datasource.query(query_object_dct)
+
     def join_offset_dfs(
         self,
         df: pd.DataFrame,
@@ -655,8 +1151,71 @@ class QueryContextProcessor:
                 )
         return df
 
-    @staticmethod
+    @classmethod
+    def generate_join_keys(
+        cls,
+        values: pd.Series,
+        time_grain: str,
+        time_offset: str | None = None,
+    ) -> pd.Series | None:
+        """
+        Vectorized `generate_join_column`, for a column of datetimes.
+
+        The datetimes are mapped to integer codes identifying their time grain
+        bucket, and only the first datetime of each bucket is formatted, so the join
+        keys are the same as the ones generated row by row.
+
+        :param values: The temporal column.
+        :param time_grain: The time grain used to calculate the join keys.
+        :param time_offset: The time offset applied to the datetimes.
+        :returns: The join keys, or None if the column has values other than naive
+            datetimes and they have to be generated row by row.
+        """
+        if not pd.api.types.is_datetime64_dtype(values) or values.isna().any():
+            return None
+
+        if time_offset:
+            values = values + DateOffset(**normalize_time_delta(time_offset))
+
+        datetimes = values.dt
+        if time_grain in (
+            TimeGrain.WEEK_STARTING_SUNDAY,
+            TimeGrain.WEEK_ENDING_SATURDAY,
+        ):
+            # the %U week number, with weeks starting on Sunday
+            weeks = (datetimes.dayofyear + 6 - (datetimes.dayofweek + 1) % 7) // 7
+            buckets = datetimes.year * 100 + weeks
+        elif time_grain in (
+            TimeGrain.WEEK,
+            TimeGrain.WEEK_STARTING_MONDAY,
+            TimeGrain.WEEK_ENDING_SUNDAY,
+        ):
+            # the %W week number, with weeks starting on Monday
+            weeks = (datetimes.dayofyear + 6 - datetimes.dayofweek) // 7
+            buckets = datetimes.year * 100 + weeks
+        elif time_grain == TimeGrain.MONTH:
+            buckets = datetimes.year * 100 + datetimes.month
+        elif time_grain == TimeGrain.QUARTER:
+            buckets = datetimes.year * 10 + datetimes.quarter
+        elif time_grain == TimeGrain.YEAR:
+            buckets = datetimes.year
+        else:
+            buckets = values
+
+        codes, _ = pd.factorize(buckets)
+        _, first_positions = np.unique(codes, return_index=True)
+        labels = np.array(
+            [
+                cls.format_join_value(value, time_grain)
+                for value in values.iloc[first_positions]
+            ],
+            dtype=object,
+        )
+        return pd.Series(labels[codes], index=values.index, dtype=object)
+
+    @classmethod
     def generate_join_column(
+        cls,
         row: pd.Series,
         column_index: int,
         time_grain: str,
@@ -664,10 +1223,14 @@ class QueryContextProcessor:
     ) -> str:
         value = row[column_index]
 
-        if hasattr(value, "strftime"):
-            if time_offset:
-                value = value + DateOffset(**normalize_time_delta(time_offset))
+        if hasattr(value, "strftime") and time_offset:
+            value = value + DateOffset(**normalize_time_delta(time_offset))
+
+        return cls.format_join_value(value, time_grain)
 
+    @staticmethod
+    def format_join_value(value: Any, time_grain: str) -> str:
+        if hasattr(value, "strftime"):
             if time_grain in (
                 TimeGrain.WEEK_STARTING_SUNDAY,
                 TimeGrain.WEEK_ENDING_SATURDAY,
@@ -692,9 +1255,10 @@ class QueryContextProcessor:
 
         return str(value)
 
+    @traced("serialization")
     def get_data(
         self, df: pd.DataFrame, coltypes: list[GenericDataType]
-    ) -> str | list[dict[str, Any]]:
+    ) -> str | Iterator[str] | list[dict[str, Any]]:
         if self._query_context.result_format in ChartDataResultFormat.table_like():
             include_index = not isinstance(df.index, pd.RangeIndex)
             columns = list(df.columns)
@@ -704,8 +1268,11 @@ class QueryContextProcessor:
 
             result = None
             if self._query_context.result_format == ChartDataResultFormat.CSV:
-                result = csv.df_to_escaped_csv(
-                    df, index=include_index, **config["CSV_EXPORT"]
+                result = csv.df_to_escaped_csv_chunks(
+                    df,
+                    chunk_size=config["CSV_EXPORT_CHUNK_SIZE"],
+                    index=include_index,
+                    **config["CSV_EXPORT"],
                 )
             elif self._query_context.result_format == ChartDataResultFormat.XLSX:
                 excel.apply_column_types(df, coltypes)
@@ -877,6 +1444,7 @@ class QueryContextProcessor:
         except SupersetException as ex:
             raise QueryObjectValidationError(error_msg_from_exception(ex)) from ex
 
+    @traced("security")
     def raise_for_access(self) -> None:
         """
         Raise an exception if the user cannot access the resource.
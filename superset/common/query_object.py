@@ -347,7 +347,7 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
             default=str,
         )
 
-    def cache_key(self, **extra: Any) -> str:  # noqa: C901
+    def cache_key(self, **extra: Any) -> str:
         """
         The cache key is made out of the key/values from to_dict(), plus any
         other key/values in `extra`
@@ -355,6 +355,26 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
         the use-provided inputs to bounds, which may be time-relative (as in
         "5 days ago" or "now").
         """
+        return md5_sha_from_dict(
+            self._get_cache_dict(**extra),
+            default=json_int_dttm_ser,
+            ignore_nan=True,
+        )
+
+    def sql_cache_key(self, **extra: Any) -> str:
+        """
+        The cache key of the query result before post-processing.
+
+        Query objects that only differ in their post-processing or annotation layers,
+        e.g. a table and a bar chart over the same GROUP BY, share the same key.
+        """
+        cache_dict = self._get_cache_dict(**extra)
+        cache_dict.pop("post_processing", None)
+        cache_dict.pop("annotation_layers", None)
+        cache_dict["post_processed"] = False
+        return md5_sha_from_dict(cache_dict, default=json_int_dttm_ser, ignore_nan=True)
+
+    def _get_cache_dict(self, **extra: Any) -> dict[str, Any]:  # noqa: C901
         cache_dict = self.to_dict()
         cache_dict.update(extra)
 
@@ -416,7 +436,7 @@ class QueryObject:  # pylint: disable=too-many-instance-attributes
             # datasource or database do not exist
             pass
 
-        return md5_sha_from_dict(cache_dict, default=json_int_dttm_ser, ignore_nan=True)
+        return cache_dict
 
     def exec_post_processing(self, df: DataFrame) -> DataFrame:
         """
@@ -40,14 +40,21 @@ if TYPE_CHECKING:
 class QueryObjectFactory:  # pylint: disable=too-few-public-methods
     _config: dict[str, Any]
     _datasource_dao: DatasourceDAO
+    _datasources: dict[tuple[str, int], BaseDatasource] | None
 
     def __init__(
         self,
         app_configurations: dict[str, Any],
         _datasource_dao: DatasourceDAO,
+        datasources: dict[tuple[str, int], BaseDatasource] | None = None,
     ):
+        """
+        :param datasources: The datasources already looked up, by type and id, which
+            are added to as more are
+        """
         self._config = app_configurations
         self._datasource_dao = _datasource_dao
+        self._datasources = datasources
 
     def create(  # pylint: disable=too-many-arguments
         self,
@@ -83,10 +90,17 @@ class QueryObjectFactory:  # pylint: disable=too-few-public-methods
         )
 
     def _convert_to_model(self, datasource: DatasourceDict) -> BaseDatasource:
-        return self._datasource_dao.get_datasource(
+        key = (datasource["type"], int(datasource["id"]))
+        if self._datasources is not None and key in self._datasources:
+            return self._datasources[key]
+
+        model = self._datasource_dao.get_datasource(
             datasource_type=DatasourceType(datasource["type"]),
-            datasource_id=int(datasource["id"]),
+            datasource_id=key[1],
         )
+        if self._datasources is not None:
+            self._datasources[key] = model
+        return model
 
     def _process_extras(
         self,
@@ -0,0 +1,128 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Codecs for the dataframes stored in the chart data cache region.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import ClassVar
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+
+class QueryCacheCodec(ABC):
+    """
+    Serializes the dataframes of the chart data cache region.
+
+    Encoded dataframes are cached along with the name of their codec, so entries
+    remain readable after the configured codec changes.
+    """
+
+    name: ClassVar[str]
+
+    @abstractmethod
+    def encode(self, df: pd.DataFrame) -> bytes | None:
+        """
+        Encode a dataframe.
+
+        :param df: The dataframe
+        :returns: The encoded dataframe, or None if the codec can't encode it
+            losslessly, in which case it's cached pickled
+        """
+
+    @abstractmethod
+    def decode(self, value: bytes) -> pd.DataFrame:
+        """
+        Decode a dataframe encoded by the codec.
+
+        :param value: The encoded dataframe
+        :returns: The dataframe
+        """
+
+
+class ArrowQueryCacheCodec(QueryCacheCodec):
+    """
+    Encode dataframes as Arrow IPC streams, optionally compressed with "lz4" or
+    "zstd".
+
+    Only dataframes whose columns and index levels convert back to the same values
+    and dtypes are encoded: numeric, boolean and datetime columns, and object columns
+    holding strings, bytes or dates.
+    """
+
+    name = "arrow"
+
+    def __init__(self, compression: str | None = None) -> None:
+        self.compression = compression
+
+    def encode(self, df: pd.DataFrame) -> bytes | None:
+        if not df.columns.is_unique or not all(
+            isinstance(column, str) for column in df.columns
+        ):
+            return None
+
+        try:
+            table = pa.Table.from_pandas(df)
+        except (pa.ArrowException, TypeError, ValueError):
+            return None
+
+        dtypes = list(df.dtypes)
+        if not isinstance(df.index, pd.RangeIndex):
+            dtypes += [
+                df.index.get_level_values(level).dtype
+                for level in range(df.index.nlevels)
+            ]
+        if len(dtypes) != len(table.schema) or not all(
+            map(is_lossless, dtypes, table.schema.types)
+        ):
+            return None
+
+        sink = pa.BufferOutputStream()
+        options = pa.ipc.IpcWriteOptions(compression=self.compression)
+        with pa.ipc.new_stream(sink, table.schema, options=options) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes()
+
+    def decode(self, value: bytes) -> pd.DataFrame:
+        return pa.ipc.open_stream(pa.BufferReader(value)).read_all().to_pandas()
+
+
+def is_lossless(dtype: object, arrow_type: pa.DataType) -> bool:
+    """
+    Whether values of a pandas dtype converted to an Arrow type convert back to the
+    same values and dtype.
+    """
+    if pd.api.types.is_object_dtype(dtype):
+        return (
+            pa.types.is_string(arrow_type)
+            or pa.types.is_large_string(arrow_type)
+            or pa.types.is_binary(arrow_type)
+            or pa.types.is_date(arrow_type)
+            or pa.types.is_null(arrow_type)
+        )
+    if isinstance(dtype, np.dtype):
+        return dtype.kind in "biufmM"
+    return isinstance(dtype, (pd.CategoricalDtype, pd.DatetimeTZDtype))
+
+
+QUERY_CACHE_CODECS: dict[str, QueryCacheCodec] = {
+    ArrowQueryCacheCodec.name: ArrowQueryCacheCodec(),
+}
@@ -17,6 +17,7 @@
 from __future__ import annotations
 
 import logging
+from datetime import datetime
 from typing import Any
 
 from flask_caching import Cache
@@ -24,6 +25,7 @@ from pandas import DataFrame
 
 from superset import app
 from superset.common.db_query_status import QueryStatus
+from superset.common.utils.query_cache_codecs import QUERY_CACHE_CODECS
 from superset.constants import CacheRegion
 from superset.exceptions import CacheLoadError
 from superset.extensions import cache_manager
@@ -43,6 +45,49 @@ _cache: dict[CacheRegion, Cache] = {
 }
 
 
+def get_metadata_key(key: str) -> str:
+    """
+    Return the key of the metadata sidecar of a cached value.
+    """
+    return f"{key}__metadata"
+
+
+def encode_df(value: dict[str, Any]) -> dict[str, Any]:
+    """
+    Encode the dataframe of a cache value with the `DATA_CACHE_CODEC`, if any.
+    """
+    codec = config["DATA_CACHE_CODEC"]
+    if codec is None or not isinstance(value.get("df"), DataFrame):
+        return value
+
+    try:
+        encoded = codec.encode(value["df"])
+    except Exception as ex:  # pylint: disable=broad-except
+        logger.warning("Could not encode dataframe with the %s codec", codec.name)
+        logger.exception(ex)
+        encoded = None
+
+    if encoded is None:
+        return value
+    return {**value, "df": encoded, "df_codec": codec.name}
+
+
+def decode_df(cache_value: dict[str, Any]) -> DataFrame:
+    """
+    Decode the dataframe of a cache value, stored pickled or encoded by a codec.
+
+    :raises KeyError: If the codec of the dataframe is unknown
+    :raises ValueError: If the dataframe can't be decoded
+    """
+    if (name := cache_value.get("df_codec")) is None:
+        return cache_value["df"]
+
+    codec = config["DATA_CACHE_CODEC"]
+    if codec is None or codec.name != name:
+        codec = QUERY_CACHE_CODECS[name]
+    return codec.decode(cache_value["df"])
+
+
 class QueryCacheManager:
     """
     Class for manage query-cache getting and setting
@@ -144,19 +189,28 @@ class QueryCacheManager:
         region: CacheRegion = CacheRegion.DEFAULT,
         force_query: bool | None = False,
         force_cached: bool | None = False,
+        datasource_uid: str | None = None,
     ) -> QueryCacheManager:
         """
         Initialize QueryCacheManager by query-cache key
+
+        Unless the value is held by the local data cache, its metadata sidecar is read
+        first, e.g. for its `dttm`. Values without a sidecar, cached before it was
+        introduced or whose sidecar was evicted, are loaded whole.
         """
         query_cache = cls()
         if not key or not _cache[region] or force_query:
             return query_cache
 
-        if cache_value := _cache[region].get(key):
+        metadata: dict[str, Any] = {}
+        if region != CacheRegion.DATA or not cache_manager.local_data_cache.has(key):
+            metadata = _cache[region].get(get_metadata_key(key)) or {}
+
+        if cache_value := cls._get_value(key, region, datasource_uid):
             logger.debug("Cache key: %s", key)
             stats_logger.incr("loading_from_cache")
             try:
-                query_cache.df = cache_value["df"]
+                query_cache.df = decode_df(cache_value)
                 query_cache.query = cache_value["query"]
                 query_cache.annotation_data = cache_value.get("annotation_data", {})
                 query_cache.applied_template_filters = cache_value.get(
@@ -172,12 +226,10 @@ class QueryCacheManager:
                 query_cache.is_loaded = True
                 query_cache.is_cached = cache_value is not None
                 query_cache.sql_rowcount = cache_value.get("sql_rowcount", None)
-                query_cache.cache_dttm = (
-                    cache_value["dttm"] if cache_value is not None else None
-                )
+                query_cache.cache_dttm = metadata.get("dttm") or cache_value["dttm"]
                 query_cache.cache_value = cache_value
                 stats_logger.incr("loaded_from_cache")
-            except KeyError as ex:
+            except (KeyError, ValueError) as ex:
                 logger.exception(ex)
                 logger.error(
                     "Error reading cache: %s",
@@ -193,6 +245,36 @@ class QueryCacheManager:
             raise CacheLoadError("Error loading data from cache")
         return query_cache
 
+    @staticmethod
+    def _get_value(
+        key: str,
+        region: CacheRegion,
+        datasource_uid: str | None = None,
+    ) -> Any:
+        """
+        Get a cached value, from the local data cache when it holds it.
+
+        Values fetched from the data cache are kept in the local data cache with their
+        dataframe decoded, tagged with `datasource_uid`.
+        """
+        local_cache = cache_manager.local_data_cache
+        if region != CacheRegion.DATA or not local_cache.enabled:
+            return _cache[region].get(key)
+
+        if (value := local_cache.get(key)) is not None:
+            return value
+
+        value = _cache[region].get(key)
+        if isinstance(value, dict) and "df" in value:
+            try:
+                df = decode_df(value)
+            except (KeyError, ValueError):
+                return value
+            value = {name: val for name, val in value.items() if name != "df_codec"}
+            value["df"] = df
+            local_cache.set(key, value, datasource_uid=datasource_uid)
+        return value
+
     @staticmethod
     def set(
         key: str | None,
@@ -203,9 +285,31 @@ class QueryCacheManager:
     ) -> None:
         """
         set value to specify cache region, proxy for `set_and_log_cache`
+
+        The metadata of values holding a dataframe, i.e. everything but the
+        dataframe plus its row count, is also stored under a small sidecar key, so it
+        can be read without loading the dataframe. Values of the data region are also
+        kept in the local data cache.
         """
-        if key:
-            set_and_log_cache(_cache[region], key, value, timeout, datasource_uid)
+        if not key:
+            return
+
+        if isinstance(df := value.get("df"), DataFrame):
+            value = {**value, "dttm": datetime.utcnow().isoformat().split(".")[0]}
+            encoded = encode_df(value)
+            metadata = {
+                **{name: val for name, val in encoded.items() if name != "df"},
+                "rowcount": len(df.index),
+            }
+        else:
+            encoded = value
+            metadata = None
+
+        set_and_log_cache(_cache[region], key, encoded, timeout, datasource_uid)
+        if metadata is not None:
+            set_and_log_cache(_cache[region], get_metadata_key(key), metadata, timeout)
+        if region == CacheRegion.DATA:
+            cache_manager.local_data_cache.set(key, value, timeout, datasource_uid)
 
     @staticmethod
     def delete(
@@ -213,11 +317,48 @@ class QueryCacheManager:
         region: CacheRegion = CacheRegion.DEFAULT,
     ) -> None:
         if key:
-            _cache[region].delete(key)
+            _cache[region].delete_many(key, get_metadata_key(key))
+            if region == CacheRegion.DATA:
+                cache_manager.local_data_cache.delete(key)
 
     @staticmethod
     def has(
         key: str | None,
         region: CacheRegion = CacheRegion.DEFAULT,
     ) -> bool:
-        return bool(_cache[region].get(key)) if key else False
+        if (
+            key
+            and region == CacheRegion.DATA
+            and cache_manager.local_data_cache.has(key)
+        ):
+            return True
+        return QueryCacheManager.get_metadata(key, region) is not None
+
+    @staticmethod
+    def get_metadata(
+        key: str | None,
+        region: CacheRegion = CacheRegion.DEFAULT,
+    ) -> dict[str, Any] | None:
+        """
+        Get the metadata of a cached value without loading its dataframe, e.g. its
+        `dttm`, `rowcount` and `query`.
+
+        Values cached without a metadata sidecar, i.e. before it was introduced or
+        without a dataframe, are loaded whole.
+
+        :returns: The metadata, or None if the key isn't cached
+        """
+        if not key:
+            return None
+
+        if metadata := _cache[region].get(get_metadata_key(key)):
+            return metadata
+
+        if not (value := _cache[region].get(key)):
+            return None
+        if not isinstance(value, dict):
+            return {}
+        metadata = {name: val for name, val in value.items() if name != "df"}
+        if isinstance(df := value.get("df"), DataFrame):
+            metadata["rowcount"] = len(df.index)
+        return metadata
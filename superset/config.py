@@ -51,6 +51,10 @@ from sqlalchemy.orm.query import Query
 from superset.advanced_data_type.plugins.internet_address import internet_address
 from superset.advanced_data_type.plugins.internet_port import internet_port
 from superset.advanced_data_type.types import AdvancedDataType
+from superset.common.utils.query_cache_codecs import (
+    ArrowQueryCacheCodec,
+    QueryCacheCodec,
+)
 from superset.constants import CHANGE_ME_SECRET_KEY
 from superset.jinja_context import BaseTemplateProcessor
 from superset.key_value.types import JsonKeyValueCodec
@@ -81,6 +85,9 @@ STATS_LOGGER = DummyStatsLogger()
 # Note that you can use `StdOutEventLogger` for debugging
 # Note that you can write your own event logger by extending `AbstractEventLogger`
 # https://github.com/apache/superset/blob/master/superset/utils/log.py
+# Under heavy traffic, `AsyncDBEventLogger()` saves the transaction `DBEventLogger`
+# commits within each logged request, inserting logs in batches from a background
+# thread instead, at the cost of losing the queued logs if a process is killed.
 EVENT_LOGGER = DBEventLogger()
 
 SUPERSET_LOG_VIEW = True
@@ -585,6 +592,14 @@ SSH_TUNNEL_LOCAL_BIND_ADDRESS = "127.0.0.1"
 SSH_TUNNEL_TIMEOUT_SEC = 10.0
 #: Timeout (seconds) for transport socket (``socket.settimeout``)
 SSH_TUNNEL_PACKET_TIMEOUT_SEC = 1.0
+#: Keep the SSH tunnels of databases open across queries, one per tunnel
+#: configuration per process, instead of opening a tunnel for every query. As their
+#: local port doesn't change, their databases are pooled with DB_ENGINE_POOLING.
+SSH_TUNNEL_PERSISTENT = False
+#: Interval (seconds) of the keepalives sent through persistent tunnels
+SSH_TUNNEL_KEEPALIVE_SEC = 30.0
+#: Time (seconds) after which unused persistent tunnels are closed
+SSH_TUNNEL_IDLE_TIMEOUT_SEC = 300.0
 
 
 # Feature flags may also be set via 'SUPERSET_FEATURE_' prefixed environment vars.
@@ -771,6 +786,50 @@ CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 # Cache for datasource metadata and query results
 DATA_CACHE_CONFIG: CacheConfig = {"CACHE_TYPE": "NullCache"}
 
+# Codec of the dataframes of chart data query results stored in DATA_CACHE_CONFIG.
+# Arrow IPC streams, optionally compressed with "lz4" or "zstd", are smaller and
+# faster to load than pickled dataframes. Dataframes the codec can't encode
+# losslessly, e.g. with nested values, are pickled, as are all of them when set to
+# None. Entries cached with any codec remain readable after this setting changes.
+DATA_CACHE_CODEC: QueryCacheCodec | None = ArrowQueryCacheCodec(compression="lz4")
+
+# Maximum estimated memory, in bytes, of the chart data query results each process
+# keeps in an LRU cache in front of DATA_CACHE_CONFIG, so hot charts are served
+# without fetching and decoding their results. 0 disables it, as does a NullCache
+# DATA_CACHE_CONFIG. Local entries are dropped when their dataset changes, but only
+# in the process making the change, so they are also kept at most
+# DATA_CACHE_LOCAL_TIMEOUT seconds, bounding how stale other processes may be.
+DATA_CACHE_LOCAL_SIZE = 0
+DATA_CACHE_LOCAL_TIMEOUT = 60
+
+# Cache the payloads of the dashboard, charts and datasets endpoints loaded when
+# opening a dashboard in CACHE_CONFIG, and serve them with strong ETags so browsers
+# can revalidate them without downloading them again. Cached payloads are dropped
+# when the dashboard, its charts, their datasets or its tags are updated through
+# Superset. Other changes they depend on, e.g. renaming a database or editing the
+# metastore directly, only show up once DASHBOARD_PAYLOAD_CACHE_TIMEOUT elapses.
+DASHBOARD_PAYLOAD_CACHE = False
+DASHBOARD_PAYLOAD_CACHE_TIMEOUT = int(timedelta(hours=1).total_seconds())
+
+# Snapshot the permissions granted to each set of roles, in each process and in
+# CACHE_CONFIG, so access checks are set lookups rather than metastore queries.
+# Snapshots are dropped in all processes when permissions or roles change, which
+# requires CACHE_CONFIG to be shared by them. Users with builtin roles (FAB_ROLES)
+# are always checked against the metastore.
+PERMISSION_SNAPSHOT_CACHE = False
+PERMISSION_SNAPSHOT_CACHE_TIMEOUT = int(timedelta(hours=1).total_seconds())
+# Number of sets of roles whose snapshot is kept by each process
+PERMISSION_SNAPSHOT_CACHE_MAX_SNAPSHOTS = 1000
+
+# Cache the row level security filters of each dataset and set of roles in each
+# process and in CACHE_CONFIG, rather than looking them up for every query. They are
+# dropped in all processes when a filter is changed, which requires CACHE_CONFIG to
+# be shared by them.
+RLS_FILTER_CACHE = False
+RLS_FILTER_CACHE_TIMEOUT = int(timedelta(hours=1).total_seconds())
+# Number of datasets and sets of roles whose filters are kept by each process
+RLS_FILTER_CACHE_MAX_SNAPSHOTS = 10000
+
 # Cache for dashboard filter state. `CACHE_TYPE` defaults to `SupersetMetastoreCache`
 # that stores the values in the key-value table in the Superset metastore, as it's
 # required for Superset to operate correctly, but can be replaced by any
@@ -844,11 +903,25 @@ ALLOWED_EXTENSIONS = {*EXCEL_EXTENSIONS, *CSV_EXTENSIONS, *COLUMNAR_EXTENSIONS}
 # Optional maximum file size in bytes when uploading a CSV
 CSV_UPLOAD_MAX_SIZE = None
 
+# Number of rows of the chunks in which CSV and columnar files are read and uploaded
+# to databases, which bounds the memory used by uploads. The types of the columns of
+# the table uploaded to are inferred from the first chunk.
+UPLOAD_ROWS_PER_CHUNK = 100000
+
+# Upload data to databases with the native bulk loaders of the engines supporting
+# them, e.g. COPY for PostgreSQL, rather than with INSERT statements
+DB_BULK_INSERT = False
+
 # CSV Options: key/value pairs that will be passed as argument to DataFrame.to_csv
 # method.
 # note: index option should not be overridden
 CSV_EXPORT = {"encoding": "utf-8"}
 
+# Number of rows serialized at a time when streaming CSV exports of chart data and
+# SQL Lab results. Lower values reduce the memory used by large exports at the cost
+# of more, smaller writes.
+CSV_EXPORT_CHUNK_SIZE = 10000
+
 # Excel Options: key/value pairs that will be passed as argument to DataFrame.to_excel
 # method.
 # note: index option should not be overridden
@@ -890,6 +963,57 @@ TIME_GRAIN_ADDON_EXPRESSIONS: dict[str, dict[str, str]] = {}
 # TIME_GRAIN_JOIN_COLUMN_PRODUCERS = {"P1F": join_producer}
 TIME_GRAIN_JOIN_COLUMN_PRODUCERS: dict[str, Callable[[Series, int], str]] = {}
 
+# Maximum number of time comparison (time shift) queries of a chart that are run
+# concurrently, on a thread pool. Defaults to 1 (or 0), which runs them one after
+# the other; raise it to opt in to concurrent queries, keeping in mind each worker
+# holds its own database connection.
+TIME_OFFSET_QUERIES_MAX_WORKERS = 1
+
+# Maximum number of time comparison queries running concurrently against the same
+# database, across all the charts processed by a web server or worker process.
+TIME_OFFSET_QUERIES_PER_DATABASE_LIMIT = 8
+
+# Fetch the time comparisons of a chart that are missing from the cache with a
+# single query, spanning all their shifted time ranges, instead of one query per
+# offset. Each offset is then sliced out of the result in pandas. This is only done
+# when the time ranges are aligned to the time grain, so the results are the same,
+# and when the spanned range is at most TIME_OFFSET_SINGLE_SCAN_MAX_SPAN_RATIO times
+# the combined length of the shifted ranges; for example "1 week ago" and
+# "1 year ago" on a monthly range are too far apart and keep one query per offset.
+TIME_OFFSET_SINGLE_SCAN = False
+TIME_OFFSET_SINGLE_SCAN_MAX_SPAN_RATIO = 2.0
+
+# Maximum number of chart query contexts accepted by a single request to the batch
+# chart data endpoint, /api/v1/chart/data/batch, used to load all the charts of a
+# dashboard at once.
+CHART_DATA_BATCH_MAX_QUERY_CONTEXTS = 100
+
+# Share the query results of chart data requests, before post-processing, through
+# the data cache (DATA_CACHE_CONFIG), so that charts only differing in their
+# post-processing, e.g. a table and a bar chart over the same GROUP BY, run a single
+# query. Identical queries in flight on other workers are coalesced through a
+# distributed lock held in the data cache for up to the greater of
+# CHART_DATA_QUERY_COALESCING_TIMEOUT and SUPERSET_WEBSERVER_TIMEOUT seconds: one
+# worker runs the query while the others wait for its result, for up to
+# CHART_DATA_QUERY_COALESCING_TIMEOUT seconds before running it themselves.
+CHART_DATA_QUERY_COALESCING = False
+CHART_DATA_QUERY_COALESCING_TIMEOUT = 60
+
+# Seconds chart data query results remain servable after their cache timeout. Expired
+# results are served right away, flagged with `is_stale`, while a single Celery task
+# refreshes them in the background (stale-while-revalidate). Overridden per dataset
+# or database by the `stale_while_revalidate` key of their `extra`. 0 disables it.
+CHART_DATA_STALE_WHILE_REVALIDATE = 0
+
+# Trace where chart data requests spend their time, e.g. checking access, rendering
+# templates, compiling, executing and fetching queries, loading the cache or
+# serializing results, and log the tree of spans as a `chart_data_trace` event of
+# the EVENT_LOGGER. With CHART_DATA_SERVER_TIMING, the total duration of the spans
+# by name is also returned in the Server-Timing header of the responses, shown by the
+# network panel of browsers, which exposes them to all users.
+CHART_DATA_TRACING = False
+CHART_DATA_SERVER_TIMING = False
+
 # ---------------------------------------------------
 # List of viz_types not allowed in your environment
 # For example: Disable pivot table and treemap:
@@ -1003,6 +1127,7 @@ class CeleryConfig:  # pylint: disable=too-few-public-methods
         "superset.tasks.scheduler",
         "superset.tasks.thumbnails",
         "superset.tasks.cache",
+        "superset.tasks.async_queries",
     )
     result_backend = "db+sqlite:///celery_results.sqlite"
     worker_prefetch_multiplier = 1
@@ -1136,6 +1261,11 @@ RESULTS_BACKEND: BaseCache | None = None
 # in order to disable should breaking issues be discovered.
 RESULTS_BACKEND_USE_MSGPACK = True
 
+# When set, async SQL Lab queries fetch their results in chunks of this many rows
+# and write each chunk to the results backend as soon as it is fetched, instead of
+# holding the whole result in memory. Requires RESULTS_BACKEND_USE_MSGPACK.
+SQLLAB_RESULTS_CHUNK_SIZE: int | None = None
+
 # The S3 bucket where you want to store your external hive tables created
 # from CSV files. For example, 'companyname-superset'
 CSV_TO_HIVE_UPLOAD_S3_BUCKET = None
@@ -1316,6 +1446,29 @@ ENGINE_CONTEXT_MANAGER = engine_context_manager
 # as such `create_engine(url, **params)`
 DB_CONNECTION_MUTATOR = None
 
+# Keep the SQLAlchemy engines of the analytics databases in a registry of each
+# process, pooling their connections, instead of creating an engine and opening a
+# connection for every query. Engines are keyed by database, catalog, schema,
+# connection URL and parameters, and effective user when impersonating users, so
+# changing any of them creates a new engine. Editing a database disposes its engines
+# in the process committing the edit only, other processes keep using theirs until
+# they're evicted, which connection URL or parameter changes still bypass. The
+# `engine_pool` key of the extra of a database overrides the settings of its pools,
+# e.g. {"engine_pool": {"pool_size": 10, "max_overflow": 20}}, or opts it out with
+# {"engine_pool": {"enabled": false}}. Connections are pinged before being reused.
+# Databases connected through SSH tunnels are only pooled with SSH_TUNNEL_PERSISTENT.
+# SQL Lab queries never use pooled connections, as their statements may change the
+# state of the session. Pooled connections are only rolled back when returned to the
+# pool, so any other session state, e.g. set by the SQL of virtual datasets, a
+# DB_CONNECTION_MUTATOR or Jinja templates, is kept for the next queries of any user.
+DB_ENGINE_POOLING = False
+DB_ENGINE_POOL_SIZE = 5
+DB_ENGINE_POOL_MAX_OVERFLOW = 10
+# Seconds after which pooled connections are reopened
+DB_ENGINE_POOL_RECYCLE = 3600
+# Number of engines kept by each process, the least recently used being disposed
+DB_ENGINE_REGISTRY_MAX_ENGINES = 100
+
 
 # A callable that is invoked for every invocation of DB Engine Specs
 # which allows for custom validation of the engine URI.
@@ -22,7 +22,7 @@ import dataclasses
 import logging
 import re
 from collections import defaultdict
-from collections.abc import Hashable
+from collections.abc import Hashable, Iterable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from typing import Any, Callable, cast, Optional, Union
@@ -89,6 +89,7 @@ from superset.exceptions import (
     SupersetGenericDBErrorException,
     SupersetSecurityException,
 )
+from superset.extensions import cache_manager
 from superset.jinja_context import (
     BaseTemplateProcessor,
     ExtraCache,
@@ -104,6 +105,7 @@ from superset.models.helpers import (
     QueryResult,
 )
 from superset.models.slice import Slice
+from superset.security.snapshot_cache import rls_filter_snapshots
 from superset.sql_parse import Table
 from superset.superset_typing import (
     AdhocColumn,
@@ -164,6 +166,19 @@ COLUMN_FORM_DATA_PARAMS = [
     "series",
 ]
 
+# the opening delimiters of Jinja expressions, statements and comments
+JINJA_DELIMITER_REGEX = re.compile(r"\{[{%#]")
+
+
+def render_rls_clause(clause: str, template_processor: BaseTemplateProcessor) -> str:
+    """
+    Render the Jinja template of a RLS clause, unless it has none, as most don't,
+    since compiling a template costs more than the rest of applying the clause.
+    """
+    if JINJA_DELIMITER_REGEX.search(clause) is None:
+        return clause
+    return template_processor.process_template(clause)
+
 
 class DatasourceKind(StrEnum):
     VIRTUAL = "virtual"
@@ -413,6 +428,15 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
 
         Used to reduce the payload when loading a dashboard.
         """
+        # pylint: disable=import-outside-toplevel
+        from superset.common.query_context_factory import QueryContextFactory
+
+        # the query contexts of the charts share the datasource and the charts
+        query_context_factory = QueryContextFactory(share_datasources=True)
+        query_context_factory.add_datasource(self)
+        for slc in slices:
+            query_context_factory.add_slice(slc)
+
         data = self.data
         metric_names = set()
         column_names = set()
@@ -443,7 +467,7 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
 
             # for legacy dashboard imports which have the wrong query_context in them
             try:
-                query_context = slc.get_query_context()
+                query_context = slc.get_query_context(query_context_factory)
             except DatasetNotFoundError:
                 query_context = None
 
@@ -735,7 +759,7 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
         try:
             for filter_ in security_manager.get_rls_filters(self):
                 clause = self.text(
-                    f"({template_processor.process_template(filter_.clause)})"
+                    f"({render_rls_clause(filter_.clause, template_processor)})"
                 )
                 if filter_.group_key:
                     filter_groups[filter_.group_key].append(clause)
@@ -745,7 +769,7 @@ class BaseDatasource(AuditMixinNullable, ImportExportMixin):  # pylint: disable=
             if is_feature_enabled("EMBEDDED_SUPERSET"):
                 for rule in security_manager.get_guest_rls_filters(self):
                     clause = self.text(
-                        f"({template_processor.process_template(rule['clause'])})"
+                        f"({render_rls_clause(rule['clause'], template_processor)})"
                     )
                     all_filters.append(clause)
 
@@ -1927,6 +1951,25 @@ class SqlaTable(
             .one()
         )
 
+    @classmethod
+    def get_eager_sqlatable_datasources(
+        cls,
+        datasource_ids: Iterable[int],
+    ) -> list[SqlaTable]:
+        """Returns the SqlaTables of the ids with their database, owners, columns and
+        metrics, in a constant number of queries."""
+        return (
+            db.session.query(cls)
+            .options(
+                sa.orm.joinedload(cls.database),
+                sa.orm.subqueryload(cls.owners),
+                sa.orm.subqueryload(cls.columns),
+                sa.orm.subqueryload(cls.metrics),
+            )
+            .filter(cls.id.in_(datasource_ids))
+            .all()
+        )
+
     @classmethod
     def get_all_datasources(cls) -> list[SqlaTable]:
         qry = db.session.query(cls)
@@ -2036,6 +2079,18 @@ class SqlaTable(
         # Forces an update to the table's changed_on value when a metric or column on the  # noqa: E501
         # table is updated. This busts the cache key for all charts that use the table.
         session.execute(update(SqlaTable).where(SqlaTable.id == target.table.id))
+        cache_manager.local_data_cache.invalidate(target.table.uid)
+
+    @staticmethod
+    def after_update(  # pylint: disable=unused-argument
+        mapper: Mapper,
+        connection: Connection,
+        target: SqlaTable,
+    ) -> None:
+        """
+        Drop the query results of the updated table from the local data cache
+        """
+        cache_manager.local_data_cache.invalidate(target.uid)
 
     @staticmethod
     def after_insert(
@@ -2059,6 +2114,7 @@ class SqlaTable(
         Update dataset permissions after delete
         """
         security_manager.dataset_after_delete(mapper, connection, sqla_table)
+        cache_manager.local_data_cache.invalidate(sqla_table.uid)
 
     def load_database(self: SqlaTable) -> None:
         # somehow the database attribute is not loaded on access
@@ -2070,6 +2126,7 @@ class SqlaTable(
 
 
 sa.event.listen(SqlaTable, "before_update", SqlaTable.before_update)
+sa.event.listen(SqlaTable, "after_update", SqlaTable.after_update)
 sa.event.listen(SqlaTable, "after_insert", SqlaTable.after_insert)
 sa.event.listen(SqlaTable, "after_delete", SqlaTable.after_delete)
 sa.event.listen(SqlMetric, "after_update", SqlaTable.update_column)
@@ -2120,3 +2177,26 @@ class RowLevelSecurityFilter(Model, AuditMixinNullable):
         backref="row_level_security_filters",
     )
     clause = Column(utils.MediumText(), nullable=False)
+
+    @staticmethod
+    def after_change(
+        _mapper: Mapper,
+        _connection: Connection,
+        target: RowLevelSecurityFilter,
+    ) -> None:
+        """
+        Invalidate the cached RLS filters once the filter is changed, including the
+        roles and tables it applies to.
+        """
+        rls_filter_snapshots.invalidate(inspect(target).session)
+
+
+sa.event.listen(
+    RowLevelSecurityFilter, "after_insert", RowLevelSecurityFilter.after_change
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_update", RowLevelSecurityFilter.after_change
+)
+sa.event.listen(
+    RowLevelSecurityFilter, "after_delete", RowLevelSecurityFilter.after_change
+)
@@ -77,8 +77,14 @@ class DashboardDAO(BaseDAO[Dashboard]):
         return dashboard
 
     @staticmethod
-    def get_datasets_for_dashboard(id_or_slug: str) -> list[Any]:
-        dashboard = DashboardDAO.get_by_id_or_slug(id_or_slug)
+    def get_datasets_for_dashboard(
+        id_or_slug_or_dashboard: str | Dashboard,
+    ) -> list[Any]:
+        dashboard = (
+            DashboardDAO.get_by_id_or_slug(id_or_slug_or_dashboard)
+            if isinstance(id_or_slug_or_dashboard, str)
+            else id_or_slug_or_dashboard
+        )
         return dashboard.datasets_trimmed_for_slices()
 
     @staticmethod
@@ -87,8 +93,15 @@ class DashboardDAO(BaseDAO[Dashboard]):
         return dashboard.tabs
 
     @staticmethod
-    def get_charts_for_dashboard(id_or_slug: str) -> list[Slice]:
-        return DashboardDAO.get_by_id_or_slug(id_or_slug).slices
+    def get_charts_for_dashboard(
+        id_or_slug_or_dashboard: str | Dashboard,
+    ) -> list[Slice]:
+        dashboard = (
+            DashboardDAO.get_by_id_or_slug(id_or_slug_or_dashboard)
+            if isinstance(id_or_slug_or_dashboard, str)
+            else id_or_slug_or_dashboard
+        )
+        return dashboard.slices
 
     @staticmethod
     def get_dashboard_changed_on(id_or_slug_or_dashboard: str | Dashboard) -> datetime:
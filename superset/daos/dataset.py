@@ -25,6 +25,7 @@ from sqlalchemy.exc import SQLAlchemyError
 
 from superset.connectors.sqla.models import SqlaTable, SqlMetric, TableColumn
 from superset.daos.base import BaseDAO
+from superset.dashboards.payload_cache import invalidate_dataset_on_commit
 from superset.extensions import db
 from superset.models.core import Database
 from superset.models.dashboard import Dashboard
@@ -225,6 +226,9 @@ class DatasetDAO(BaseDAO[SqlaTable]):
                         "python_date_format is an invalid date/timestamp format."
                     )
 
+        # bulk writes bypass the listeners invalidating the dashboards of the dataset
+        invalidate_dataset_on_commit(model, db.session.connection(), model.id)
+
         if override_columns:
             db.session.query(TableColumn).filter(
                 TableColumn.table_id == model.id
@@ -286,6 +290,9 @@ class DatasetDAO(BaseDAO[SqlaTable]):
         then we delete.
         """
 
+        # bulk writes bypass the listeners invalidating the dashboards of the dataset
+        invalidate_dataset_on_commit(model, db.session.connection(), model.id)
+
         metrics_by_id = {metric.id: metric for metric in model.metrics}
 
         property_metrics_by_id = {
@@ -22,7 +22,7 @@ from io import BytesIO
 from typing import Any, Callable, cast, Optional
 from zipfile import is_zipfile, ZipFile
 
-from flask import g, redirect, request, Response, send_file, url_for
+from flask import current_app, g, redirect, request, Response, send_file, url_for
 from flask_appbuilder import permission_name
 from flask_appbuilder.api import expose, protect, rison, safe
 from flask_appbuilder.hooks import before_request
@@ -32,7 +32,7 @@ from marshmallow import ValidationError
 from werkzeug.wrappers import Response as WerkzeugResponse
 from werkzeug.wsgi import FileWrapper
 
-from superset import db, is_feature_enabled, thumbnail_cache
+from superset import db, is_feature_enabled, security_manager, thumbnail_cache
 from superset.charts.schemas import ChartEntityResponseSchema
 from superset.commands.dashboard.copy import CopyDashboardCommand
 from superset.commands.dashboard.create import CreateDashboardCommand
@@ -79,6 +79,12 @@ from superset.dashboards.filters import (
     DashboardTitleOrSlugFilter,
     FilterRelatedRoles,
 )
+from superset.dashboards.payload_cache import (
+    DashboardPayload,
+    get_etag,
+    get_payload,
+    get_payload_key,
+)
 from superset.dashboards.permalink.types import DashboardPermalinkState
 from superset.dashboards.schemas import (
     CacheScreenshotSchema,
@@ -111,7 +117,7 @@ from superset.tasks.thumbnails import (
 )
 from superset.tasks.utils import get_current_user
 from superset.utils import json
-from superset.utils.core import parse_boolean_string
+from superset.utils.core import get_user_id, parse_boolean_string
 from superset.utils.pdf import build_pdf_from_screenshots
 from superset.utils.screenshots import (
     DashboardScreenshot,
@@ -341,6 +347,39 @@ class DashboardRestApi(BaseSupersetModelRestApi):
             self.appbuilder.app.config["VERSION_SHA"],
         )
 
+    def _payload_response(  # pylint: disable=too-many-arguments
+        self,
+        dash: Dashboard,
+        payload: DashboardPayload,
+        build: Callable[[], Any],
+        variant: str = "",
+        overrides: Optional[dict[str, Any]] = None,
+    ) -> Response:
+        """
+        Respond with a payload of a dashboard, cached and served with a strong ETag
+        when DASHBOARD_PAYLOAD_CACHE is enabled.
+
+        :param build: Builds the payload on a cache miss
+        :param variant: What the payload depends on other than the dashboard
+        :param overrides: Values replacing those of the cached payload
+        """
+        if not current_app.config["DASHBOARD_PAYLOAD_CACHE"]:
+            return self.response(200, result=build())
+
+        key = get_payload_key(dash.id, payload, variant)
+        etag = get_etag(key, *(overrides or {}).values())
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        else:
+            result = get_payload(key, build)
+            response = self.response(
+                200, result={**result, **overrides} if overrides else result
+            )
+        response.set_etag(etag)
+        response.cache_control.private = True
+        response.cache_control.no_cache = True
+        return response
+
     @expose("/<id_or_slug>", methods=("GET",))
     @protect()
     @safe
@@ -382,11 +421,24 @@ class DashboardRestApi(BaseSupersetModelRestApi):
             404:
               $ref: '#/components/responses/404'
         """
-        result = self.dashboard_get_response_schema.dump(dash)
         add_extra_log_payload(
             dashboard_id=dash.id, action=f"{self.__class__.__name__}.get"
         )
-        return self.response(200, result=result)
+        if security_manager.is_guest_user():
+            result = self.dashboard_get_response_schema.dump(dash)
+            return self.response(200, result=result)
+
+        # the thumbnail URL depends on the user, and the humanized dates on the time
+        return self._payload_response(
+            dash,
+            DashboardPayload.DASHBOARD,
+            lambda: self.dashboard_get_response_schema.dump(dash),
+            variant=f"user_{get_user_id()}",
+            overrides={
+                "changed_on_delta_humanized": dash.changed_on_humanized,
+                "created_on_delta_humanized": dash.created_on_humanized,
+            },
+        )
 
     @expose("/<id_or_slug>/datasets", methods=("GET",))
     @protect()
@@ -432,11 +484,17 @@ class DashboardRestApi(BaseSupersetModelRestApi):
               $ref: '#/components/responses/404'
         """
         try:
-            datasets = DashboardDAO.get_datasets_for_dashboard(id_or_slug)
-            result = [
-                self.dashboard_dataset_schema.dump(dataset) for dataset in datasets
-            ]
-            return self.response(200, result=result)
+            dash = DashboardDAO.get_by_id_or_slug(id_or_slug)
+            return self._payload_response(
+                dash,
+                DashboardPayload.DATASETS,
+                lambda: [
+                    self.dashboard_dataset_schema.dump(dataset)
+                    for dataset in DashboardDAO.get_datasets_for_dashboard(dash)
+                ],
+                # guests aren't shown the owners and database of datasets
+                variant="guest" if security_manager.is_guest_user() else "",
+            )
         except (TypeError, ValueError) as err:
             raise DatasetValidationError(err) from err
 
@@ -538,9 +596,15 @@ class DashboardRestApi(BaseSupersetModelRestApi):
               $ref: '#/components/responses/404'
         """
         try:
-            charts = DashboardDAO.get_charts_for_dashboard(id_or_slug)
-            result = [self.chart_entity_response_schema.dump(chart) for chart in charts]
-            return self.response(200, result=result)
+            dash = DashboardDAO.get_by_id_or_slug(id_or_slug)
+            return self._payload_response(
+                dash,
+                DashboardPayload.CHARTS,
+                lambda: [
+                    self.chart_entity_response_schema.dump(chart)
+                    for chart in DashboardDAO.get_charts_for_dashboard(dash)
+                ],
+            )
         except DashboardAccessDeniedError:
             return self.response_403()
         except DashboardNotFoundError:
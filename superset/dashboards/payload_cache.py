@@ -0,0 +1,237 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Cache of the payloads loaded when opening a dashboard.
+
+The payloads of a dashboard are cached under a version of the dashboard, itself
+cached, which is dropped once a transaction updating the dashboard, one of its charts
+or datasets, or its tags, commits.
+"""
+
+from __future__ import annotations
+
+import logging
+import uuid
+from collections.abc import Iterable
+from typing import Any, Callable
+
+import sqlalchemy as sa
+from sqlalchemy.engine.base import Connection
+from sqlalchemy.orm import Mapper, Session
+
+from superset import app
+from superset.connectors.sqla.models import SqlaTable, SqlMetric, TableColumn
+from superset.extensions import cache_manager
+from superset.models.dashboard import Dashboard, dashboard_slices
+from superset.models.slice import Slice
+from superset.tags.models import ObjectType, TaggedObject
+from superset.utils.backports import StrEnum
+from superset.utils.core import DatasourceType
+from superset.utils.hashing import md5_sha_from_str
+
+config = app.config
+logger = logging.getLogger(__name__)
+
+# Key of the session info holding the dashboards to invalidate on commit
+INVALIDATIONS_INFO_KEY = "dashboard_payload_invalidations"
+
+
+class DashboardPayload(StrEnum):
+    DASHBOARD = "dashboard"
+    CHARTS = "charts"
+    DATASETS = "datasets"
+
+
+def get_version_key(dashboard_id: int) -> str:
+    return f"dashboard_payload_version__{dashboard_id}"
+
+
+def get_version(dashboard_id: int) -> str:
+    """
+    Get the version of the cached payloads of a dashboard, which changes whenever
+    they are invalidated.
+    """
+    cache = cache_manager.cache
+    key = get_version_key(dashboard_id)
+    if version := cache.get(key):
+        return version
+
+    version = uuid.uuid4().hex
+    # another process may have versioned the dashboard meanwhile
+    if not cache.add(key, version, timeout=config["DASHBOARD_PAYLOAD_CACHE_TIMEOUT"]):
+        version = cache.get(key) or version
+    return version
+
+
+def get_payload_key(
+    dashboard_id: int,
+    payload: DashboardPayload,
+    variant: str = "",
+) -> str:
+    """
+    Get the cache key of a payload of the current version of a dashboard.
+
+    :param variant: What the payload depends on other than the dashboard, e.g. the user
+    """
+    version = get_version(dashboard_id)
+    return f"dashboard_payload__{dashboard_id}__{version}__{payload}__{variant}"
+
+
+def get_payload(key: str, build: Callable[[], Any]) -> Any:
+    """
+    Get a cached payload, building and caching it on a miss.
+    """
+    cache = cache_manager.cache
+    if (payload := cache.get(key)) is not None:
+        return payload
+
+    payload = build()
+    cache.set(key, payload, timeout=config["DASHBOARD_PAYLOAD_CACHE_TIMEOUT"])
+    return payload
+
+
+def get_etag(key: str, *extra: Any) -> str:
+    """
+    Get the ETag of a payload, from its cache key and any value added to it.
+    """
+    return md5_sha_from_str("\n".join([key, *map(str, extra)]))
+
+
+def invalidate(dashboard_ids: Iterable[int]) -> None:
+    """
+    Invalidate the cached payloads of dashboards.
+    """
+    if keys := [get_version_key(dashboard_id) for dashboard_id in dashboard_ids]:
+        cache_manager.cache.delete_many(*keys)
+
+
+def invalidate_on_commit(target: Any, dashboard_ids: Iterable[int]) -> None:
+    """
+    Invalidate the cached payloads of dashboards once the transaction changing
+    `target` commits, so that they aren't cached again from the data it changes
+    before it's visible.
+    """
+    if config["DASHBOARD_PAYLOAD_CACHE"] and (session := sa.orm.object_session(target)):
+        session.info.setdefault(INVALIDATIONS_INFO_KEY, set()).update(dashboard_ids)
+
+
+def get_dashboard_ids(connection: Connection, where: Any) -> set[int]:
+    """
+    Get the ids of the dashboards of the charts matching a clause.
+    """
+    query = (
+        sa.select(dashboard_slices.c.dashboard_id)
+        .select_from(
+            dashboard_slices.join(Slice, Slice.id == dashboard_slices.c.slice_id)
+        )
+        .where(where)
+        .distinct()
+    )
+    return {row[0] for row in connection.execute(query)}
+
+
+def on_dashboard_change(
+    _mapper: Mapper,
+    _connection: Connection,
+    target: Dashboard,
+) -> None:
+    invalidate_on_commit(target, [target.id])
+
+
+def on_chart_change(_mapper: Mapper, connection: Connection, target: Slice) -> None:
+    if config["DASHBOARD_PAYLOAD_CACHE"]:
+        invalidate_on_commit(
+            target, get_dashboard_ids(connection, Slice.id == target.id)
+        )
+
+
+def invalidate_dataset_on_commit(
+    target: Any,
+    connection: Connection,
+    dataset_id: int,
+) -> None:
+    """
+    Invalidate the cached payloads of the dashboards of a dataset once the
+    transaction changing `target` commits.
+    """
+    if config["DASHBOARD_PAYLOAD_CACHE"]:
+        where = sa.and_(
+            Slice.datasource_type == DatasourceType.TABLE,
+            Slice.datasource_id == dataset_id,
+        )
+        invalidate_on_commit(target, get_dashboard_ids(connection, where))
+
+
+def on_dataset_change(
+    _mapper: Mapper,
+    connection: Connection,
+    target: SqlaTable,
+) -> None:
+    invalidate_dataset_on_commit(target, connection, target.id)
+
+
+def on_column_change(
+    _mapper: Mapper,
+    connection: Connection,
+    target: SqlMetric | TableColumn,
+) -> None:
+    invalidate_dataset_on_commit(target, connection, target.table_id)
+
+
+def on_tag_change(
+    _mapper: Mapper,
+    _connection: Connection,
+    target: TaggedObject,
+) -> None:
+    if target.object_type == ObjectType.dashboard:
+        invalidate_on_commit(target, [target.object_id])
+
+
+def on_commit(session: Session) -> None:
+    if dashboard_ids := session.info.pop(INVALIDATIONS_INFO_KEY, None):
+        try:
+            invalidate(dashboard_ids)
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning("Could not invalidate the payloads of dashboards")
+            logger.exception(ex)
+
+
+def on_rollback(session: Session) -> None:
+    session.info.pop(INVALIDATIONS_INFO_KEY, None)
+
+
+def register_sqla_event_listeners() -> None:
+    """
+    Register the listeners invalidating the cached payloads of dashboards, once per
+    process.
+    """
+    if sa.event.contains(Session, "after_commit", on_commit):
+        return
+
+    sa.event.listen(Dashboard, "after_update", on_dashboard_change)
+    sa.event.listen(Dashboard, "after_delete", on_dashboard_change)
+    # the charts of a dashboard are unlinked before the chart or dataset is deleted
+    sa.event.listen(Slice, "after_update", on_chart_change)
+    sa.event.listen(Slice, "before_delete", on_chart_change)
+    sa.event.listen(SqlaTable, "after_update", on_dataset_change)
+    sa.event.listen(SqlaTable, "before_delete", on_dataset_change)
+    sa.event.listen(SqlMetric, "after_update", on_column_change)
+    sa.event.listen(TableColumn, "after_update", on_column_change)
+    sa.event.listen(TaggedObject, "after_insert", on_tag_change)
+    sa.event.listen(TaggedObject, "after_delete", on_tag_change)
+    sa.event.listen(Session, "after_commit", on_commit)
+    sa.event.listen(Session, "after_rollback", on_rollback)
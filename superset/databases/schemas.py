@@ -163,7 +163,14 @@ extra_description = markdown(
     "7. The ``disable_drill_to_detail`` field is a boolean specifying whether or not"
     "drill to detail is disabled for the database."
     "8. The ``allow_multi_catalog`` indicates if the database allows changing "
-    "the default catalog when running queries and creating datasets.",
+    "the default catalog when running queries and creating datasets.<br/>"
+    "9. The ``stale_while_revalidate`` field is the number of seconds chart data "
+    "remains servable after its cache timeout, while it is refreshed in the "
+    "background. Datasets can override it in their own extra.<br/>"
+    "10. The ``engine_pool`` object sets the ``pool_size``, ``max_overflow`` and "
+    "``pool_recycle`` of the connection pools of the database when "
+    "``DB_ENGINE_POOLING`` is enabled, or opts the database out of pooling with "
+    '**"engine_pool": {"enabled": false}**.',
     True,
 )
 get_export_ids_schema = {"type": "array", "items": {"type": "integer"}}
@@ -825,6 +832,7 @@ class ImportV1DatabaseExtraSchema(Schema):
 
     metadata_params = fields.Dict(keys=fields.Str(), values=fields.Raw())
     engine_params = fields.Dict(keys=fields.Str(), values=fields.Raw())
+    engine_pool = fields.Dict(keys=fields.Str(), values=fields.Raw())
     metadata_cache_timeout = fields.Dict(keys=fields.Str(), values=fields.Integer())
     schemas_allowed_for_csv_upload = fields.List(fields.String())
     cost_estimate_enabled = fields.Boolean()
@@ -21,7 +21,9 @@ from __future__ import annotations
 import logging
 import re
 import warnings
+from collections.abc import Iterable, Iterator, Sequence
 from datetime import datetime
+from operator import itemgetter
 from re import Match, Pattern
 from typing import (
     Any,
@@ -37,6 +39,7 @@ from urllib.parse import urlencode, urljoin
 from uuid import uuid4
 
 import pandas as pd
+import pyarrow as pa
 import requests
 import sqlparse
 from apispec import APISpec
@@ -48,7 +51,7 @@ from flask_babel import gettext as __, lazy_gettext as _
 from marshmallow import fields, Schema
 from marshmallow.validate import Range
 from sqlalchemy import column, select, types
-from sqlalchemy.engine.base import Engine
+from sqlalchemy.engine.base import Connection, Engine
 from sqlalchemy.engine.interfaces import Compiled, Dialect
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
@@ -66,6 +69,7 @@ from superset.exceptions import DisallowedSQLFunction, OAuth2Error, OAuth2Redire
 from superset.sql.parse import BaseSQLStatement, SQLScript, Table
 from superset.sql_parse import ParsedQuery
 from superset.superset_typing import (
+    DbapiDescription,
     OAuth2ClientConfig,
     OAuth2State,
     OAuth2TokenResponse,
@@ -80,6 +84,8 @@ from superset.utils.network import is_hostname_valid, is_port_open
 from superset.utils.oauth2 import encode_oauth2_state
 
 if TYPE_CHECKING:
+    from pandas.io.sql import SQLTable
+
     from superset.connectors.sqla.models import TableColumn
     from superset.databases.schemas import TableMetadataResponse
     from superset.models.core import Database
@@ -344,6 +350,12 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # type-specific functions to mutate values received from the database.
     # Needed on certain databases that return values in an unexpected format
     column_type_mutators: dict[TypeEngine, Callable[[Any], Any]] = {}
+    # vectorized implementations of ``column_type_mutators``, mutating all the values
+    # of a column at once, used in place of the mutators of the same types. They may
+    # return the list of values they're passed if none of them needs mutating
+    column_type_vectorized_mutators: dict[
+        TypeEngine, Callable[[list[Any]], Sequence[Any]]
+    ] = {}
 
     # Does database support join-free timeslot grouping
     time_groupby_inline = False
@@ -410,6 +422,10 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
     # if True, database will be listed as option in the upload file form
     supports_file_upload = True
 
+    # Whether results can be fetched incrementally with ``cursor.fetchmany``. Engines
+    # that post-process results in a custom ``fetch_data`` should disable this.
+    supports_chunked_fetch = True
+
     # Is the DB engine spec able to change the default schema? This requires implementing  # noqa: E501
     # a custom `adjust_engine_params` method.
     supports_dynamic_schema = False
@@ -973,32 +989,133 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
             if cls.limit_method == LimitMethod.FETCH_MANY and limit:
                 return cursor.fetchmany(limit)
             data = cursor.fetchall()
-            description = cursor.description or []
-            # Create a mapping between column name and a mutator function to normalize
-            # values with. The first two items in the description row are
-            # the column name and type.
-            column_mutators = {
-                row[0]: func
-                for row in description
-                if (
-                    func := cls.column_type_mutators.get(
-                        type(cls.get_sqla_column_type(cls.get_datatype(row[1])))
-                    )
-                )
-            }
-            if column_mutators:
-                indexes = {row[0]: idx for idx, row in enumerate(description)}
-                for row_idx, row in enumerate(data):
-                    new_row = list(row)
-                    for col, func in column_mutators.items():
-                        col_idx = indexes[col]
-                        new_row[col_idx] = func(row[col_idx])
-                    data[row_idx] = tuple(new_row)
-
-            return data
+            return cls._mutate_data(data, cursor.description or [])
         except Exception as ex:
             raise cls.get_dbapi_mapped_exception(ex) from ex
 
+    @classmethod
+    def fetch_data_chunks(
+        cls,
+        cursor: Any,
+        chunk_size: int,
+        limit: int | None = None,
+    ) -> Iterator[list[tuple[Any, ...]]]:
+        """
+        Fetch the results of a cursor in chunks of at most ``chunk_size`` rows.
+
+        Engines that don't support chunked fetching return all the rows at once.
+
+        :param cursor: Cursor instance
+        :param chunk_size: Maximum number of rows in each chunk
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Iterator over the chunks of the result
+        """
+        if not cls.supports_chunked_fetch:
+            yield cls.fetch_data(cursor, limit)
+            return
+
+        if cls.arraysize:
+            cursor.arraysize = cls.arraysize
+        if not cursor.description:
+            return
+
+        fetched = 0
+        while limit is None or fetched < limit:
+            size = chunk_size if limit is None else min(chunk_size, limit - fetched)
+            try:
+                data = cursor.fetchmany(size)
+            except Exception as ex:
+                raise cls.get_dbapi_mapped_exception(ex) from ex
+            if not data:
+                return
+            fetched += len(data)
+            yield cls._mutate_data(data, cursor.description)
+
+    @classmethod
+    def _mutate_data(
+        cls,
+        data: list[tuple[Any, ...]],
+        description: DbapiDescription,
+    ) -> list[tuple[Any, ...]]:
+        """
+        Apply the ``column_type_mutators`` of the engine to fetched rows.
+
+        Each mutated column is gathered from the rows and mutated at once, with the
+        vectorized implementation of its mutator when there is one, and the rows are
+        then rebuilt in a single pass.
+
+        This is done on the rows rather than on the columns built by
+        ``SupersetResultSet``, as the rows returned by ``fetch_data`` are expected to
+        be mutated, both by engine specs post-processing them and by callers using
+        them directly.
+        """
+        if not data:
+            return data
+
+        # The second item in the description row is the column type
+        columns: dict[int, Sequence[Any]] = {}
+        for idx, col in enumerate(description):
+            sqla_type = type(cls.get_sqla_column_type(cls.get_datatype(col[1])))
+            if vectorized_func := cls.column_type_vectorized_mutators.get(sqla_type):
+                values = [row[idx] for row in data]
+                # the values are returned as is when none of them is mutated
+                if (mutated := vectorized_func(values)) is not values:
+                    columns[idx] = mutated
+            elif func := cls.column_type_mutators.get(sqla_type):
+                columns[idx] = [func(row[idx]) for row in data]
+
+        if not columns:
+            return data
+
+        return list(
+            zip(
+                *(
+                    columns[idx] if idx in columns else map(itemgetter(idx), data)
+                    for idx in range(len(description))
+                )
+            )
+        )
+
+    @classmethod
+    def fetch_arrow_table(
+        cls, cursor: Any, limit: int | None = None
+    ) -> pa.Table | None:
+        """
+        Fetch the results of a cursor as an Arrow table.
+
+        Engines whose drivers can return Arrow data natively should override this
+        method, so that results skip the conversion from Python tuples. Returning
+        ``None`` signals that the driver can't, and callers fall back to
+        ``fetch_data``.
+
+        :param cursor: Cursor instance
+        :param limit: Maximum number of rows to be returned by the cursor
+        :return: Result of query as an Arrow table, or ``None``
+        """
+        return None
+
+    @staticmethod
+    def take_arrow_batches(
+        batches: Iterable[pa.RecordBatch | pa.Table],
+        limit: int,
+    ) -> list[pa.RecordBatch | pa.Table]:
+        """
+        Take the first ``limit`` rows of a stream of Arrow batches, without reading
+        the batches past them.
+
+        :param batches: The batches, e.g. read from a cursor
+        :param limit: Maximum number of rows to take
+        :return: The batches holding the first ``limit`` rows
+        """
+        taken: list[pa.RecordBatch | pa.Table] = []
+        remaining = limit
+        for batch in batches:
+            taken.append(batch.slice(0, remaining))
+            remaining -= batch.num_rows
+            if remaining <= 0:
+                break
+        return taken
+
     @classmethod
     def expand_data(
         cls, columns: list[ResultSetColumnType], data: list[dict[Any, Any]]
@@ -1282,23 +1399,112 @@ class BaseEngineSpec:  # pylint: disable=too-many-public-methods
         :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
         """
 
-        to_sql_kwargs["name"] = table.table
+        with cls.get_engine(
+            database,
+            catalog=table.catalog,
+            schema=table.schema,
+        ) as engine:
+            cls.update_to_sql_kwargs(engine, table, to_sql_kwargs)
+            df.to_sql(con=engine, **to_sql_kwargs)
 
-        if table.schema:
-            # Only add schema when it is preset and non-empty.
-            to_sql_kwargs["schema"] = table.schema
+    @classmethod
+    def dfs_to_sql(
+        cls,
+        database: Database,
+        table: Table,
+        dfs: Iterable[pd.DataFrame],
+        to_sql_kwargs: dict[str, Any],
+    ) -> None:
+        """
+        Upload data from Pandas DataFrames, e.g. the chunks of a file, to a database.
+
+        The table is created from the first DataFrame as per `if_exists`, and the
+        others are appended to it. Engines uploading with `pandas.DataFrame.to_sql`
+        upload all of them in a single transaction, while engines overriding
+        `df_to_sql` upload each of them with it.
+
+        Note this method does not create metadata for the table.
+
+        :param database: The database to upload the data to
+        :param table: The table to upload the data to
+        :param dfs: The dataframes with data to be uploaded
+        :param to_sql_kwargs: The kwargs to be passed to pandas.DataFrame.to_sql` method
+        """
+        to_sql_kwargs = dict(to_sql_kwargs)
+        if getattr(cls.df_to_sql, "__func__", None) is not (
+            BaseEngineSpec.df_to_sql.__func__  # type: ignore[attr-defined]
+        ):
+            for df in dfs:
+                cls.df_to_sql(database, table, df, dict(to_sql_kwargs))
+                to_sql_kwargs["if_exists"] = "append"
+            return
 
         with cls.get_engine(
             database,
             catalog=table.catalog,
             schema=table.schema,
         ) as engine:
-            if (
-                engine.dialect.supports_multivalues_insert
-                or cls.supports_multivalues_insert
-            ):
-                to_sql_kwargs["method"] = "multi"
-            df.to_sql(con=engine, **to_sql_kwargs)
+            cls.update_to_sql_kwargs(engine, table, to_sql_kwargs)
+            with engine.begin() as connection:
+                for df in dfs:
+                    df.to_sql(con=connection, **to_sql_kwargs)
+                    to_sql_kwargs["if_exists"] = "append"
+
+    @classmethod
+    def update_to_sql_kwargs(
+        cls,
+        engine: Engine,
+        table: Table,
+        to_sql_kwargs: dict[str, Any],
+    ) -> None:
+        """
+        Set the kwargs of the `pandas.DataFrame.to_sql` method uploading to a table.
+        """
+        to_sql_kwargs["name"] = table.table
+
+        if table.schema:
+            # Only add schema when it is preset and non-empty.
+            to_sql_kwargs["schema"] = table.schema
+
+        if current_app.config["DB_BULK_INSERT"] and cls.supports_bulk_insert(engine):
+            to_sql_kwargs["method"] = cls.bulk_insert
+        elif (
+            engine.dialect.supports_multivalues_insert
+            or cls.supports_multivalues_insert
+        ):
+            to_sql_kwargs["method"] = "multi"
+
+    @classmethod
+    def supports_bulk_insert(cls, engine: Engine) -> bool:  # pylint: disable=unused-argument
+        """
+        Does the engine implement `bulk_insert` for the driver of an engine?
+        """
+        return False
+
+    @classmethod
+    def bulk_insert(
+        cls,
+        table: SQLTable,
+        connection: Connection,
+        keys: list[str],
+        data_iter: Iterable[tuple[Any, ...]],
+    ) -> int | None:
+        """
+        Insert rows into a table with the native bulk loader of the engine, e.g.
+        `COPY`, rather than with `INSERT` statements.
+
+        This is the `method` of `pandas.DataFrame.to_sql` for engines supporting it,
+        called with each chunk of the DataFrame. Like the default method of pandas,
+        the base implementation inserts the rows with a single `executemany`.
+
+        :param table: The pandas table inserted into
+        :param connection: The connection inserting the rows
+        :param keys: The names of the columns
+        :param data_iter: The rows
+        :return: The number of rows inserted, if known
+        """
+        data = [dict(zip(keys, row)) for row in data_iter]
+        return connection.execute(table.table.insert(), data).rowcount
 
     @classmethod
     def convert_dttm(  # pylint: disable=unused-argument
@@ -123,6 +123,8 @@ class BigQueryEngineSpec(BaseEngineSpec):  # pylint: disable=too-many-public-met
     # BigQuery doesn't maintain context when running multiple statements in the
     # same cursor, so we need to run all statements at once
     run_multiple_statements_as_one = True
+    # rows are converted from `google.cloud.bigquery.table.Row` in `fetch_data`
+    supports_chunked_fetch = False
 
     allows_hidden_cc_in_orderby = True
 
@@ -19,6 +19,7 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Any, TYPE_CHECKING, TypedDict, Union
 
+import pyarrow as pa
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from flask_babel import gettext as __
@@ -216,6 +217,19 @@ class DatabricksDynamicBaseEngineSpec(BasicParametersMixin, DatabricksBaseEngine
 
         return extra
 
+    @classmethod
+    def fetch_arrow_table(
+        cls, cursor: Any, limit: int | None = None
+    ) -> pa.Table | None:
+        if not hasattr(cursor, "fetchall_arrow"):
+            return None
+
+        try:
+            # only the first rows are fetched
+            return cursor.fetchmany_arrow(limit) if limit else cursor.fetchall_arrow()
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
     @classmethod
     def get_table_names(
         cls,
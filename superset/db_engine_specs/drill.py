@@ -37,6 +37,8 @@ class DrillEngineSpec(BaseEngineSpec):
     default_driver = "sadrill"
 
     supports_dynamic_schema = True
+    # empty results raise an error that is handled in `fetch_data`
+    supports_chunked_fetch = False
 
     _time_grain_expressions = {
         None: "{col}",
@@ -17,15 +17,19 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 from datetime import datetime
 from re import Pattern
 from typing import Any, TYPE_CHECKING, TypedDict
+from uuid import uuid4
 
+import pyarrow as pa
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from flask_babel import gettext as __
 from marshmallow import fields, Schema
 from sqlalchemy import types
+from sqlalchemy.engine.base import Connection, Engine
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 
@@ -37,6 +41,8 @@ from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
 
 if TYPE_CHECKING:
     # prevent circular imports
+    from pandas.io.sql import SQLTable
+
     from superset.models.core import Database
 
 
@@ -236,6 +242,71 @@ class DuckDBEngineSpec(DuckDBParametersMixin, BaseEngineSpec):
     ) -> set[str]:
         return set(inspector.get_table_names(schema))
 
+    @classmethod
+    def fetch_arrow_table(
+        cls, cursor: Any, limit: int | None = None
+    ) -> pa.Table | None:
+        if not hasattr(cursor, "fetch_arrow_table"):
+            return None
+
+        try:
+            if not limit:
+                return cursor.fetch_arrow_table()
+
+            # only the batches holding the first rows are read
+            reader = cursor.fetch_record_batch(rows_per_batch=limit)
+            return pa.Table.from_batches(
+                cls.take_arrow_batches(reader, limit),
+                schema=reader.schema,
+            )
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
+    @classmethod
+    def supports_bulk_insert(cls, engine: Engine) -> bool:
+        return True
+
+    @classmethod
+    def bulk_insert(
+        cls,
+        table: SQLTable,
+        connection: Connection,
+        keys: list[str],
+        data_iter: Iterable[tuple[Any, ...]],
+    ) -> int | None:
+        """
+        Insert rows by registering them as an Arrow table, which DuckDB scans
+        natively in a single `INSERT INTO ... SELECT`, or with `executemany` when
+        their values can't be converted to Arrow, e.g. columns of mixed types.
+        """
+        rows = list(data_iter)
+        if not rows:
+            return 0
+        try:
+            arrow_table = pa.Table.from_arrays(
+                [pa.array(column) for column in zip(*rows)],
+                names=keys,
+            )
+        except (
+            pa.lib.ArrowInvalid,
+            pa.lib.ArrowTypeError,
+            pa.lib.ArrowNotImplementedError,
+        ):
+            return super().bulk_insert(table, connection, keys, rows)
+
+        preparer = connection.dialect.identifier_preparer
+        view = f"superset_bulk_insert_{uuid4().hex}"
+        column_names = ", ".join(preparer.quote(key) for key in keys)
+        connection.connection.register(view, arrow_table)
+        try:
+            connection.exec_driver_sql(
+                f"INSERT INTO {preparer.format_table(table.table)} ({column_names}) "  # noqa: S608
+                f"SELECT {column_names} FROM {view}"
+            )
+        finally:
+            connection.connection.unregister(view)
+        return len(arrow_table)
+
     @staticmethod
     def get_extra_params(database: Database) -> dict[str, Any]:
         """
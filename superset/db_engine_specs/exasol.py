@@ -26,6 +26,8 @@ class ExasolEngineSpec(BaseEngineSpec):  # pylint: disable=abstract-method
     engine = "exa"
     engine_name = "Exasol"
     max_column_name_length = 128
+    # rows are unpacked from `pyodbc.Row` in `fetch_data`
+    supports_chunked_fetch = False
 
     # Exasol's DATE_TRUNC function is PostgresSQL compatible
     _time_grain_expressions = {
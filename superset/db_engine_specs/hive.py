@@ -99,6 +99,9 @@ class HiveEngineSpec(PrestoEngineSpec):
 
     supports_dynamic_schema = True
 
+    # results are fetched after polling the state of the operation
+    supports_chunked_fetch = False
+
     # When running `SHOW FUNCTIONS`, what is the name of the column with the
     # function names?
     _show_functions_column = "tab_name"
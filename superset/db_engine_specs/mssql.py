@@ -57,6 +57,8 @@ class MssqlEngineSpec(BaseEngineSpec):
     allows_cte_in_subquery = False
     allow_limit_clause = False
     supports_multivalues_insert = True
+    # rows are unpacked from `pyodbc.Row` in `fetch_data`
+    supports_chunked_fetch = False
 
     _time_grain_expressions = {
         None: "{col}",
@@ -16,10 +16,12 @@
 # under the License.
 import contextlib
 import re
+from collections.abc import Iterable, Sequence
 from datetime import datetime
 from decimal import Decimal
+from itertools import islice
 from re import Pattern
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, TYPE_CHECKING
 from urllib import parse
 
 from flask_babel import gettext as __
@@ -36,6 +38,7 @@ from sqlalchemy.dialects.mysql import (
     TINYINT,
     TINYTEXT,
 )
+from sqlalchemy.engine.base import Connection, Engine
 from sqlalchemy.engine.url import URL
 
 from superset.constants import TimeGrain
@@ -44,6 +47,9 @@ from superset.errors import SupersetErrorType
 from superset.models.sql_lab import Query
 from superset.utils.core import GenericDataType
 
+if TYPE_CHECKING:
+    from pandas.io.sql import SQLTable
+
 # Regular expressions to catch custom errors
 CONNECTION_ACCESS_DENIED_REGEX = re.compile(
     "Access denied for user '(?P<username>.*?)'@'(?P<hostname>.*?)'"
@@ -75,6 +81,9 @@ class MySQLEngineSpec(BasicParametersMixin, BaseEngineSpec):
 
     supports_dynamic_schema = True
 
+    # Number of rows of the batches inserted by `bulk_insert`
+    bulk_insert_batch_size = 10000
+
     column_type_mappings = (
         (
             re.compile(r"^int.*", re.IGNORECASE),
@@ -130,6 +139,16 @@ class MySQLEngineSpec(BasicParametersMixin, BaseEngineSpec):
     column_type_mutators: dict[types.TypeEngine, Callable[[Any], Any]] = {
         DECIMAL: lambda val: Decimal(val) if isinstance(val, str) else val
     }
+    column_type_vectorized_mutators: dict[
+        types.TypeEngine, Callable[[list[Any]], Sequence[Any]]
+    ] = {
+        # drivers returning decimals as such are left alone
+        DECIMAL: lambda values: (
+            [Decimal(val) if isinstance(val, str) else val for val in values]
+            if any(isinstance(val, str) for val in values)
+            else values
+        )
+    }
 
     _time_grain_expressions = {
         None: "{col}",
@@ -298,3 +317,27 @@ class MySQLEngineSpec(BasicParametersMixin, BaseEngineSpec):
             return False
 
         return True
+
+    @classmethod
+    def supports_bulk_insert(cls, engine: Engine) -> bool:
+        return True
+
+    @classmethod
+    def bulk_insert(
+        cls,
+        table: "SQLTable",
+        connection: Connection,
+        keys: list[str],
+        data_iter: Iterable[tuple[Any, ...]],
+    ) -> Optional[int]:
+        """
+        Insert rows with `executemany`, in batches of `bulk_insert_batch_size` rows,
+        which the drivers send as multi-row `INSERT` statements up to the
+        `max_allowed_packet` of the server, without compiling statements with a
+        parameter per value.
+        """
+        rows = iter(data_iter)
+        count = 0
+        while batch := list(islice(rows, cls.bulk_insert_batch_size)):
+            count += super().bulk_insert(table, connection, keys, batch) or 0
+        return count
@@ -232,6 +232,8 @@ class OcientEngineSpec(BaseEngineSpec):
     allows_cte_in_subquery = False
     # Ocient does not support cte names starting with underscores
     cte_alias = "cte__"
+    # rows are sanitized and query ids cleaned up in `fetch_data`
+    supports_chunked_fetch = False
     # Store mapping of superset Query id -> Ocient ID
     # These are inserted into the cache when executing the query
     # They are then removed, either upon cancellation or query completion
@@ -17,8 +17,11 @@
 
 from __future__ import annotations
 
+import io
 import logging
 import re
+from collections.abc import Iterable
+from contextlib import closing
 from datetime import datetime
 from re import Pattern
 from typing import Any, TYPE_CHECKING
@@ -26,6 +29,7 @@ from typing import Any, TYPE_CHECKING
 from flask_babel import gettext as __
 from sqlalchemy.dialects.postgresql import DOUBLE_PRECISION, ENUM, JSON
 from sqlalchemy.dialects.postgresql.base import PGInspector
+from sqlalchemy.engine.base import Connection, Engine
 from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 from sqlalchemy.types import Date, DateTime, String
@@ -40,10 +44,26 @@ from superset.utils import core as utils, json
 from superset.utils.core import GenericDataType
 
 if TYPE_CHECKING:
+    from pandas.io.sql import SQLTable
+
     from superset.models.core import Database  # pragma: no cover
 
 logger = logging.getLogger()
 
+# Characters escaped in the text format of COPY
+COPY_TEXT_ESCAPES = str.maketrans({"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"})
+
+
+def to_copy_text(value: Any) -> str:
+    """
+    Format a value in the text format of COPY.
+    """
+    if value is None:
+        return "\\N"
+    if isinstance(value, bytes):
+        value = "\\x" + value.hex()
+    return str(value).translate(COPY_TEXT_ESCAPES)
+
 
 # Regular expressions to catch custom errors
 CONNECTION_INVALID_USERNAME_REGEX = re.compile(
@@ -479,3 +499,33 @@ WHERE datistemplate = false;
             return False
 
         return True
+
+    @classmethod
+    def supports_bulk_insert(cls, engine: Engine) -> bool:
+        return engine.dialect.driver == "psycopg2"
+
+    @classmethod
+    def bulk_insert(
+        cls,
+        table: SQLTable,
+        connection: Connection,
+        keys: list[str],
+        data_iter: Iterable[tuple[Any, ...]],
+    ) -> int | None:
+        """
+        Insert rows with `COPY FROM STDIN`, streaming them in its text format.
+        """
+        preparer = connection.dialect.identifier_preparer
+        columns = ", ".join(preparer.quote(key) for key in keys)
+        buffer = io.StringIO()
+        for row in data_iter:
+            buffer.write("\t".join(map(to_copy_text, row)))
+            buffer.write("\n")
+        buffer.seek(0)
+
+        with closing(connection.connection.cursor()) as cursor:
+            cursor.copy_expert(
+                f"COPY {preparer.format_table(table.table)} ({columns}) FROM STDIN",
+                buffer,
+            )
+            return cursor.rowcount
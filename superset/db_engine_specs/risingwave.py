@@ -14,6 +14,8 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
+from sqlalchemy.engine.base import Engine
+
 from superset.db_engine_specs.postgres import PostgresEngineSpec
 
 
@@ -21,3 +23,8 @@ class RisingWaveDbEngineSpec(PostgresEngineSpec):
     engine = "risingwave"
     engine_name = "RisingWave"
     default_driver = ""
+
+    @classmethod
+    def supports_bulk_insert(cls, engine: Engine) -> bool:
+        # RisingWave doesn't support COPY FROM STDIN
+        return False
@@ -21,6 +21,7 @@ from re import Pattern
 from typing import Any, Optional, TYPE_CHECKING, TypedDict
 from urllib import parse
 
+import pyarrow as pa
 from apispec import APISpec
 from apispec.ext.marshmallow import MarshmallowPlugin
 from cryptography.hazmat.backends import default_backend
@@ -142,6 +143,32 @@ class SnowflakeEngineSpec(PostgresBaseEngineSpec):
 
         return extra
 
+    @classmethod
+    def fetch_arrow_table(
+        cls, cursor: Any, limit: Optional[int] = None
+    ) -> Optional[pa.Table]:
+        """
+        Fetch results in the Arrow format the connector downloads them in.
+
+        The connector returns ``None`` when the query produced no rows, in which
+        case the caller falls back to ``fetch_data``.
+        """
+        if not hasattr(cursor, "fetch_arrow_all"):
+            return None
+
+        try:
+            if not limit:
+                return cursor.fetch_arrow_all()
+
+            # only the batches holding the first rows are downloaded
+            if not (
+                tables := cls.take_arrow_batches(cursor.fetch_arrow_batches(), limit)
+            ):
+                return None
+            return pa.concat_tables(tables)
+        except Exception as ex:
+            raise cls.get_dbapi_mapped_exception(ex) from ex
+
     @classmethod
     def adjust_engine_params(
         cls,
@@ -72,6 +72,71 @@ def KeyValueDistributedLock(  # pylint: disable=invalid-name  # noqa: N802
         logger.debug("Lock on namespace %s for key %s already taken", namespace, key)
         raise CreateKeyValueDistributedLockFailedException("Lock already taken") from ex
 
-    yield key
-    DeleteDistributedLock(namespace=namespace, params=kwargs).run()
-    logger.debug("Removed lock on namespace %s for key %s", namespace, key)
+    try:
+        yield key
+    finally:
+        DeleteDistributedLock(namespace=namespace, params=kwargs).run()
+        logger.debug("Removed lock on namespace %s for key %s", namespace, key)
+
+
+def acquire_cache_lock(namespace: str, timeout: int, **kwargs: Any) -> str | None:
+    """
+    Acquire a distributed lock held in the data cache, expiring after `timeout`
+    seconds.
+
+    Unlike `KeyValueDistributedLock` it doesn't write to the metastore, so it can be
+    held by long running work, e.g. queries, without committing the session of the
+    request, for as long as that work may run.
+
+    :param namespace: The namespace for which the lock is to be acquired.
+    :param timeout: The number of seconds after which the lock expires.
+    :param kwargs: Additional keyword arguments.
+    :returns: The token of the lock, or None if it's already taken.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.extensions import cache_manager
+
+    key = f"lock__{get_key(namespace, **kwargs)}"
+    token = uuid.uuid4().hex
+    if not cache_manager.data_cache.add(key, token, timeout=timeout):
+        logger.debug("Lock on namespace %s for key %s already taken", namespace, key)
+        return None
+    return token
+
+
+def release_cache_lock(namespace: str, token: str | None = None, **kwargs: Any) -> None:
+    """
+    Release a distributed lock acquired with `acquire_cache_lock`.
+
+    :param namespace: The namespace of the lock.
+    :param token: The token of the lock, in which case the lock is only released if
+        it hasn't expired and been acquired again meanwhile.
+    :param kwargs: Additional keyword arguments.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.extensions import cache_manager
+
+    key = f"lock__{get_key(namespace, **kwargs)}"
+    if token is None or cache_manager.data_cache.get(key) == token:
+        cache_manager.data_cache.delete(key)
+
+
+@contextmanager
+def CacheDistributedLock(  # pylint: disable=invalid-name  # noqa: N802
+    namespace: str,
+    timeout: int,
+    **kwargs: Any,
+) -> Iterator[str]:
+    """
+    Distributed lock held in the data cache for the duration of the context, see
+    `acquire_cache_lock`.
+
+    :raises CreateKeyValueDistributedLockFailedException: If the lock is taken.
+    """
+    if (token := acquire_cache_lock(namespace, timeout, **kwargs)) is None:
+        raise CreateKeyValueDistributedLockFailedException("Lock already taken")
+
+    try:
+        yield token
+    finally:
+        release_cache_lock(namespace, token, **kwargs)
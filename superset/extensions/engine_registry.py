@@ -0,0 +1,140 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, NamedTuple, Optional
+
+from flask import current_app
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Key of the session info holding the databases to dispose the engines of on commit
+DISPOSALS_INFO_KEY = "engine_registry_disposals"
+
+
+class EngineKey(NamedTuple):
+    database_id: Optional[int]
+    catalog: Optional[str]
+    schema: Optional[str]
+    username: Optional[str]
+    # hash of the URL and parameters of the engine
+    uri_hash: str
+
+
+class EngineRegistry:
+    """
+    The SQLAlchemy engines of the analytics databases kept by each process, so their
+    pooled connections are reused across queries.
+
+    Up to `DB_ENGINE_REGISTRY_MAX_ENGINES` engines are kept, and the least recently
+    used engine is disposed when a new engine exceeds it.
+    """
+
+    def __init__(self) -> None:
+        self._engines: OrderedDict[EngineKey, Engine] = OrderedDict()
+        self._lock = threading.Lock()
+        self._pid = os.getpid()
+        # engines inherited from the parent of a forked process, which are never used
+        # nor disposed, as that would close the connections of the parent
+        self._inherited: list[Engine] = []
+
+    def get(self, key: EngineKey, create: Callable[[], Engine]) -> Engine:
+        """
+        Get the engine of a key, creating it on a miss.
+
+        :param key: The key of the engine
+        :param create: Creates the engine
+        """
+        with self._lock:
+            self._reset_if_forked()
+            if (engine := self._engines.get(key)) is not None:
+                self._engines.move_to_end(key)
+                return engine
+
+        engine = create()
+        disposed = []
+        with self._lock:
+            # another thread may have created the engine meanwhile
+            if (existing := self._engines.get(key)) is not None:
+                disposed.append(engine)
+                engine = existing
+            else:
+                self._engines[key] = engine
+
+            max_engines = current_app.config["DB_ENGINE_REGISTRY_MAX_ENGINES"]
+            while len(self._engines) > max_engines:
+                disposed.append(self._engines.popitem(last=False)[1])
+
+        for engine_ in disposed:
+            engine_.dispose()
+        return engine
+
+    def dispose(self, database_id: Optional[int] = None) -> None:
+        """
+        Dispose the engines of a database, or of all databases.
+        """
+        with self._lock:
+            self._reset_if_forked()
+            keys = [
+                key
+                for key in self._engines
+                if database_id is None or key.database_id == database_id
+            ]
+            disposed = [self._engines.pop(key) for key in keys]
+
+        for engine in disposed:
+            engine.dispose()
+
+    def dispose_on_commit(self, session: Optional[Session], database_id: int) -> None:
+        """
+        Dispose the engines of a database once the transaction changing it commits.
+        """
+        if session is not None:
+            session.info.setdefault(DISPOSALS_INFO_KEY, set()).add(database_id)
+
+    def _reset_if_forked(self) -> None:
+        if (pid := os.getpid()) != self._pid:
+            self._inherited.extend(self._engines.values())
+            self._engines = OrderedDict()
+            self._pid = pid
+
+
+engine_registry = EngineRegistry()
+
+
+def on_commit(session: Session) -> None:
+    for database_id in session.info.pop(DISPOSALS_INFO_KEY, ()):
+        try:
+            engine_registry.dispose(database_id)
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning("Could not dispose the engines of database %s", database_id)
+            logger.exception(ex)
+
+
+def on_rollback(session: Session) -> None:
+    session.info.pop(DISPOSALS_INFO_KEY, None)
+
+
+event.listen(Session, "after_commit", on_commit)
+event.listen(Session, "after_rollback", on_rollback)
@@ -15,9 +15,16 @@
 # specific language governing permissions and limitations
 # under the License.
 
+import atexit
 import logging
+import os
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from io import StringIO
-from typing import TYPE_CHECKING
+from typing import Any, Optional, TYPE_CHECKING
 
 import sshtunnel
 from flask import Flask
@@ -25,17 +32,40 @@ from paramiko import RSAKey
 
 from superset.databases.utils import make_url_safe
 from superset.utils.class_utils import load_class_from_name
+from superset.utils.hashing import md5_sha_from_dict
 
 if TYPE_CHECKING:
     from superset.databases.ssh_tunnel.models import SSHTunnel
 
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PersistentTunnel:
+    """
+    A tunnel kept open across queries, with the number of queries using it.
+    """
+
+    server: Optional[sshtunnel.SSHTunnelForwarder] = None
+    users: int = 0
+    last_used: float = field(default_factory=time.monotonic)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
 
 class SSHManager:
     def __init__(self, app: Flask) -> None:
         super().__init__()
         self.local_bind_address = app.config["SSH_TUNNEL_LOCAL_BIND_ADDRESS"]
+        self.keepalive = app.config["SSH_TUNNEL_KEEPALIVE_SEC"]
+        self.idle_timeout = app.config["SSH_TUNNEL_IDLE_TIMEOUT_SEC"]
         sshtunnel.TUNNEL_TIMEOUT = app.config["SSH_TUNNEL_TIMEOUT_SEC"]
         sshtunnel.SSH_TIMEOUT = app.config["SSH_TUNNEL_PACKET_TIMEOUT_SEC"]
+        self._tunnels: dict[str, PersistentTunnel] = {}
+        self._lock = threading.Lock()
+        self._pid: Optional[int] = None
+        # tunnels inherited from the parent of a forked process, which are never
+        # used nor closed, as that would close the connections of the parent
+        self._inherited: list[PersistentTunnel] = []
 
     def build_sqla_url(
         self, sqlalchemy_url: str, server: sshtunnel.SSHTunnelForwarder
@@ -51,6 +81,7 @@ class SSHManager:
         self,
         ssh_tunnel: "SSHTunnel",
         sqlalchemy_database_uri: str,
+        **kwargs: Any,
     ) -> sshtunnel.SSHTunnelForwarder:
         url = make_url_safe(sqlalchemy_database_uri)
         params = {
@@ -59,6 +90,7 @@ class SSHManager:
             "remote_bind_address": (url.host, url.port),
             "local_bind_address": (self.local_bind_address,),
             "debug_level": logging.getLogger("flask_appbuilder").level,
+            **kwargs,
         }
 
         if ssh_tunnel.password:
@@ -72,6 +104,120 @@ class SSHManager:
 
         return sshtunnel.open_tunnel(**params)
 
+    @contextmanager
+    def persistent_tunnel(
+        self,
+        ssh_tunnel: "SSHTunnel",
+        sqlalchemy_database_uri: str,
+    ) -> Iterator[sshtunnel.SSHTunnelForwarder]:
+        """
+        Context manager for the tunnel of an SSH tunnel configuration kept open by the
+        process across queries.
+
+        The tunnel is opened on first use, sends keepalives every
+        `SSH_TUNNEL_KEEPALIVE_SEC` seconds, is reopened when its connection is lost,
+        and is closed once unused for `SSH_TUNNEL_IDLE_TIMEOUT_SEC` seconds. Changing
+        the configuration opens a new tunnel, while the previous one idles out.
+        """
+        url = make_url_safe(sqlalchemy_database_uri)
+        key = md5_sha_from_dict(
+            {
+                "id": ssh_tunnel.id,
+                "server_address": ssh_tunnel.server_address,
+                "server_port": ssh_tunnel.server_port,
+                "username": ssh_tunnel.username,
+                "password": ssh_tunnel.password,
+                "private_key": ssh_tunnel.private_key,
+                "private_key_password": ssh_tunnel.private_key_password,
+                "remote_bind_address": [url.host, url.port],
+            }
+        )
+
+        self._start()
+        with self._lock:
+            tunnel = self._tunnels.setdefault(key, PersistentTunnel())
+            tunnel.users += 1
+
+        try:
+            with tunnel.lock:
+                server = tunnel.server
+                if server is None or not server.is_active:
+                    if server is not None:
+                        logger.info("[SSH] Reopening tunnel %s", ssh_tunnel.id)
+                        self._close(tunnel)
+                    server = self.create_tunnel(
+                        ssh_tunnel,
+                        sqlalchemy_database_uri,
+                        set_keepalive=self.keepalive,
+                    )
+                    server.start()
+                    tunnel.server = server
+            yield server
+        finally:
+            with self._lock:
+                tunnel.users -= 1
+                tunnel.last_used = time.monotonic()
+
+    def close_idle_tunnels(self, idle_timeout: Optional[float] = None) -> None:
+        """
+        Close the persistent tunnels unused for `idle_timeout` seconds, by default
+        `SSH_TUNNEL_IDLE_TIMEOUT_SEC`.
+        """
+        idle_timeout = self.idle_timeout if idle_timeout is None else idle_timeout
+        now = time.monotonic()
+        with self._lock:
+            if self._pid != os.getpid():
+                return
+
+            keys = [
+                key
+                for key, tunnel in self._tunnels.items()
+                if not tunnel.users and now - tunnel.last_used >= idle_timeout
+            ]
+            idle = [self._tunnels.pop(key) for key in keys]
+
+        for tunnel in idle:
+            self._close(tunnel)
+
+    def _start(self) -> None:
+        # the tunnels and the thread closing them don't survive forking, e.g. into
+        # the workers of a server, which get their own
+        if self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+
+            self._inherited.extend(self._tunnels.values())
+            self._tunnels = {}
+            threading.Thread(
+                target=self._close_idle_tunnels_periodically,
+                name="SSHManager",
+                daemon=True,
+            ).start()
+            if self._pid is None:
+                atexit.register(self.close_idle_tunnels, idle_timeout=0)
+            self._pid = os.getpid()
+
+    def _close_idle_tunnels_periodically(self) -> None:
+        while True:
+            time.sleep(max(self.idle_timeout / 2, 1))
+            try:
+                self.close_idle_tunnels()
+            except Exception as ex:  # pylint: disable=broad-except
+                logger.exception(ex)
+
+    @staticmethod
+    def _close(tunnel: PersistentTunnel) -> None:
+        if tunnel.server is not None:
+            try:
+                tunnel.server.stop(force=True)
+            except Exception as ex:  # pylint: disable=broad-except
+                logger.warning("[SSH] Could not close tunnel")
+                logger.exception(ex)
+            tunnel.server = None
+
 
 class SSHManagerFactory:
     def __init__(self) -> None:
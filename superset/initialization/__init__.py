@@ -426,6 +426,10 @@ class SupersetAppInitializer:  # pylint: disable=too-many-public-methods
         if feature_flag_manager.is_feature_enabled("TAGGING_SYSTEM"):
             register_sqla_event_listeners()
 
+        from superset.dashboards import payload_cache
+
+        payload_cache.register_sqla_event_listeners()
+
         self.init_views()
 
     def check_secret_key(self) -> None:
@@ -49,6 +49,7 @@ from superset.utils.core import (
     get_username,
     merge_extra_filters,
 )
+from superset.utils.tracing import traced
 
 if TYPE_CHECKING:
     from superset.connectors.sqla.models import SqlaTable
@@ -590,6 +591,7 @@ class BaseTemplateProcessor:
         self._context.update(kwargs)
         self._context.update(context_addons())
 
+    @traced("templating")
     def process_template(self, sql: str, **kwargs: Any) -> str:
         """Processes a sql template
 
@@ -748,6 +750,7 @@ class HiveTemplateProcessor(PrestoTemplateProcessor):
 class SparkTemplateProcessor(HiveTemplateProcessor):
     engine = "spark"
 
+    @traced("templating")
     def process_template(self, sql: str, **kwargs: Any) -> str:
         template = self.env.from_string(sql)
         kwargs.update(self._context)
@@ -761,6 +764,7 @@ class SparkTemplateProcessor(HiveTemplateProcessor):
 class TrinoTemplateProcessor(PrestoTemplateProcessor):
     engine = "trino"
 
+    @traced("templating")
     def process_template(self, sql: str, **kwargs: Any) -> str:
         template = self.env.from_string(sql)
         kwargs.update(self._context)
@@ -34,6 +34,7 @@ from typing import Any, Callable, cast, TYPE_CHECKING
 
 import numpy
 import pandas as pd
+import pyarrow as pa
 import sqlalchemy as sqla
 import sshtunnel
 from flask import g, request
@@ -55,8 +56,8 @@ from sqlalchemy.engine.reflection import Inspector
 from sqlalchemy.engine.url import URL
 from sqlalchemy.exc import NoSuchModuleError
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import relationship
-from sqlalchemy.pool import NullPool
+from sqlalchemy.orm import Mapper, relationship
+from sqlalchemy.pool import NullPool, QueuePool
 from sqlalchemy.schema import UniqueConstraint
 from sqlalchemy.sql import ColumnElement, expression, Select
 
@@ -72,6 +73,7 @@ from superset.extensions import (
     security_manager,
     ssh_manager_factory,
 )
+from superset.extensions.engine_registry import engine_registry, EngineKey
 from superset.models.helpers import AuditMixinNullable, ImportExportMixin
 from superset.result_set import SupersetResultSet
 from superset.sql_parse import Table
@@ -83,7 +85,9 @@ from superset.superset_typing import (
 from superset.utils import cache as cache_util, core as utils, json
 from superset.utils.backports import StrEnum
 from superset.utils.core import DatasourceName, get_username
+from superset.utils.hashing import md5_sha_from_dict
 from superset.utils.oauth2 import get_oauth2_access_token, OAuth2ClientConfigSchema
+from superset.utils.tracing import span
 
 config = app.config
 custom_password_store = config["SQLALCHEMY_CUSTOM_PASSWORD_STORE"]
@@ -425,14 +429,24 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         sqlalchemy_uri = self.sqlalchemy_uri_decrypted
 
         ssh_tunnel = override_ssh_tunnel or DatabaseDAO.get_ssh_tunnel(self.id)
-        ssh_context_manager = (
-            ssh_manager_factory.instance.create_tunnel(
-                ssh_tunnel=ssh_tunnel,
-                sqlalchemy_database_uri=sqlalchemy_uri,
+        ssh_context_manager: Any = nullcontext()
+        persistent_tunnel = False
+        if ssh_tunnel:
+            # tunnels being tested aren't kept open
+            persistent_tunnel = (
+                config["SSH_TUNNEL_PERSISTENT"] and override_ssh_tunnel is None
+            )
+            ssh_context_manager = (
+                ssh_manager_factory.instance.persistent_tunnel(
+                    ssh_tunnel=ssh_tunnel,
+                    sqlalchemy_database_uri=sqlalchemy_uri,
+                )
+                if persistent_tunnel
+                else ssh_manager_factory.instance.create_tunnel(
+                    ssh_tunnel=ssh_tunnel,
+                    sqlalchemy_database_uri=sqlalchemy_uri,
+                )
             )
-            if ssh_tunnel
-            else nullcontext()
-        )
 
         with ssh_context_manager as ssh_context:
             if ssh_context:
@@ -456,6 +470,9 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                     nullpool=nullpool,
                     source=source,
                     sqlalchemy_uri=sqlalchemy_uri,
+                    # the local port of a tunnel changes whenever it's opened, unless
+                    # it's kept open
+                    pooled=not ssh_context or persistent_tunnel,
                 )
 
     def _get_sqla_engine(  # pylint: disable=too-many-locals  # noqa: C901
@@ -465,7 +482,12 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
         nullpool: bool = True,
         source: utils.QuerySource | None = None,
         sqlalchemy_uri: str | None = None,
+        pooled: bool = True,
     ) -> Engine:
+        """
+        Create a SQLAlchemy engine, or get it from the engine registry when the
+        engines of the database are pooled and `pooled` is set.
+        """
         sqlalchemy_url = make_url_safe(
             sqlalchemy_uri if sqlalchemy_uri else self.sqlalchemy_uri_decrypted
         )
@@ -473,7 +495,14 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
 
         extra = self.get_extra()
         params = extra.get("engine_params", {})
-        if nullpool:
+        # SQL Lab statements may change the state of the session, e.g. its database,
+        # role or search path, which would leak to other queries of pooled connections
+        pool_params = (
+            self.get_engine_pool_params()
+            if nullpool and pooled and source != utils.QuerySource.SQL_LAB
+            else None
+        )
+        if nullpool and pool_params is None:
             params["poolclass"] = NullPool
         connect_args = params.get("connect_args", {})
 
@@ -546,10 +575,59 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
                 source,
             )
         try:
-            return create_engine(sqlalchemy_url, **params)
+            if pool_params is None:
+                return create_engine(sqlalchemy_url, **params)
+
+            if not (poolclass := params.get("poolclass")):
+                poolclass = sqlalchemy_url.get_dialect().get_pool_class(sqlalchemy_url)
+            if not issubclass(poolclass, QueuePool):
+                pool_params.pop("pool_size", None)
+                pool_params.pop("max_overflow", None)
+            params.update(pool_params)
+
+            key = EngineKey(
+                database_id=self.id,
+                catalog=catalog,
+                schema=schema,
+                # the engines of a user only differ when impersonating users, as
+                # OAuth2 tokens and connection mutations are part of the hash
+                username=effective_username if self.impersonate_user else None,
+                uri_hash=md5_sha_from_dict(
+                    {
+                        "url": sqlalchemy_url.render_as_string(hide_password=False),
+                        "params": params,
+                    },
+                    default=str,
+                ),
+            )
+            return engine_registry.get(
+                key,
+                lambda: create_engine(sqlalchemy_url, **params),
+            )
         except Exception as ex:
             raise self.db_engine_spec.get_dbapi_mapped_exception(ex) from ex
 
+    def get_engine_pool_params(self) -> dict[str, Any] | None:
+        """
+        Get the parameters of the connection pools of the engines of the database, set
+        by the `engine_pool` key of its extra, or None if its engines aren't pooled.
+        """
+        if not config["DB_ENGINE_POOLING"] or self.id is None:
+            return None
+
+        pool = self.get_extra().get("engine_pool", {})
+        if not pool.get("enabled", True):
+            return None
+
+        return {
+            "pool_size": pool.get("pool_size", config["DB_ENGINE_POOL_SIZE"]),
+            "max_overflow": pool.get(
+                "max_overflow", config["DB_ENGINE_POOL_MAX_OVERFLOW"]
+            ),
+            "pool_recycle": pool.get("pool_recycle", config["DB_ENGINE_POOL_RECYCLE"]),
+            "pool_pre_ping": True,
+        }
+
     def add_database_to_signature(
         self,
         func: Callable[..., None],
@@ -698,16 +776,21 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
             for i, sql_ in enumerate(sqls):
                 sql_ = self.mutate_sql_based_on_config(sql_, is_split=True)
                 _log_query(sql_)
-                with event_logger.log_context(
-                    action="execute_sql",
-                    database=self,
-                    object_ref=__name__,
+                with (
+                    span("db_execute"),
+                    event_logger.log_context(
+                        action="execute_sql",
+                        database=self,
+                        object_ref=__name__,
+                    ),
                 ):
                     self.db_engine_spec.execute(cursor, sql_, self)
 
-                rows = self.fetch_rows(cursor, i == len(sqls) - 1)
+                with span("db_fetch"):
+                    rows = self.fetch_rows(cursor, i == len(sqls) - 1)
                 if rows is not None:
-                    df = self.load_into_dataframe(cursor.description, rows)
+                    with span("result_set"):
+                        df = self.load_into_dataframe(cursor.description, rows)
 
             if mutator:
                 df = mutator(df)
@@ -715,18 +798,25 @@ class Database(Model, AuditMixinNullable, ImportExportMixin):  # pylint: disable
             return self.post_process_df(df)
 
     @event_logger.log_this
-    def fetch_rows(self, cursor: Any, last: bool) -> list[tuple[Any, ...]] | None:
+    def fetch_rows(
+        self, cursor: Any, last: bool
+    ) -> list[tuple[Any, ...]] | pa.Table | None:
         if not last:
             cursor.fetchall()
             return None
 
+        # prefer Arrow data when the driver can return it natively
+        table = self.db_engine_spec.fetch_arrow_table(cursor)
+        if table is not None:
+            return table
+
         return self.db_engine_spec.fetch_data(cursor)
 
     @event_logger.log_this
     def load_into_dataframe(
         self,
         description: DbapiDescription,
-        data: list[tuple[Any, ...]],
+        data: list[tuple[Any, ...]] | pa.Table,
     ) -> pd.DataFrame:
         result_set = SupersetResultSet(
             data,
@@ -1174,6 +1264,14 @@ sqla.event.listen(Database, "after_update", security_manager.database_after_upda
 sqla.event.listen(Database, "after_delete", security_manager.database_after_delete)
 
 
+def dispose_engines(_mapper: Mapper, _connection: Connection, target: Database) -> None:
+    engine_registry.dispose_on_commit(sqla.orm.object_session(target), target.id)
+
+
+sqla.event.listen(Database, "after_update", dispose_engines)
+sqla.event.listen(Database, "after_delete", dispose_engines)
+
+
 class DatabaseUserOAuth2Tokens(Model, AuditMixinNullable):
     """
     Store OAuth2 tokens, for authenticating to DBs using user personal tokens.
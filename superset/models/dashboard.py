@@ -271,16 +271,25 @@ class Dashboard(AuditMixinNullable, ImportExportMixin, Model):
         for slc in self.slices:
             slices_by_datasource[(slc.cls_model, slc.datasource_id)].add(slc)
 
-        result: list[dict[str, Any]] = []
+        # Load the datasources of each type at once, with the relationships of tables
+        datasource_ids: dict[type[BaseDatasource], set[int]] = defaultdict(set)
+        for cls_model, datasource_id in slices_by_datasource:
+            datasource_ids[cls_model].add(datasource_id)
+
+        datasources: dict[tuple[type[BaseDatasource], int], BaseDatasource] = {}
+        for cls_model, ids in datasource_ids.items():
+            if cls_model is SqlaTable:
+                models = SqlaTable.get_eager_sqlatable_datasources(ids)
+            else:
+                models = db.session.query(cls_model).filter(cls_model.id.in_(ids)).all()
+            datasources.update(((cls_model, model.id), model) for model in models)
 
-        for (cls_model, datasource_id), slices in slices_by_datasource.items():
-            datasource = (
-                db.session.query(cls_model).filter_by(id=datasource_id).one_or_none()
-            )
+        result: list[dict[str, Any]] = []
 
-            if datasource:
+        for key, slices in slices_by_datasource.items():
+            if datasource := datasources.get(key):
                 # Filter out unneeded fields from the datasource payload
-                result.append(datasource.data_for_slices(slices))
+                result.append(datasource.data_for_slices(list(slices)))
 
         return result
 
@@ -283,10 +283,17 @@ class Slice(  # pylint: disable=too-many-public-methods
         update_time_range(form_data)
         return form_data
 
-    def get_query_context(self) -> QueryContext | None:
+    def get_query_context(
+        self,
+        factory: QueryContextFactory | None = None,
+    ) -> QueryContext | None:
+        """
+        :param factory: The factory creating the query context, defaults to the one of
+            the chart
+        """
         if self.query_context:
             try:
-                return self.get_query_context_factory().create(
+                return (factory or self.get_query_context_factory()).create(
                     **json.loads(self.query_context)
                 )
             except json.JSONDecodeError as ex:
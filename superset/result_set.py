@@ -18,7 +18,9 @@
 
 import datetime
 import logging
-from typing import Any, Optional
+from collections.abc import Sequence
+from operator import itemgetter
+from typing import Any, Optional, Union
 
 import numpy as np
 import pandas as pd
@@ -82,6 +84,16 @@ def stringify_values(array: NDArray[Any]) -> NDArray[Any]:
     return result
 
 
+def to_object_array(values: Sequence[Any]) -> NDArray[Any]:
+    """
+    Build a 1-D object array from a column of values.
+
+    Unlike ``np.array`` this never broadcasts nested sequences into extra
+    dimensions, so every cell is kept as is.
+    """
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
 def destringify(obj: str) -> Any:
     return json.loads(obj)
 
@@ -100,19 +112,22 @@ def convert_to_string(value: Any) -> str:
 
 
 class SupersetResultSet:
-    def __init__(  # pylint: disable=too-many-locals  # noqa: C901
+    def __init__(  # pylint: disable=too-many-locals
         self,
-        data: DbapiResult,
-        cursor_description: DbapiDescription,
+        data: Union[DbapiResult, pa.Table, pa.RecordBatch],
+        cursor_description: Optional[DbapiDescription],
         db_engine_spec: type[BaseEngineSpec],
     ):
         self.db_engine_spec = db_engine_spec
-        data = data or []
         column_names: list[str] = []
-        pa_data: list[pa.Array] = []
+        pa_data: list[Union[pa.Array, pa.ChunkedArray]] = []
         deduped_cursor_desc: list[tuple[Any, ...]] = []
-        numpy_dtype: list[tuple[str, ...]] = []
-        stringified_arr: NDArray[Any]
+
+        if isinstance(data, pa.RecordBatch):
+            data = pa.Table.from_batches([data])
+        elif not isinstance(data, (pa.Table, Sequence)):
+            # rows may be returned by an iterator, which can only be read once
+            data = list(data)
 
         if cursor_description:
             # get deduped list of column names
@@ -125,56 +140,14 @@ class SupersetResultSet:
                 tuple([column_name, *list(description)[1:]])  # noqa: C409
                 for column_name, description in zip(column_names, cursor_description)
             ]
+        elif isinstance(data, pa.Table):
+            column_names = dedup(data.column_names)
 
-            # generate numpy structured array dtype
-            numpy_dtype = [(column_name, "object") for column_name in column_names]
-
-        # only do expensive recasting if datatype is not standard list of tuples
-        if data and (not isinstance(data, list) or not isinstance(data[0], tuple)):
-            data = [tuple(row) for row in data]
-        array = np.array(data, dtype=numpy_dtype)
-        if array.size > 0:
-            for column in column_names:
-                try:
-                    pa_data.append(pa.array(array[column].tolist()))
-                except (
-                    pa.lib.ArrowInvalid,
-                    pa.lib.ArrowTypeError,
-                    pa.lib.ArrowNotImplementedError,
-                    ValueError,
-                    TypeError,  # this is super hackey,
-                    # https://issues.apache.org/jira/browse/ARROW-7855
-                ):
-                    # attempt serialization of values as strings
-                    stringified_arr = stringify_values(array[column])
-                    pa_data.append(pa.array(stringified_arr.tolist()))
-
-        if pa_data:  # pylint: disable=too-many-nested-blocks
-            for i, column in enumerate(column_names):
-                if pa.types.is_nested(pa_data[i].type):
-                    # TODO: revisit nested column serialization once nested types
-                    #  are added as a natively supported column type in Superset
-                    #  (superset.utils.core.GenericDataType).
-                    stringified_arr = stringify_values(array[column])
-                    pa_data[i] = pa.array(stringified_arr.tolist())
-
-                elif pa.types.is_temporal(pa_data[i].type):
-                    # workaround for bug converting
-                    # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
-                    # related: https://issues.apache.org/jira/browse/ARROW-5248
-                    sample = self.first_nonempty(array[column])
-                    if sample and isinstance(sample, datetime.datetime):
-                        try:
-                            if sample.tzinfo:
-                                tz = sample.tzinfo
-                                series = pd.Series(array[column])
-                                series = pd.to_datetime(series)
-                                pa_data[i] = pa.Array.from_pandas(
-                                    series,
-                                    type=pa.timestamp("ns", tz=tz),
-                                )
-                        except Exception as ex:  # pylint: disable=broad-except
-                            logger.exception(ex)
+        if isinstance(data, pa.Table):
+            # the driver already returned columnar data, use it as is
+            pa_data = self._arrays_from_table(data)
+        elif data:
+            pa_data = self._arrays_from_rows(data, len(column_names))
 
         if not pa_data:
             column_names = []
@@ -191,6 +164,81 @@ class SupersetResultSet:
         except Exception as ex:  # pylint: disable=broad-except
             logger.exception(ex)
 
+    @classmethod
+    def _arrays_from_rows(cls, data: DbapiResult, num_columns: int) -> list[pa.Array]:
+        """
+        Transpose DBAPI rows into one Arrow array per column.
+
+        Each column is gathered straight from the rows and handed to Arrow,
+        falling back to stringified values for the columns Arrow can't convert
+        natively. Unlike a NumPy structured array this never materializes an
+        intermediate copy of the whole result.
+        """
+        if not num_columns:
+            return []
+
+        if len(data[0]) != num_columns:
+            raise ValueError(
+                f"Expected {num_columns} columns in the result set, "
+                f"got {len(data[0])}"
+            )
+
+        return [
+            cls._array_from_values(list(map(itemgetter(i), data)))
+            for i in range(num_columns)
+        ]
+
+    @classmethod
+    def _array_from_values(cls, values: Sequence[Any]) -> pa.Array:
+        try:
+            pa_array = pa.array(values)
+        except (
+            pa.lib.ArrowInvalid,
+            pa.lib.ArrowTypeError,
+            pa.lib.ArrowNotImplementedError,
+            ValueError,
+            TypeError,  # this is super hackey,
+            # https://issues.apache.org/jira/browse/ARROW-7855
+        ):
+            # attempt serialization of values as strings
+            return pa.array(stringify_values(to_object_array(values)).tolist())
+
+        if pa.types.is_nested(pa_array.type):
+            # TODO: revisit nested column serialization once nested types
+            #  are added as a natively supported column type in Superset
+            #  (superset.utils.core.GenericDataType).
+            return pa.array(stringify_values(to_object_array(values)).tolist())
+
+        if pa.types.is_temporal(pa_array.type):
+            # workaround for bug converting
+            # `psycopg2.tz.FixedOffsetTimezone` tzinfo values.
+            # related: https://issues.apache.org/jira/browse/ARROW-5248
+            sample = cls.first_nonempty(values)
+            if sample and isinstance(sample, datetime.datetime):
+                try:
+                    if sample.tzinfo:
+                        series = pd.to_datetime(pd.Series(values))
+                        pa_array = pa.Array.from_pandas(
+                            series,
+                            type=pa.timestamp("ns", tz=sample.tzinfo),
+                        )
+                except Exception as ex:  # pylint: disable=broad-except
+                    logger.exception(ex)
+
+        return pa_array
+
+    @staticmethod
+    def _arrays_from_table(table: pa.Table) -> list[pa.ChunkedArray]:
+        pa_data = []
+        for column in table.columns:
+            if pa.types.is_nested(column.type):
+                column = pa.chunked_array(
+                    [stringify_values(to_object_array(column.to_pylist())).tolist()],
+                    type=pa.string(),
+                )
+            pa_data.append(column)
+        return pa_data
+
     @staticmethod
     def convert_pa_dtype(pa_dtype: pa.DataType) -> Optional[str]:
         if pa.types.is_boolean(pa_dtype):
@@ -207,13 +255,19 @@ class SupersetResultSet:
 
     @staticmethod
     def convert_table_to_df(table: pa.Table) -> pd.DataFrame:
+        # one block per column lets pandas reuse the Arrow buffers of numeric
+        # columns without nulls instead of copying them into a consolidated block
         try:
-            return table.to_pandas(integer_object_nulls=True)
+            return table.to_pandas(integer_object_nulls=True, split_blocks=True)
         except pa.lib.ArrowInvalid:
-            return table.to_pandas(integer_object_nulls=True, timestamp_as_object=True)
+            return table.to_pandas(
+                integer_object_nulls=True,
+                timestamp_as_object=True,
+                split_blocks=True,
+            )
 
     @staticmethod
-    def first_nonempty(items: NDArray[Any]) -> Any:
+    def first_nonempty(items: Sequence[Any]) -> Any:
         return next((i for i in items if i), None)
 
     def is_temporal(self, db_type_str: Optional[str]) -> bool:
@@ -21,6 +21,8 @@ import logging
 import re
 import time
 from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any, Callable, cast, NamedTuple, Optional, TYPE_CHECKING
 
 from flask import current_app, Flask, g, Request
@@ -46,7 +48,7 @@ from flask_appbuilder.widgets import ListWidget
 from flask_babel import lazy_gettext as _
 from flask_login import AnonymousUserMixin, LoginManager
 from jwt.api_jwt import _jwt_global_obj
-from sqlalchemy import and_, inspect, or_
+from sqlalchemy import and_, event, inspect, or_
 from sqlalchemy.engine.base import Connection
 from sqlalchemy.orm import eagerload
 from sqlalchemy.orm.mapper import Mapper
@@ -66,6 +68,12 @@ from superset.security.guest_token import (
     GuestTokenUser,
     GuestUser,
 )
+from superset.security.snapshot_cache import (
+    get_role_ids_key,
+    permission_snapshots,
+    PermissionSnapshot,
+    rls_filter_snapshots,
+)
 from superset.sql_parse import extract_tables_from_jinja_sql, Table
 from superset.tasks.utils import get_current_user
 from superset.utils import json
@@ -435,10 +443,57 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         """
 
         user = g.user
+        if (snapshot := self.get_permission_snapshot(user)) is not None:
+            return view_name in snapshot.get(permission_name, ())
         if user.is_anonymous:
             return self.is_item_public(permission_name, view_name)
         return self._has_view_access(user, permission_name, view_name)
 
+    def get_permission_snapshot(self, user: User) -> Optional[PermissionSnapshot]:
+        """
+        Return the view menus each permission of the user is granted on, cached for
+        its roles, or None if PERMISSION_SNAPSHOT_CACHE is disabled or a role of the
+        user is a builtin role, whose permissions are patterns.
+
+        :param user: The user
+        :returns: The permission snapshot of the user
+        """
+
+        if not current_app.config["PERMISSION_SNAPSHOT_CACHE"]:
+            return None
+
+        roles = self.get_user_roles(user)
+        if any(role.name in self.builtin_roles for role in roles):
+            return None
+
+        role_ids = [role.id for role in roles]
+        return permission_snapshots.get(
+            get_role_ids_key(role_ids),
+            lambda: self._load_permission_snapshot(role_ids),
+        )
+
+    def _load_permission_snapshot(self, role_ids: list[int]) -> PermissionSnapshot:
+        view_menu_names = defaultdict(set)
+        if role_ids:
+            query = (
+                self.get_session.query(
+                    self.permission_model.name,
+                    self.viewmenu_model.name,
+                )
+                .select_from(self.permissionview_model)
+                .join(self.permission_model)
+                .join(self.viewmenu_model)
+                .join(assoc_permissionview_role)
+                .filter(assoc_permissionview_role.c.role_id.in_(role_ids))
+            )
+            for permission_name, view_menu_name in query:
+                view_menu_names[permission_name].add(view_menu_name)
+
+        return {
+            permission_name: frozenset(names)
+            for permission_name, names in view_menu_names.items()
+        }
+
     def can_access_all_queries(self) -> bool:
         """
         Return True if the user can access all SQL Lab queries, False otherwise.
@@ -723,6 +778,9 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         return True
 
     def user_view_menu_names(self, permission_name: str) -> set[str]:
+        if (snapshot := self.get_permission_snapshot(g.user)) is not None:
+            return set(snapshot.get(permission_name, ()))
+
         base_query = (
             self.get_session.query(self.viewmenu_model.name)
             .join(self.permissionview_model)
@@ -2047,6 +2105,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param connection: The DB-API connection
         :param target: The mapped instance being changed
         """
+        permission_snapshots.invalidate(self.get_session)
 
     def on_view_menu_after_insert(
         self, mapper: Mapper, connection: Connection, target: ViewMenu
@@ -2079,6 +2138,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param connection: The DB-API connection
         :param target: The mapped instance being persisted
         """
+        permission_snapshots.invalidate(self.get_session)
 
     def on_permission_after_insert(
         self, mapper: Mapper, connection: Connection, target: Permission
@@ -2111,6 +2171,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param connection: The DB-API connection
         :param target: The mapped instance being persisted
         """
+        permission_snapshots.invalidate(self.get_session)
 
     def on_permission_view_after_delete(
         self, mapper: Mapper, connection: Connection, target: PermissionView
@@ -2127,6 +2188,7 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         :param connection: The DB-API connection
         :param target: The mapped instance being persisted
         """
+        permission_snapshots.invalidate(self.get_session)
 
     @staticmethod
     def get_exclude_users_from_lists() -> list[str]:
@@ -2455,6 +2517,28 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         if not (hasattr(g, "user") and g.user is not None):
             return []
 
+        shared_filters = g.get("shared_rls_filters")
+        if shared_filters is not None and table.id in shared_filters:
+            return list(shared_filters[table.id])
+
+        user_roles = [role.id for role in self.get_user_roles(g.user)]
+        if current_app.config["RLS_FILTER_CACHE"]:
+            filters = rls_filter_snapshots.get(
+                f"{table.id}__{get_role_ids_key(user_roles)}",
+                lambda: self._load_rls_filters(table, user_roles),
+            )
+        else:
+            filters = self._load_rls_filters(table, user_roles)
+
+        if shared_filters is not None:
+            shared_filters[table.id] = filters
+        return list(filters)
+
+    def _load_rls_filters(
+        self,
+        table: "BaseDatasource",
+        user_roles: list[int],
+    ) -> list[SqlaQuery]:
         # pylint: disable=import-outside-toplevel
         from superset.connectors.sqla.models import (
             RLSFilterRoles,
@@ -2462,7 +2546,6 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
             RowLevelSecurityFilter,
         )
 
-        user_roles = [role.id for role in self.get_user_roles(g.user)]
         regular_filter_roles = (
             self.get_session.query(RLSFilterRoles.c.rls_filter_id)
             .join(RowLevelSecurityFilter)
@@ -2506,6 +2589,18 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         )
         return query.all()
 
+    @contextmanager
+    def share_rls_filters(self) -> Iterator[None]:
+        """
+        Look up the row level security filters of each table only once within the
+        block, e.g. for the charts of a batch request.
+        """
+        g.shared_rls_filters = {}
+        try:
+            yield
+        finally:
+            g.pop("shared_rls_filters", None)
+
     def get_rls_sorted(self, table: "BaseDatasource") -> list["RowLevelSecurityFilter"]:
         """
         Retrieves a list RLS filters sorted by ID for
@@ -2730,3 +2825,11 @@ class SupersetSecurityManager(  # pylint: disable=too-many-public-methods
         return current_app.config["AUTH_ROLE_ADMIN"] in [
             role.name for role in self.get_user_roles()
         ]
+
+
+def on_role_after_update(mapper: Mapper, connection: Connection, target: Role) -> None:
+    current_app.appbuilder.sm.on_role_after_update(mapper, connection, target)
+
+
+# changing the permissions of a role, through the ORM, updates it
+event.listen(Role, "after_update", on_role_after_update)
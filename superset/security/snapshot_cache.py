@@ -0,0 +1,183 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Snapshots of the security metadata of sets of roles, e.g. the permissions granted to
+them, so access checks are lookups rather than queries against the metastore.
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import uuid
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any, Callable, Optional
+
+from flask import current_app, g, has_app_context
+from flask_caching import Cache
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# The view menus each permission is granted on
+PermissionSnapshot = dict[str, frozenset[str]]
+
+# Key of the session info holding the caches to invalidate on commit
+INVALIDATIONS_INFO_KEY = "snapshot_cache_invalidations"
+
+
+def _get_cache() -> Cache:
+    # pylint: disable=import-outside-toplevel
+    from superset.extensions import cache_manager
+
+    return cache_manager.cache
+
+
+def get_role_ids_key(role_ids: Iterable[int]) -> str:
+    """
+    Get the key of the snapshots of a set of roles.
+    """
+    return "_".join(map(str, sorted(set(role_ids))))
+
+
+class SnapshotCache:
+    """
+    A cache of snapshots held by each process in front of CACHE_CONFIG.
+
+    Snapshots are cached under a generation, a random token shared through
+    CACHE_CONFIG and replaced whenever the metadata they're taken from changes,
+    which each process reads once per request, so changes reach every process on its
+    next request. Each process keeps a bounded number of snapshots, the least
+    recently used being dropped.
+    """
+
+    def __init__(self, name: str, timeout_key: str, max_snapshots_key: str) -> None:
+        """
+        :param name: The namespace of the snapshots in CACHE_CONFIG
+        :param timeout_key: The config key of the timeout of the snapshots
+        :param max_snapshots_key: The config key of the number of snapshots kept by
+            each process
+        """
+        self.name = name
+        self.timeout_key = timeout_key
+        self.max_snapshots_key = max_snapshots_key
+        self.generation_key = f"{name}_generation"
+        self._generation: Optional[str] = None
+        self._snapshots: OrderedDict[str, Any] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_generation(self) -> str:
+        if generation := g.get(self.generation_key):
+            return generation
+
+        cache = _get_cache()
+        if not (generation := cache.get(self.generation_key)):
+            generation = uuid.uuid4().hex
+            # another process may have set the generation meanwhile
+            if not cache.add(
+                self.generation_key,
+                generation,
+                timeout=current_app.config[self.timeout_key],
+            ):
+                generation = cache.get(self.generation_key) or generation
+
+        setattr(g, self.generation_key, generation)
+        return generation
+
+    def get(self, key: str, load: Callable[[], Any]) -> Any:
+        """
+        Get a snapshot, loading and caching it on a miss.
+
+        :param key: The key of the snapshot, e.g. the ids of a set of roles
+        :param load: Loads the snapshot from the metastore
+        """
+        generation = self.get_generation()
+        with self._lock:
+            if generation != self._generation:
+                self._generation = generation
+                self._snapshots = OrderedDict()
+            if (snapshot := self._snapshots.get(key)) is not None:
+                self._snapshots.move_to_end(key)
+                return snapshot
+
+        cache = _get_cache()
+        cache_key = f"{self.name}__{generation}__{key}"
+        if (snapshot := cache.get(cache_key)) is None:
+            snapshot = load()
+            cache.set(
+                cache_key,
+                snapshot,
+                timeout=current_app.config[self.timeout_key],
+            )
+
+        max_snapshots = current_app.config[self.max_snapshots_key]
+        with self._lock:
+            if generation == self._generation:
+                self._snapshots[key] = snapshot
+                while len(self._snapshots) > max_snapshots:
+                    self._snapshots.popitem(last=False)
+        return snapshot
+
+    def invalidate(self, session: Optional[Session] = None) -> None:
+        """
+        Invalidate the snapshots of all processes.
+
+        :param session: The session changing the metadata, in which case snapshots are
+            invalidated again once it commits, as they may be loaded from the
+            metadata it changes before they are visible
+        """
+        with self._lock:
+            self._generation = None
+            self._snapshots = OrderedDict()
+        if has_app_context():
+            g.pop(self.generation_key, None)
+
+        try:
+            _get_cache().delete(self.generation_key)
+        except Exception as ex:  # pylint: disable=broad-except
+            logger.warning("Could not invalidate the %s snapshots", self.name)
+            logger.exception(ex)
+
+        if session is not None:
+            session.info.setdefault(INVALIDATIONS_INFO_KEY, set()).add(self)
+
+
+permission_snapshots = SnapshotCache(
+    "permission_snapshot",
+    "PERMISSION_SNAPSHOT_CACHE_TIMEOUT",
+    "PERMISSION_SNAPSHOT_CACHE_MAX_SNAPSHOTS",
+)
+rls_filter_snapshots = SnapshotCache(
+    "rls_filters",
+    "RLS_FILTER_CACHE_TIMEOUT",
+    "RLS_FILTER_CACHE_MAX_SNAPSHOTS",
+)
+
+
+def on_commit(session: Session) -> None:
+    for snapshots in session.info.pop(INVALIDATIONS_INFO_KEY, ()):
+        snapshots.invalidate()
+
+
+def on_rollback(session: Session) -> None:
+    session.info.pop(INVALIDATIONS_INFO_KEY, None)
+
+
+event.listen(Session, "after_commit", on_commit)
+event.listen(Session, "after_rollback", on_rollback)
@@ -29,6 +29,7 @@ import msgpack
 from celery.exceptions import SoftTimeLimitExceeded
 from flask import current_app
 from flask_babel import gettext as __
+from flask_caching.backends.base import BaseCache
 
 from superset import (
     app,
@@ -61,7 +62,8 @@ from superset.sql_parse import (
     ParsedQuery,
 )
 from superset.sqllab.limiting_factor import LimitingFactor
-from superset.sqllab.utils import write_ipc_buffer
+from superset.sqllab.utils import get_results_chunk_key, write_ipc_buffer
+from superset.superset_typing import ResultSetColumnType
 from superset.utils import json
 from superset.utils.core import (
     override_user,
@@ -70,6 +72,7 @@ from superset.utils.core import (
 )
 from superset.utils.dates import now_as_float
 from superset.utils.decorators import stats_timing
+from superset.utils.tracing import traced
 
 config = app.config
 stats_logger = config["STATS_LOGGER"]
@@ -94,6 +97,64 @@ class SqlLabQueryStoppedException(SqlLabException):
     pass
 
 
+class SqlLabResultsTooLargeException(SupersetErrorException):
+    pass
+
+
+class ResultsChunkWriter:
+    """
+    Write query results to the results backend as numbered chunks of Arrow data.
+
+    Each chunk is serialized and stored as soon as it's fetched, so the full result
+    never needs to be held in memory.
+    """
+
+    def __init__(self, key: str, chunk_size: int, cache_timeout: int) -> None:
+        self.key = key
+        self.chunk_size = chunk_size
+        self.cache_timeout = cache_timeout
+        self.chunk_rows: list[int] = []
+        self.columns: list[ResultSetColumnType] = []
+        self.serialized_size = 0
+
+    @property
+    def rows(self) -> int:
+        return sum(self.chunk_rows)
+
+    def write(self, result_set: SupersetResultSet) -> None:
+        with stats_timing(
+            "sqllab.query.results_backend_pa_serialization", stats_logger
+        ):
+            data = write_ipc_buffer(result_set.pa_table).to_pybytes()
+
+        self.serialized_size += len(data)
+        if sql_lab_payload_max_mb := config.get("SQLLAB_PAYLOAD_MAX_MB"):
+            if self.serialized_size > sql_lab_payload_max_mb * BYTES_IN_MB:
+                logger.info("Result size exceeds the allowed limit.")
+                raise SqlLabResultsTooLargeException(
+                    SupersetError(
+                        message=f"Result size ({self.serialized_size / BYTES_IN_MB:.2f} MB) exceeds the allowed limit of {sql_lab_payload_max_mb} MB.",  # noqa: E501
+                        error_type=SupersetErrorType.RESULT_TOO_LARGE_ERROR,
+                        level=ErrorLevel.ERROR,
+                    )
+                )
+
+        key = get_results_chunk_key(self.key, len(self.chunk_rows))
+        with stats_timing("sqllab.query.results_backend_write", stats_logger):
+            cast(BaseCache, results_backend).set(
+                key, zlib_compress(data), self.cache_timeout
+            )
+
+        if not self.chunk_rows:
+            self.columns = result_set.columns
+        else:
+            # a column that is all nulls in the first chunks has no type yet
+            for column, chunk_column in zip(self.columns, result_set.columns):
+                if column["type"] is None and chunk_column["type"] is not None:
+                    column.update(chunk_column)
+        self.chunk_rows.append(result_set.size)
+
+
 def handle_query_error(
     ex: Exception,
     query: Query,
@@ -203,8 +264,14 @@ def execute_sql_statement(  # pylint: disable=too-many-statements, too-many-loca
     cursor: Any,
     log_params: Optional[dict[str, Any]],
     apply_ctas: bool = False,
-) -> SupersetResultSet:
-    """Executes a single SQL statement"""
+    results_writer: Optional[ResultsChunkWriter] = None,
+) -> Optional[SupersetResultSet]:
+    """
+    Executes a single SQL statement
+
+    When a ``results_writer`` is passed the results are fetched in chunks and handed
+    to it as they arrive, and no result set is returned.
+    """
     database: Database = query.database
     db_engine_spec = database.db_engine_spec
 
@@ -312,7 +379,15 @@ def execute_sql_statement(  # pylint: disable=too-many-statements, too-many-loca
                     query.id,
                     str(query.to_dict()),
                 )
-                data = db_engine_spec.fetch_data(cursor, increased_limit)
+                if results_writer:
+                    _fetch_results_in_chunks(
+                        cursor, query, db_engine_spec, increased_limit, results_writer
+                    )
+                    return None
+
+                data = db_engine_spec.fetch_arrow_table(cursor, increased_limit)
+                if data is None:
+                    data = db_engine_spec.fetch_data(cursor, increased_limit)
                 if query.limit is None or len(data) <= query.limit:
                     query.limiting_factor = LimitingFactor.NOT_LIMITED
                 else:
@@ -334,8 +409,9 @@ def execute_sql_statement(  # pylint: disable=too-many-statements, too-many-loca
                 level=ErrorLevel.ERROR,
             )
         ) from ex
-    except OAuth2RedirectError:
-        # user needs to authenticate with OAuth2 in order to run query
+    except (OAuth2RedirectError, SqlLabResultsTooLargeException):
+        # user needs to authenticate with OAuth2 in order to run query, or the
+        # results are too large
         raise
     except Exception as ex:
         # query is stopped in another thread/worker
@@ -352,6 +428,38 @@ def execute_sql_statement(  # pylint: disable=too-many-statements, too-many-loca
     return SupersetResultSet(data, cursor_description, db_engine_spec)
 
 
+def _fetch_results_in_chunks(
+    cursor: Any,
+    query: Query,
+    db_engine_spec: type[BaseEngineSpec],
+    increased_limit: Optional[int],
+    results_writer: ResultsChunkWriter,
+) -> None:
+    limited = False
+    fetched = 0
+    for data in db_engine_spec.fetch_data_chunks(
+        cursor,
+        results_writer.chunk_size,
+        increased_limit,
+    ):
+        if query.limit is not None and fetched + len(data) > query.limit:
+            # return 1 row less than increased_query
+            data = data[: query.limit - fetched]
+            limited = True
+        fetched += len(data)
+        if data:
+            results_writer.write(
+                SupersetResultSet(data, cursor.description, db_engine_spec)
+            )
+
+    if not results_writer.chunk_rows:
+        # store an empty chunk so that readers always find one
+        results_writer.write(SupersetResultSet([], cursor.description, db_engine_spec))
+
+    if not limited:
+        query.limiting_factor = LimitingFactor.NOT_LIMITED
+
+
 def apply_limit_if_exists(
     database: Database, increased_limit: Optional[int], query: Query, sql: str
 ) -> str:
@@ -375,6 +483,7 @@ def _serialize_payload(
     return json.dumps(payload, default=json.json_iso_dttm_ser, ignore_nan=True)
 
 
+@traced("serialization")
 def _serialize_and_expand_data(
     result_set: SupersetResultSet,
     db_engine_spec: BaseEngineSpec,
@@ -492,6 +601,26 @@ def execute_sql_statements(  # noqa: C901
             )
         )
 
+    cache_timeout = database.cache_timeout
+    if cache_timeout is None:
+        cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
+
+    # Stream the results of the last statement to the results backend in chunks,
+    # when they don't need to be returned to the caller or expanded
+    results_writer: Optional[ResultsChunkWriter] = None
+    if (
+        (chunk_size := config["SQLLAB_RESULTS_CHUNK_SIZE"])
+        and store_results
+        and results_backend
+        and results_backend_use_msgpack
+        and not return_results
+        and not expand_data
+        and not query.select_as_cta
+    ):
+        results_writer = ResultsChunkWriter(
+            str(uuid.uuid4()), chunk_size, cache_timeout
+        )
+
     with database.get_raw_connection(
         catalog=query.catalog,
         schema=query.schema,
@@ -532,6 +661,7 @@ def execute_sql_statements(  # noqa: C901
                     cursor,
                     log_params,
                     apply_ctas,
+                    results_writer if i == statement_count - 1 else None,
                 )
 
             except SqlLabQueryStoppedException:
@@ -560,10 +690,17 @@ def execute_sql_statements(  # noqa: C901
             conn.commit()
 
     # Success, updating the query entry in database
-    query.rows = result_set.size
+    if results_writer:
+        # the results were already written to the results backend in chunks
+        query.rows = results_writer.rows
+        columns = results_writer.columns
+    else:
+        result_set = cast(SupersetResultSet, result_set)
+        query.rows = result_set.size
+        columns = result_set.columns
     query.progress = 100
     query.set_extra_json_key("progress", None)
-    query.set_extra_json_key("columns", result_set.columns)
+    query.set_extra_json_key("columns", columns)
     if query.select_as_cta:
         query.select_sql = database.select_star(
             Table(query.tmp_table_name, query.tmp_schema_name),
@@ -574,9 +711,33 @@ def execute_sql_statements(  # noqa: C901
     query.end_time = now_as_float()
 
     use_arrow_data = store_results and cast(bool, results_backend_use_msgpack)
-    data, selected_columns, all_columns, expanded_columns = _serialize_and_expand_data(
-        result_set, db_engine_spec, use_arrow_data, expand_data
-    )
+    data: Union[bytes, str, None]
+    expanded_columns: list[Any]
+    if results_writer:
+        data, selected_columns, all_columns, expanded_columns = (
+            None,
+            columns,
+            columns,
+            [],
+        )
+        payload.update(
+            {
+                "chunks": len(results_writer.chunk_rows),
+                "chunk_rows": results_writer.chunk_rows,
+            }
+        )
+    else:
+        (
+            data,
+            selected_columns,
+            all_columns,
+            expanded_columns,
+        ) = _serialize_and_expand_data(
+            cast(SupersetResultSet, result_set),
+            db_engine_spec,
+            use_arrow_data,
+            expand_data,
+        )
 
     # TODO: data should be saved separately from metadata (likely in Parquet)
     payload.update(
@@ -592,7 +753,7 @@ def execute_sql_statements(  # noqa: C901
     payload["query"]["state"] = QueryStatus.SUCCESS
 
     if store_results and results_backend:
-        key = str(uuid.uuid4())
+        key = results_writer.key if results_writer else str(uuid.uuid4())
         payload["query"]["resultsKey"] = key
         logger.info(
             "Query %s: Storing results in results backend, key: %s", str(query_id), key
@@ -620,10 +781,6 @@ def execute_sql_statements(  # noqa: C901
                             )
                         )
 
-            cache_timeout = database.cache_timeout
-            if cache_timeout is None:
-                cache_timeout = config["CACHE_DEFAULT_TIMEOUT"]
-
             compressed = zlib_compress(serialized_payload)
             logger.debug(
                 "*** serialized payload size: %i", getsizeof(serialized_payload)
@@ -644,7 +801,7 @@ def execute_sql_statements(  # noqa: C901
                 all_columns,
                 expanded_columns,
             ) = _serialize_and_expand_data(
-                result_set, db_engine_spec, False, expand_data
+                cast(SupersetResultSet, result_set), db_engine_spec, False, expand_data
             )
             payload.update(
                 {
@@ -339,7 +339,8 @@ class SqlLabRestApi(BaseSupersetApi):
         params = kwargs["rison"]
         key = params.get("key")
         rows = params.get("rows")
-        result = SqlExecutionResultsCommand(key=key, rows=rows).run()
+        chunk = params.get("chunk")
+        result = SqlExecutionResultsCommand(key=key, rows=rows, chunk=chunk).run()
 
         # Using pessimistic json serialization since some database drivers can return
         # unserializeable types at times
@@ -19,10 +19,12 @@ from __future__ import annotations
 from typing import Any
 
 import pyarrow as pa
+from flask_babel import gettext as __
 
 from superset import db, is_feature_enabled
 from superset.common.db_query_status import QueryStatus
 from superset.daos.database import DatabaseDAO
+from superset.exceptions import InvalidPayloadFormatError
 from superset.models.sql_lab import TabState
 
 DATABASE_KEYS = [
@@ -80,6 +82,57 @@ def write_ipc_buffer(table: pa.Table) -> pa.Buffer:
     return sink.getvalue()
 
 
+def read_ipc_buffer(buffer: bytes) -> pa.Table:
+    reader = pa.BufferReader(buffer)
+    return pa.ipc.open_stream(reader).read_all()
+
+
+def get_results_chunk_key(key: str, chunk: int) -> str:
+    """
+    Return the results backend key of a chunk of query results.
+
+    Chunked results are stored as a payload with the query metadata under ``key``,
+    and each chunk of Arrow data under its own numbered key.
+    """
+    return f"{key}-chunk-{chunk}"
+
+
+def select_results_chunks(
+    chunk_rows: list[int],
+    chunk: int | None = None,
+    rows: int | None = None,
+) -> list[int]:
+    """
+    Return the indexes of the chunks needed to serve a request for results.
+
+    :param chunk_rows: The number of rows in each chunk
+    :param chunk: A specific chunk to return
+    :param rows: The number of rows to return, starting from the first chunk
+    :returns: The indexes of the chunks to read
+    :raises InvalidPayloadFormatError: If the chunk doesn't exist
+    """
+    if chunk is not None:
+        if not 0 <= chunk < len(chunk_rows):
+            raise InvalidPayloadFormatError(
+                message=__(
+                    "Chunk %(chunk)s doesn't exist, the results have %(chunks)s chunks",
+                    chunk=chunk,
+                    chunks=len(chunk_rows),
+                )
+            )
+        return [chunk]
+
+    indexes: list[int] = []
+    total = 0
+    for index, count in enumerate(chunk_rows):
+        if rows is not None and total >= rows:
+            break
+        indexes.append(index)
+        total += count
+
+    return indexes
+
+
 def bootstrap_sqllab_data(user_id: int | None) -> dict[str, Any]:
     tabs_state: list[Any] = []
     active_tab: Any = None
@@ -113,6 +113,33 @@ def load_chart_data_into_cache(
             raise
 
 
+@celery_app.task(name="refresh_chart_data_cache", soft_time_limit=query_timeout)
+def refresh_chart_data_cache(
+    job_metadata: dict[str, Any],
+    form_data: dict[str, Any],
+    cache_key: str,
+    lock_token: str | None = None,
+) -> None:
+    """
+    Refresh the cached query results of a query context served stale, then release
+    the revalidation lock of `cache_key` taken when enqueuing the refresh.
+    """
+    # pylint: disable=import-outside-toplevel
+    from superset.common.query_context_processor import REVALIDATION_LOCK_NAMESPACE
+    from superset.distributed_lock import release_cache_lock
+
+    with override_user(_load_user_from_job_metadata(job_metadata), force=False):
+        try:
+            set_form_data(form_data)
+            query_context = _create_query_context_from_form(form_data)
+            query_context.get_payload()
+        except SoftTimeLimitExceeded as ex:
+            logger.warning("A timeout occurred while refreshing chart data: %s", ex)
+            raise
+        finally:
+            release_cache_lock(REVALIDATION_LOCK_NAMESPACE, lock_token, key=cache_key)
+
+
 @celery_app.task(name="load_explore_json_into_cache", soft_time_limit=query_timeout)
 def load_explore_json_into_cache(  # pylint: disable=too-many-locals
     job_metadata: dict[str, Any],
@@ -63,7 +63,7 @@ def set_and_log_cache(
     )
     try:
         dttm = datetime.utcnow().isoformat().split(".")[0]
-        value = {**cache_value, "dttm": dttm}
+        value = {"dttm": dttm, **cache_value}
         cache_instance.set(cache_key, value, timeout=timeout)
         stats_logger.incr("set_cache_key")
 
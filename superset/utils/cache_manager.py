@@ -19,9 +19,11 @@ from typing import Any, Optional, Union
 
 from flask import Flask
 from flask_caching import Cache
+from flask_caching.backends import NullCache
 from markupsafe import Markup
 
 from superset.utils.core import DatasourceType
+from superset.utils.local_cache import LocalCache
 
 logger = logging.getLogger(__name__)
 
@@ -55,6 +57,7 @@ class CacheManager:
 
         self._cache = Cache()
         self._data_cache = Cache()
+        self._local_data_cache = LocalCache()
         self._thumbnail_cache = Cache()
         self._filter_state_cache = Cache()
         self._explore_form_data_cache = ExploreFormDataCache()
@@ -89,6 +92,11 @@ class CacheManager:
     def init_app(self, app: Flask) -> None:
         self._init_cache(app, self._cache, "CACHE_CONFIG")
         self._init_cache(app, self._data_cache, "DATA_CACHE_CONFIG")
+        # the local tier only fronts an actual data cache
+        if not isinstance(self._data_cache.cache, NullCache):
+            self._local_data_cache.max_size = app.config["DATA_CACHE_LOCAL_SIZE"]
+            self._local_data_cache.timeout = app.config["DATA_CACHE_LOCAL_TIMEOUT"]
+            self._local_data_cache.stats_logger = app.config["STATS_LOGGER"]
         self._init_cache(app, self._thumbnail_cache, "THUMBNAIL_CACHE_CONFIG")
         self._init_cache(
             app, self._filter_state_cache, "FILTER_STATE_CACHE_CONFIG", required=True
@@ -104,6 +112,10 @@ class CacheManager:
     def data_cache(self) -> Cache:
         return self._data_cache
 
+    @property
+    def local_data_cache(self) -> LocalCache:
+        return self._local_data_cache
+
     @property
     def cache(self) -> Cache:
         return self._cache
@@ -0,0 +1,96 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Helpers to run work of the current request on other threads.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import threading
+from functools import wraps
+from typing import Any, Callable, TypeVar
+
+from flask import current_app, g, has_request_context
+
+T = TypeVar("T")
+
+_database_semaphores: dict[int | None, threading.BoundedSemaphore] = {}
+_database_semaphores_lock = threading.Lock()
+
+
+def get_database_semaphore(
+    database_id: int | None,
+    limit: int,
+) -> threading.BoundedSemaphore:
+    """
+    Return the process wide semaphore bounding the concurrent queries of a database.
+
+    The semaphore is created with ``limit`` slots the first time a database is seen.
+    """
+    with _database_semaphores_lock:
+        if database_id not in _database_semaphores:
+            _database_semaphores[database_id] = threading.BoundedSemaphore(limit)
+        return _database_semaphores[database_id]
+
+
+def run_in_app_context(func: Callable[..., T]) -> Callable[..., T]:
+    """
+    Wrap ``func`` so it can be called from another thread.
+
+    Flask contexts are local to the thread handling the request, so the wrapper
+    pushes the current app context, with a copy of ``g``, before calling ``func`` in
+    a copy of the current context variables, e.g. the span being traced. Popping the
+    app context removes the SQLAlchemy session of the thread once ``func`` returns.
+
+    The request context is not shared with the thread. Instead, the form data of the
+    current request is stored in ``g.form_data``, which is where it's read from when
+    there is no request, as in async queries.
+    """
+    # pylint: disable=protected-access
+    app = current_app._get_current_object()  # type: ignore[attr-defined]
+    g_values = dict(g._get_current_object().__dict__)
+    if has_request_context() and "form_data" not in g_values:
+        g_values["form_data"] = _get_request_form_data()
+    # the Flask contexts are context variables as well, so they are left out
+    context = contextvars.Context()
+    for var, value in contextvars.copy_context().items():
+        if not var.name.startswith("flask."):
+            context.run(var.set, value)
+
+    def run(*args: Any, **kwargs: Any) -> T:
+        with app.app_context():
+            for key, value in g_values.items():
+                setattr(g, key, value)
+            if isinstance(g_values.get("form_data"), dict):
+                # reading the form data updates it in place
+                g.form_data = dict(g_values["form_data"])
+            return func(*args, **kwargs)
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> T:
+        return context.run(run, *args, **kwargs)
+
+    return wrapper
+
+
+def _get_request_form_data() -> dict[str, Any]:
+    # pylint: disable=import-outside-toplevel
+    from superset.views.utils import get_form_data
+
+    form_data, _ = get_form_data()
+    return form_data
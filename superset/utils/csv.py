@@ -17,11 +17,15 @@
 import logging
 import re
 import urllib.request
-from typing import Any, Optional, Union
+from collections.abc import Iterator
+from typing import Any, Callable, Optional, Union
 from urllib.error import URLError
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+from numpy.typing import NDArray
 
 from superset.utils import json
 from superset.utils.core import GenericDataType
@@ -38,6 +42,11 @@ negative_number_re = re.compile(r"^-[0-9.]+$")
 #
 problematic_chars_re = re.compile(r'^(?:"{2}|\s{1,})(?=[\-@+|=%])|^[\-@+|=%]')
 
+# The ASCII characters a match of ``problematic_chars_re`` can start with
+problematic_first_chars = '-@+|=%"' + "".join(
+    char for char in map(chr, range(128)) if char.isspace()
+)
+
 
 def escape_value(value: str) -> str:
     """
@@ -64,21 +73,123 @@ def escape_value(value: str) -> str:
     return value
 
 
-def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> Any:
-    def escape_values(v: Any) -> Union[str, Any]:
-        return escape_value(v) if isinstance(v, str) else v
+def _starting_with(strings: NDArray[Any], first_chars: str) -> NDArray[Any]:
+    """
+    Return the positions of the strings that may start with one of ``first_chars``.
+
+    Strings starting with any other ASCII character are filtered out in Arrow, all
+    the others are kept.
+    """
+    try:
+        array = pa.array(strings, type=pa.string())
+    except (pa.ArrowException, UnicodeEncodeError):
+        return np.arange(len(strings))
+
+    other_chars = pa.array(
+        [char for char in map(chr, range(128)) if char not in first_chars]
+    )
+    first = pc.utf8_slice_codeunits(array, 0, 1)
+    skipped = pc.is_in(first, value_set=other_chars).to_numpy(zero_copy_only=False)
+    return np.flatnonzero(~skipped)
+
+
+def quote_strings(  # pylint: disable=too-many-arguments
+    values: pd.Series,
+    pattern: re.Pattern[str],
+    first_chars: str,
+    exclude: Optional[re.Pattern[str]] = None,
+    transform: Optional[Callable[[pd.Series], pd.Series]] = None,
+) -> pd.Series:
+    """
+    Precede with a single quote the strings in ``values`` that match ``pattern``
+    but not ``exclude``, after applying ``transform`` to them.
 
-    # Escape csv headers
-    df = df.rename(columns=escape_values)
+    ``first_chars`` are the ASCII characters a match of ``pattern`` can start with.
+    Strings starting with any other ASCII character are skipped in bulk, so the
+    regular expressions only run on the few candidates. Values that are not strings
+    are returned as-is, and ``values`` itself is never modified.
+    """
+    array = values.to_numpy(dtype=object)
+    if pd.api.types.infer_dtype(array, skipna=False) == "string":
+        positions = np.arange(len(array))
+    else:
+        positions = np.flatnonzero([isinstance(value, str) for value in array])
+
+    positions = positions[_starting_with(array[positions], first_chars)]
+    strings = pd.Series(array[positions], dtype=object)
+    matches = strings.str.match(pattern.pattern, na=False).to_numpy(dtype=bool)
+    if exclude is not None and matches.any():
+        matches[matches] = ~strings[matches].str.match(
+            exclude.pattern, na=False
+        ).to_numpy(dtype=bool)
+    if not matches.any():
+        return values
+
+    quoted = strings[matches]
+    if transform is not None:
+        quoted = transform(quoted)
+
+    result = array.copy()
+    result[positions[matches]] = ("'" + quoted).to_numpy(dtype=object)
+    return pd.Series(result, index=values.index, name=values.name, dtype=object)
+
+
+def escape_values(values: pd.Series) -> pd.Series:
+    """
+    Vectorized ``escape_value``, applied to all the strings in ``values``.
+    """
+    return quote_strings(
+        values,
+        problematic_chars_re,
+        problematic_first_chars,
+        exclude=negative_number_re,
+        transform=lambda strings: strings.str.replace("|", "\\|", regex=False),
+    )
 
-    # Escape csv values
-    for name, column in df.items():
+
+def _escape_if_str(value: Any) -> Union[str, Any]:
+    return escape_value(value) if isinstance(value, str) else value
+
+
+def _escape_object_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Escape the string values of every object column in ``df``, in place.
+    """
+    for idx, (_, column) in enumerate(df.items()):
         if column.dtype == np.dtype(object):
-            for idx, value in enumerate(column.values):
-                if isinstance(value, str):
-                    df.at[idx, name] = escape_value(value)
+            df.isetitem(idx, escape_values(column))
+    return df
 
-    return df.to_csv(escapechar="\\", **kwargs)
+
+def df_to_escaped_csv_chunks(
+    df: pd.DataFrame,
+    chunk_size: int = 10000,
+    **kwargs: Any,
+) -> Iterator[str]:
+    """
+    Lazily serialize a dataframe to escaped CSV, ``chunk_size`` rows at a time.
+
+    Only a single chunk of escaped values and its CSV text are held in memory at
+    any point, which allows large exports to be streamed to the client instead of
+    being built as one string. The header, if any, is emitted with the first chunk.
+    """
+    header = kwargs.pop("header", True)
+    num_rows = len(df.index)
+
+    for start in range(0, max(num_rows, 1), chunk_size):
+        # renaming copies the slice, so escaping never touches the caller's frame
+        chunk = df.iloc[start : start + chunk_size].rename(columns=_escape_if_str)
+        yield _escape_object_columns(chunk).to_csv(
+            escapechar="\\",
+            header=header if start == 0 else False,
+            **kwargs,
+        )
+
+
+def df_to_escaped_csv(df: pd.DataFrame, **kwargs: Any) -> str:
+    return "".join(
+        df_to_escaped_csv_chunks(df, chunk_size=max(len(df.index), 1), **kwargs)
+    )
 
 
 def get_chart_csv_data(
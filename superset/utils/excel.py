@@ -15,27 +15,25 @@
 # specific language governing permissions and limitations
 # under the License.
 import io
+import re
 from typing import Any
 
+import numpy as np
 import pandas as pd
 
 from superset.utils.core import GenericDataType
+from superset.utils.csv import quote_strings
+
+formula_re = re.compile(r"^[=+\-@]")
 
 
 def quote_formulas(df: pd.DataFrame) -> pd.DataFrame:
     """
     Make sure to quote any formulas for security reasons.
     """
-    formula_prefixes = {"=", "+", "-", "@"}
-
-    for col in df.select_dtypes(include="object").columns:
-        df[col] = df[col].apply(
-            lambda x: (
-                f"'{x}"
-                if isinstance(x, str) and len(x) and x[0] in formula_prefixes
-                else x
-            )
-        )
+    for idx, (_, column) in enumerate(df.items()):
+        if column.dtype == np.dtype(object):
+            df.isetitem(idx, quote_strings(column, formula_re, "=+-@"))
 
     return df
 
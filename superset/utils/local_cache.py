@@ -0,0 +1,168 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+A per-process LRU tier in front of the chart data cache.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+from pandas import DataFrame
+
+from superset.stats_logger import BaseStatsLogger, DummyStatsLogger
+
+
+class LocalCacheEntry(NamedTuple):
+    value: dict[str, Any]
+    size: int
+    expires_at: float
+    datasource_uid: str | None
+
+
+def get_value_size(value: dict[str, Any]) -> int:
+    """
+    Estimate the memory used by a cached value, dominated by its dataframe.
+    """
+    size = sum(sys.getsizeof(val) for val in value.values())
+    if isinstance(df := value.get("df"), DataFrame):
+        size += int(df.memory_usage(index=True, deep=True).sum())
+    return size
+
+
+class LocalCache:
+    """
+    A thread safe LRU cache of chart data query results, bounded by the estimated
+    memory of its values and held by each process.
+
+    Entries expire after the timeout they are set with, capped at the timeout of the
+    local cache, as deleting an entry from the shared cache doesn't reach the other
+    processes. Entries are tagged with the uid of their datasource, so they can be
+    invalidated when it changes. The dataframes of values are copied on the way in
+    and out, so callers can mutate them.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 0,
+        timeout: int = 0,
+        stats_logger: BaseStatsLogger | None = None,
+    ) -> None:
+        self.max_size = max_size
+        self.timeout = timeout
+        self.stats_logger = stats_logger or DummyStatsLogger()
+        self._entries: OrderedDict[str, LocalCacheEntry] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_size > 0 and self.timeout > 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _copy(value: dict[str, Any]) -> dict[str, Any]:
+        if isinstance(df := value.get("df"), DataFrame):
+            return {**value, "df": df.copy()}
+        return dict(value)
+
+    def _pop(self, key: str) -> None:
+        if (entry := self._entries.pop(key, None)) is not None:
+            self._size -= entry.size
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        if not self.enabled:
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._pop(key)
+                entry = None
+            if entry is None:
+                self.stats_logger.incr("local_cache_miss")
+                return None
+            self._entries.move_to_end(key)
+
+        self.stats_logger.incr("local_cache_hit")
+        return self._copy(entry.value)
+
+    def set(
+        self,
+        key: str,
+        value: dict[str, Any],
+        timeout: int | None = None,
+        datasource_uid: str | None = None,
+    ) -> None:
+        if not self.enabled:
+            return
+
+        timeout = min(timeout or self.timeout, self.timeout)
+        size = get_value_size(value)
+        if size > self.max_size:
+            self.delete(key)
+            return
+
+        entry = LocalCacheEntry(
+            value=self._copy(value),
+            size=size,
+            expires_at=time.monotonic() + timeout,
+            datasource_uid=datasource_uid,
+        )
+        with self._lock:
+            self._pop(key)
+            self._entries[key] = entry
+            self._size += size
+            while self._size > self.max_size:
+                self._pop(next(iter(self._entries)))
+                self.stats_logger.incr("local_cache_eviction")
+
+    def has(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry.expires_at > time.monotonic()
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._pop(key)
+
+    def invalidate(self, datasource_uid: str) -> None:
+        """
+        Delete the entries of a datasource.
+        """
+        with self._lock:
+            for key in [
+                key
+                for key, entry in self._entries.items()
+                if entry.datasource_uid == datasource_uid
+            ]:
+                self._pop(key)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
@@ -16,17 +16,22 @@
 # under the License.
 from __future__ import annotations
 
+import atexit
 import functools
 import inspect
 import logging
+import os
+import queue
 import textwrap
+import threading
+import time
 from abc import ABC, abstractmethod
 from collections.abc import Iterator
 from contextlib import contextmanager
 from datetime import datetime, timedelta
 from typing import Any, Callable, cast, Literal, TYPE_CHECKING
 
-from flask import g, request
+from flask import current_app, Flask, g, request
 from flask_appbuilder.const import API_URI_RIS_KEY
 from sqlalchemy.exc import SQLAlchemyError
 
@@ -368,6 +373,37 @@ def get_event_logger_from_cfg_value(cfg_value: Any) -> AbstractEventLogger:
 class DBEventLogger(AbstractEventLogger):
     """Event logger that commits logs to Superset DB"""
 
+    @staticmethod
+    def get_log_values(  # pylint: disable=too-many-arguments
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        records: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Return the column values of the logs of the records"""
+        values = []
+        for record in records:
+            json_string: str | None
+            try:
+                json_string = json.dumps(record)
+            except Exception:  # pylint: disable=broad-except
+                json_string = None
+            values.append(
+                {
+                    "action": action,
+                    "json": json_string,
+                    "dashboard_id": dashboard_id,
+                    "slice_id": slice_id,
+                    "duration_ms": duration_ms,
+                    "referrer": referrer,
+                    "user_id": user_id,
+                }
+            )
+        return values
+
     def log(  # pylint: disable=too-many-arguments,too-many-locals
         self,
         user_id: int | None,
@@ -383,24 +419,18 @@ class DBEventLogger(AbstractEventLogger):
         from superset import db
         from superset.models.core import Log
 
-        records = kwargs.get("records", [])
-        logs = []
-        for record in records:
-            json_string: str | None
-            try:
-                json_string = json.dumps(record)
-            except Exception:  # pylint: disable=broad-except
-                json_string = None
-            log = Log(
-                action=action,
-                json=json_string,
-                dashboard_id=dashboard_id,
-                slice_id=slice_id,
-                duration_ms=duration_ms,
-                referrer=referrer,
-                user_id=user_id,
+        logs = [
+            Log(**values)
+            for values in self.get_log_values(
+                user_id,
+                action,
+                dashboard_id,
+                duration_ms,
+                slice_id,
+                referrer,
+                kwargs.get("records", []),
             )
-            logs.append(log)
+        ]
         try:
             db.session.bulk_save_objects(logs)
             db.session.commit()  # pylint: disable=consider-using-transaction
@@ -409,6 +439,134 @@ class DBEventLogger(AbstractEventLogger):
             logging.exception(ex)
 
 
+class AsyncDBEventLogger(DBEventLogger):
+    """
+    Event logger that queues logs, which a background thread of each process inserts
+    into Superset DB in batches, rather than committing them within requests
+
+    Logs are inserted once `batch_size` of them are queued or `flush_interval` seconds
+    after the first of them was. Once `max_queue_size` logs are queued, logging an
+    event waits up to `put_timeout` seconds for the queue to drain, after which the
+    event is dropped. Queued logs are inserted when the process exits.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 500,
+        flush_interval: float = 1.0,
+        max_queue_size: int = 10000,
+        put_timeout: float = 0.1,
+    ) -> None:
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_queue_size = max_queue_size
+        self.put_timeout = put_timeout
+        self._queue: queue.Queue[dict[str, Any]] = queue.Queue(max_queue_size)
+        self._stopped = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._pid: int | None = None
+        self._lock = threading.Lock()
+
+    def log(  # pylint: disable=too-many-arguments
+        self,
+        user_id: int | None,
+        action: str,
+        dashboard_id: int | None,
+        duration_ms: int | None,
+        slice_id: int | None,
+        referrer: str | None,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        self._start()
+        dttm = datetime.utcnow()
+        for values in self.get_log_values(
+            user_id,
+            action,
+            dashboard_id,
+            duration_ms,
+            slice_id,
+            referrer,
+            kwargs.get("records", []),
+        ):
+            try:
+                self._queue.put({**values, "dttm": dttm}, timeout=self.put_timeout)
+            except queue.Full:
+                stats_logger_manager.instance.incr("event_logger_dropped")
+                logging.warning("AsyncDBEventLogger queue is full, dropping event(s)")
+                return
+
+    def _start(self) -> None:
+        # threads don't survive forking, e.g. into the workers of a server, which get
+        # their own queue and thread
+        if self._pid == os.getpid():
+            return
+
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+
+            # pylint: disable=protected-access
+            app = current_app._get_current_object()  # type: ignore[attr-defined]
+            self._queue = queue.Queue(self.max_queue_size)
+            self._stopped = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run,
+                args=(app,),
+                name="AsyncDBEventLogger",
+                daemon=True,
+            )
+            self._thread.start()
+            self._pid = os.getpid()
+            atexit.register(self.shutdown)
+
+    def shutdown(self, timeout: float | None = None) -> None:
+        """Insert the queued logs and stop the background thread"""
+        self._stopped.set()
+        if self._thread is not None and self._pid == os.getpid():
+            self._thread.join(timeout)
+
+    def _run(self, app: Flask) -> None:
+        with app.app_context():
+            while not (self._stopped.is_set() and self._queue.empty()):
+                if batch := self._get_batch():
+                    self._insert(batch)
+
+    def _get_batch(self) -> list[dict[str, Any]]:
+        batch: list[dict[str, Any]] = []
+        deadline: float | None = None
+        while len(batch) < self.batch_size:
+            if self._stopped.is_set():
+                timeout = 0.0
+            elif deadline is None:
+                timeout = self.flush_interval
+            else:
+                timeout = deadline - time.monotonic()
+            try:
+                batch.append(self._queue.get(timeout=max(timeout, 0)))
+            except queue.Empty:
+                if batch or self._stopped.is_set():
+                    break
+                continue
+            if deadline is None:
+                deadline = time.monotonic() + self.flush_interval
+        return batch
+
+    def _insert(self, batch: list[dict[str, Any]]) -> None:
+        # pylint: disable=import-outside-toplevel
+        from superset import db
+        from superset.models.core import Log
+
+        try:
+            # an executemany, which drivers such as psycopg2 and mysqlclient send as
+            # multi-row INSERTs
+            with db.engine.begin() as connection:
+                connection.execute(Log.__table__.insert(), batch)
+        except SQLAlchemyError as ex:
+            logging.error("AsyncDBEventLogger failed to log %s event(s)", len(batch))
+            logging.exception(ex)
+
+
 class StdOutEventLogger(AbstractEventLogger):
     """Event logger that prints to stdout for debugging purposes"""
 
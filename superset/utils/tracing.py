@@ -0,0 +1,153 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+"""
+Timelines of where a request spends its time, as trees of spans.
+
+A trace is started for the request with `start_trace`, and the code it runs opens
+spans with `span` or `traced`, which are nested under the span open in the current
+context. Spans are only recorded while a trace is started, otherwise opening one is a
+noop.
+"""
+
+from __future__ import annotations
+
+import re
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import wraps
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# Characters not allowed in the names of the metrics of a Server-Timing header
+SERVER_TIMING_INVALID_CHARS_REGEX = re.compile(r"[^\w!#$%&'*+.^`|~-]")
+
+_current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+@dataclass
+class Span:
+    name: str
+    start: float = field(default_factory=time.perf_counter)
+    end: Optional[float] = None
+    children: list[Span] = field(default_factory=list)
+
+    @property
+    def duration_ms(self) -> float:
+        end = time.perf_counter() if self.end is None else self.end
+        return (end - self.start) * 1000
+
+    def to_dict(self, origin: Optional[float] = None) -> dict[str, Any]:
+        """
+        Get the tree of the span, with the start of each span in milliseconds since
+        the start of the root span.
+        """
+        origin = self.start if origin is None else origin
+        return {
+            "name": self.name,
+            "start_ms": round((self.start - origin) * 1000, 3),
+            "duration_ms": round(self.duration_ms, 3),
+            "children": [child.to_dict(origin) for child in self.children],
+        }
+
+    def get_durations(self) -> dict[str, float]:
+        """
+        Get the total duration of the spans under the span by name, in milliseconds,
+        not counting spans nested in spans of the same name twice.
+        """
+        durations: dict[str, float] = {}
+
+        def add(span: Span, names: frozenset[str]) -> None:
+            for child in span.children:
+                if child.name not in names:
+                    durations[child.name] = (
+                        durations.get(child.name, 0) + child.duration_ms
+                    )
+                add(child, names | {child.name})
+
+        add(self, frozenset())
+        return durations
+
+
+def get_current_span() -> Optional[Span]:
+    return _current_span.get()
+
+
+@contextmanager
+def start_trace(name: str) -> Iterator[Span]:
+    """
+    Start a trace, recording the spans opened in the current context until it ends.
+
+    :param name: The name of the root span of the trace
+    """
+    root = Span(name)
+    token = _current_span.set(root)
+    try:
+        yield root
+    finally:
+        root.end = time.perf_counter()
+        _current_span.reset(token)
+
+
+@contextmanager
+def span(name: str) -> Iterator[Optional[Span]]:
+    """
+    Open a span nested under the current span, if a trace is started.
+    """
+    if (parent := _current_span.get()) is None:
+        yield None
+        return
+
+    child = Span(name)
+    parent.children.append(child)
+    token = _current_span.set(child)
+    try:
+        yield child
+    finally:
+        child.end = time.perf_counter()
+        _current_span.reset(token)
+
+
+def traced(name: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Decorator opening a span around each call of a function.
+    """
+
+    def decorator(func: Callable[..., T]) -> Callable[..., T]:
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> T:
+            with span(name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def get_server_timing(root: Span) -> str:
+    """
+    Get the value of a Server-Timing header from a trace, with the total duration of
+    the trace and of the spans under it by name.
+    """
+    durations = {root.name: root.duration_ms, **root.get_durations()}
+    return ", ".join(
+        f"{SERVER_TIMING_INVALID_CHARS_REGEX.sub('_', name)};dur={duration:.1f}"
+        for name, duration in durations.items()
+    )
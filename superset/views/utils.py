@@ -18,18 +18,20 @@ import contextlib
 import logging
 from collections import defaultdict
 from functools import wraps
-from typing import Any, Callable, DefaultDict, Optional, Union
+from typing import Any, Callable, cast, DefaultDict, Optional, Union
 
 import msgpack
+import pandas as pd
 import pyarrow as pa
 from flask import flash, g, has_request_context, redirect, request
 from flask_appbuilder.security.sqla import models as ab_models
 from flask_appbuilder.security.sqla.models import User
 from flask_babel import _
+from flask_caching.backends.base import BaseCache
 from sqlalchemy.exc import NoResultFound
 from werkzeug.wrappers.response import Response
 
-from superset import app, dataframe, db, result_set, viz
+from superset import app, dataframe, db, result_set, results_backend, viz
 from superset.common.db_query_status import QueryStatus
 from superset.daos.datasource import DatasourceDAO
 from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
@@ -45,9 +47,14 @@ from superset.models.core import Database
 from superset.models.dashboard import Dashboard
 from superset.models.slice import Slice
 from superset.models.sql_lab import Query
+from superset.sqllab.utils import (
+    get_results_chunk_key,
+    read_ipc_buffer,
+    select_results_chunks,
+)
 from superset.superset_typing import FormData
 from superset.utils import json
-from superset.utils.core import DatasourceType
+from superset.utils.core import DatasourceType, zlib_decompress
 from superset.utils.decorators import stats_timing
 from superset.viz import BaseViz
 
@@ -498,8 +505,39 @@ def check_datasource_perms(
     viz_obj.raise_for_access()
 
 
+def _read_results_chunks(
+    key: str,
+    chunk_rows: list[int],
+    chunk: Optional[int] = None,
+    rows: Optional[int] = None,
+) -> pd.DataFrame:
+    """
+    Read the chunks of query results needed to serve a request.
+
+    Only the requested chunk, or the leading chunks covering ``rows``, are fetched
+    from the results backend.
+    """
+    dfs: list[pd.DataFrame] = []
+    for index in select_results_chunks(chunk_rows, chunk, rows):
+        blob = cast(BaseCache, results_backend).get(get_results_chunk_key(key, index))
+        if not blob:
+            raise SerializationError(f"Results chunk {index} could not be retrieved")
+        try:
+            pa_table = read_ipc_buffer(cast(bytes, zlib_decompress(blob, decode=False)))
+        except pa.ArrowSerializationError as ex:
+            raise SerializationError("Unable to deserialize table") from ex
+        dfs.append(result_set.SupersetResultSet.convert_table_to_df(pa_table))
+
+    # chunks are serialized independently, so their types may differ
+    return pd.concat(dfs, ignore_index=True) if dfs else pd.DataFrame()
+
+
 def _deserialize_results_payload(
-    payload: Union[bytes, str], query: Query, use_msgpack: Optional[bool] = False
+    payload: Union[bytes, str],
+    query: Query,
+    use_msgpack: Optional[bool] = False,
+    chunk: Optional[int] = None,
+    rows: Optional[int] = None,
 ) -> dict[str, Any]:
     logger.debug("Deserializing from msgpack: %r", use_msgpack)
     if use_msgpack:
@@ -509,13 +547,22 @@ def _deserialize_results_payload(
             ds_payload = msgpack.loads(payload, raw=False)
 
         with stats_timing("sqllab.query.results_backend_pa_deserialize", stats_logger):
-            try:
-                reader = pa.BufferReader(ds_payload["data"])
-                pa_table = pa.ipc.open_stream(reader).read_all()
-            except pa.ArrowSerializationError as ex:
-                raise SerializationError("Unable to deserialize table") from ex
+            if ds_payload.get("chunks") is not None:
+                df = _read_results_chunks(
+                    cast(str, query.results_key),
+                    ds_payload["chunk_rows"],
+                    chunk,
+                    rows,
+                )
+                ds_payload["chunk"] = chunk
+            else:
+                try:
+                    reader = pa.BufferReader(ds_payload["data"])
+                    pa_table = pa.ipc.open_stream(reader).read_all()
+                except pa.ArrowSerializationError as ex:
+                    raise SerializationError("Unable to deserialize table") from ex
+                df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
 
-        df = result_set.SupersetResultSet.convert_table_to_df(pa_table)
         ds_payload["data"] = dataframe.df_to_records(df) or []
 
         for column in ds_payload["selected_columns"]:
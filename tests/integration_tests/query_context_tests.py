@@ -302,7 +302,7 @@ class TestQueryContext(SupersetTestCase):
         query_context: QueryContext = ChartDataQueryContextSchema().load(payload)
         responses = query_context.get_payload()
         assert len(responses) == 1
-        data = responses["queries"][0]["data"]
+        data = "".join(responses["queries"][0]["data"])
         assert "name,sum__num\n" in data
         assert len(data.split("\n")) == 12
 
@@ -0,0 +1,175 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+
+import pytest
+from pytest_mock import MockerFixture
+
+from superset.charts.data.api import ChartDataRestApi
+from superset.commands.chart.exceptions import ChartDataQueryFailedError
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.daos.exceptions import DatasourceNotFound
+from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
+from superset.exceptions import SupersetSecurityException
+from superset.utils import json
+
+BATCH_URI = "/api/v1/chart/data/batch"
+
+
+def test_data_batch(mocker: MockerFixture, client: Any, full_api_access: None) -> None:
+    """
+    Test that the batch endpoint streams the response of each query context, including
+    the errors, as newline delimited JSON.
+    """
+    query_context = mocker.MagicMock(
+        result_format=ChartDataResultFormat.JSON,
+        result_type=ChartDataResultType.FULL,
+    )
+    csv_query_context = mocker.MagicMock(
+        result_format=ChartDataResultFormat.CSV,
+        result_type=ChartDataResultType.FULL,
+    )
+    mocker.patch.object(
+        ChartDataRestApi,
+        "_create_query_context_from_form",
+        side_effect=[
+            query_context,
+            DatasourceNotFound(),
+            query_context,
+            query_context,
+            csv_query_context,
+            query_context,
+            query_context,
+        ],
+    )
+    command = mocker.patch("superset.charts.data.api.ChartDataCommand").return_value
+    command.validate.side_effect = [
+        None,
+        SupersetSecurityException(
+            SupersetError(
+                message="Forbidden",
+                error_type=SupersetErrorType.DATASOURCE_SECURITY_ACCESS_ERROR,
+                level=ErrorLevel.ERROR,
+            )
+        ),
+        None,
+        None,
+        None,
+        None,
+    ]
+    command.run.side_effect = [
+        {"queries": [{"data": [{"a": 1}]}]},
+        ChartDataQueryFailedError("Error: failed"),
+        RuntimeError("Unexpected"),
+        {"queries": [{"data": [{"a": 2}]}]},
+    ]
+
+    response = client.post(BATCH_URI, json={"query_contexts": [{}] * 7})
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/x-ndjson"
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"index": 0, "status": 200, "result": [{"data": [{"a": 1}]}]},
+        {"index": 1, "status": 404, "message": "Not found"},
+        {"index": 2, "status": 403, "message": "Forbidden"},
+        {"index": 3, "status": 400, "message": "Error: failed"},
+        {"index": 4, "status": 400, "message": "Unsupported result_format: csv"},
+        {"index": 5, "status": 500, "message": "Unexpected"},
+        {"index": 6, "status": 200, "result": [{"data": [{"a": 2}]}]},
+    ]
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {},
+        {"query_contexts": []},
+        {"query_contexts": [{}] * 3},
+    ],
+)
+def test_data_batch_invalid(
+    mocker: MockerFixture,
+    client: Any,
+    full_api_access: None,
+    payload: dict[str, Any],
+) -> None:
+    """
+    Test that the batch endpoint rejects missing, empty and too large batches.
+    """
+    mocker.patch.dict(
+        "flask.current_app.config", {"CHART_DATA_BATCH_MAX_QUERY_CONTEXTS": 2}
+    )
+    create_query_context = mocker.patch.object(
+        ChartDataRestApi, "_create_query_context_from_form"
+    )
+
+    response = client.post(BATCH_URI, json=payload)
+
+    assert response.status_code == 400
+    create_query_context.assert_not_called()
+
+
+def test_data_server_timing(
+    mocker: MockerFixture,
+    client: Any,
+    full_api_access: None,
+) -> None:
+    """
+    Test that the spans of a chart data request are logged and returned in the
+    Server-Timing header when enabled.
+    """
+    from superset.utils.tracing import span
+
+    mocker.patch.dict(
+        "flask.current_app.config",
+        {"CHART_DATA_TRACING": True, "CHART_DATA_SERVER_TIMING": True},
+    )
+    query_context = mocker.MagicMock(
+        result_format=ChartDataResultFormat.JSON,
+        result_type=ChartDataResultType.FULL,
+    )
+    mocker.patch.object(
+        ChartDataRestApi,
+        "_create_query_context_from_form",
+        return_value=query_context,
+    )
+
+    def run(**kwargs: Any) -> dict[str, Any]:
+        with span("query"):
+            return {"query_context": query_context, "queries": [{"data": []}]}
+
+    command = mocker.patch("superset.charts.data.api.ChartDataCommand").return_value
+    command.run.side_effect = run
+    log_with_context = mocker.patch(
+        "superset.charts.data.api.event_logger.log_with_context"
+    )
+
+    response = client.post("/api/v1/chart/data", json={})
+
+    assert response.status_code == 200
+    assert [
+        metric.split(";")[0] for metric in response.headers["Server-Timing"].split(", ")
+    ] == ["total", "query", "serialization"]
+    (trace_call,) = [
+        call
+        for call in log_with_context.call_args_list
+        if call.kwargs.get("action") == "chart_data_trace"
+    ]
+    assert [child["name"] for child in trace_call.kwargs["trace"]["children"]] == [
+        "query",
+        "serialization",
+    ]
@@ -1966,22 +1966,22 @@ def test_apply_client_processing_json_format():
     }
 
 
-def test_apply_client_processing_csv_format():
-    """
-    It should be able to process csv results
-    """
-
-    result = {
-        "queries": [
-            {
-                "result_format": ChartDataResultFormat.CSV,
-                "data": """
+@pytest.mark.parametrize(
+    "data",
+    [
+        """
 COUNT(is_software_dev)
 4725
 """,
-            }
-        ]
-    }
+        iter(["COUNT(is_software_dev)\n", "4725\n"]),
+    ],
+)
+def test_apply_client_processing_csv_format(data):
+    """
+    It should be able to process csv results, including streamed ones
+    """
+
+    result = {"queries": [{"result_format": ChartDataResultFormat.CSV, "data": data}]}
     form_data = {
         "datasource": "19__table",
         "viz_type": "pivot_table_v2",
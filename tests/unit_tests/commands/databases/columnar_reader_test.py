@@ -251,3 +251,15 @@ def test_columnar_reader_metadata_invalid_file():
         "Parsing error: Parquet file size is 2 bytes, "
         "smaller than the minimum file footer (8 bytes)"
     )
+
+
+def test_columnar_reader_file_to_dataframes_empty():
+    """
+    Test that a file without rows yields an empty DataFrame with its columns.
+    """
+    reader = ColumnarReader()
+    dfs = list(reader.file_to_dataframes(create_columnar_file({"Name": [], "Age": []})))
+
+    assert len(dfs) == 1
+    assert dfs[0].empty
+    assert list(dfs[0].columns) == ["Name", "Age"]
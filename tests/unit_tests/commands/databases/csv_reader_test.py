@@ -18,6 +18,7 @@ import io
 from datetime import datetime
 
 import numpy as np
+import pandas as pd
 import pytest
 from werkzeug.datastructures import FileStorage
 
@@ -371,3 +372,124 @@ def test_csv_reader_file_metadata_invalid_file():
         "Parsing error: Error tokenizing data. C error:"
         " Expected 3 fields in line 3, saw 7\n"
     )
+
+
+def test_csv_reader_file_to_dataframes(mocker):
+    mocker.patch.dict("flask.current_app.config", {"UPLOAD_ROWS_PER_CHUNK": 2})
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(),
+    )
+    dfs = list(csv_reader.file_to_dataframes(create_csv_file(CSV_DATA)))
+    assert [len(df) for df in dfs] == [2, 1]
+    assert [df.columns.tolist() for df in dfs] == [["Name", "Age", "City", "Birth"]] * 2
+    assert dfs[1].values.tolist() == [["name3", 20, "city3", "2000-02-01"]]
+
+
+def test_csv_reader_read(mocker, tmp_path):
+    from sqlalchemy import create_engine
+
+    from superset.models.core import Database
+
+    mocker.patch.dict("flask.current_app.config", {"UPLOAD_ROWS_PER_CHUNK": 2})
+    uri = f"sqlite:///{tmp_path / 'upload.db'}"
+    database = Database(database_name="db", sqlalchemy_uri=uri)
+    progress = mocker.MagicMock()
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(),
+    )
+    csv_reader.read(
+        create_csv_file(
+            [
+                ["Name", "Age"],
+                ["name1", "30"],
+                ["name2", ""],
+                ["name3", "20"],
+                ["name4", "1.5"],
+                ["5", "10"],
+            ]
+        ),
+        database,
+        "people",
+        None,
+        progress=progress,
+    )
+
+    assert [call.args for call in progress.call_args_list] == [(2,), (4,), (5,)]
+    with create_engine(uri).connect() as connection:
+        rows = connection.execute("SELECT Name, Age FROM people").fetchall()
+    assert [tuple(row) for row in rows] == [
+        ("name1", 30),
+        ("name2", None),
+        ("name3", 20),
+        ("name4", 1.5),
+        ("5", 10),
+    ]
+
+
+def test_csv_reader_read_extra_columns(mocker, tmp_path):
+    from superset.models.core import Database
+
+    mocker.patch.dict("flask.current_app.config", {"UPLOAD_ROWS_PER_CHUNK": 1})
+    database = Database(
+        database_name="db",
+        sqlalchemy_uri=f"sqlite:///{tmp_path / 'upload.db'}",
+    )
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(),
+    )
+    csv_reader.file_to_dataframes = lambda file: iter(
+        [pd.DataFrame({"a": [1]}), pd.DataFrame({"a": [2], "b": [3]})]
+    )
+    with pytest.raises(DatabaseUploadFailed) as ex:
+        csv_reader.read(create_csv_file(CSV_DATA), database, "table", None)
+    assert str(ex.value) == "Columns b are missing from the first rows of the file"
+
+
+def test_csv_reader_read_fractional_values(mocker, tmp_path):
+    from superset.models.core import Database
+
+    mocker.patch.dict("flask.current_app.config", {"UPLOAD_ROWS_PER_CHUNK": 2})
+    database = Database(
+        database_name="db",
+        sqlalchemy_uri=f"sqlite:///{tmp_path / 'upload.db'}",
+    )
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(),
+    )
+    with pytest.raises(DatabaseUploadFailed) as ex:
+        csv_reader.read(
+            create_csv_file([["Age"], ["30"], ["25"], ["1.5"], ["2.0"]]),
+            database,
+            "table",
+            None,
+        )
+    assert str(ex.value) == (
+        "Column Age has values not matching the type int64 inferred from the first "
+        "rows of the file, set its type explicitly: Cannot cast fractional values "
+        "to integers"
+    )
+
+
+def test_csv_reader_read_missing_booleans(mocker, tmp_path):
+    from sqlalchemy import create_engine
+
+    from superset.models.core import Database
+
+    mocker.patch.dict("flask.current_app.config", {"UPLOAD_ROWS_PER_CHUNK": 2})
+    uri = f"sqlite:///{tmp_path / 'upload.db'}"
+    database = Database(database_name="db", sqlalchemy_uri=uri)
+    csv_reader = CSVReader(
+        options=CSVReaderOptions(),
+    )
+    csv_reader.read(
+        create_csv_file(
+            [["Flag"], ["True"], ["False"], ["True"], [""], [""], [""]],
+        ),
+        database,
+        "flags",
+        None,
+    )
+
+    with create_engine(uri).connect() as connection:
+        rows = connection.execute("SELECT Flag FROM flags").fetchall()
+    assert [row[0] for row in rows] == [1, 0, 1, None, None, None]
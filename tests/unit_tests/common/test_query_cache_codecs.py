@@ -0,0 +1,121 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from __future__ import annotations
+
+from datetime import date
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+from flask_caching.backends import SimpleCache
+from pandas.testing import assert_frame_equal
+from pytest import mark  # noqa: PT013
+from pytest_mock import MockerFixture
+
+from superset.common.utils import query_cache_manager
+from superset.common.utils.query_cache_codecs import ArrowQueryCacheCodec
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion
+
+
+@mark.parametrize("compression", [None, "lz4", "zstd"])
+@mark.parametrize(
+    "df",
+    [
+        pd.DataFrame(),
+        pd.DataFrame(
+            {
+                "name": ["a", None, "c"],
+                "count": [1, 2, 3],
+                "ratio": [0.5, np.nan, 1.5],
+                "flag": [True, False, True],
+                "ds": pd.to_datetime(["2020-01-01", None, "2020-01-03"]),
+                "ds_tz": pd.date_range("2020-01-01", periods=3, tz="US/Eastern"),
+                "day": [date(2020, 1, 1), None, date(2020, 1, 3)],
+                "empty": [None, None, None],
+                "category": pd.Categorical(["x", "y", "x"]),
+            }
+        ),
+        pd.DataFrame(
+            {"count": [1, 2]},
+            index=pd.MultiIndex.from_tuples([("a", 1), ("b", 2)], names=["x", "y"]),
+        ),
+    ],
+)
+def test_arrow_codec_roundtrip(df: pd.DataFrame, compression: str | None) -> None:
+    """
+    Test that the Arrow codec decodes the dataframes it encodes unchanged.
+    """
+    codec = ArrowQueryCacheCodec(compression=compression)
+
+    encoded = codec.encode(df)
+
+    assert isinstance(encoded, bytes)
+    assert_frame_equal(codec.decode(encoded), df)
+
+
+@mark.parametrize(
+    "df",
+    [
+        pd.DataFrame({"nested": [[1, 2], [3]]}),
+        pd.DataFrame({"mixed": [1, "a"]}),
+        pd.DataFrame({"ints": [1, None]}, dtype=object),
+        pd.DataFrame({"decimal": [Decimal("1.5"), Decimal("2.25")]}),
+        pd.DataFrame({"nullable": pd.array([1, None], dtype="Int64")}),
+        pd.DataFrame([[1, 2]], columns=["a", "a"]),
+        pd.DataFrame({1: [1, 2]}),
+    ],
+)
+def test_arrow_codec_lossy(df: pd.DataFrame) -> None:
+    """
+    Test that the Arrow codec does not encode dataframes it can't decode unchanged.
+    """
+    assert ArrowQueryCacheCodec().encode(df) is None
+
+
+@mark.parametrize(
+    ("codec", "df_type"),
+    [(ArrowQueryCacheCodec(compression="lz4"), bytes), (None, pd.DataFrame)],
+)
+def test_query_cache_manager_codec(
+    mocker: MockerFixture, codec: ArrowQueryCacheCodec | None, df_type: type
+) -> None:
+    """
+    Test that the query cache manager encodes the cached dataframes with the
+    configured codec, and reads entries cached with any codec.
+    """
+    cache = mocker.MagicMock(cache=SimpleCache())
+    cache.set.side_effect = cache.cache.set
+    cache.get.side_effect = cache.cache.get
+    mocker.patch.dict(query_cache_manager._cache, {CacheRegion.DATA: cache})
+    mocker.patch.dict(query_cache_manager.config, {"DATA_CACHE_CODEC": codec})
+    df = pd.DataFrame({"name": ["a", "b"], "count": [1, 2]})
+
+    QueryCacheManager.set("key", {"df": df, "query": "SELECT"}, region=CacheRegion.DATA)
+
+    assert isinstance(cache.cache.get("key")["df"], df_type)
+
+    # switch codecs to read the entry
+    mocker.patch.dict(
+        query_cache_manager.config,
+        {"DATA_CACHE_CODEC": None if codec else ArrowQueryCacheCodec()},
+    )
+    query_cache = QueryCacheManager.get("key", region=CacheRegion.DATA)
+
+    assert query_cache.is_loaded
+    assert query_cache.query == "SELECT"
+    assert_frame_equal(query_cache.df, df)
@@ -0,0 +1,192 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from typing import Any
+
+import pandas as pd
+import pytest
+from flask_caching.backends import SimpleCache
+from pytest import fixture  # noqa: PT013
+from pytest_mock import MockerFixture
+
+from superset.common.utils import query_cache_manager
+from superset.common.utils.query_cache_manager import QueryCacheManager
+from superset.constants import CacheRegion
+from superset.exceptions import CacheLoadError
+from superset.extensions import cache_manager
+from superset.utils.local_cache import LocalCache
+
+
+@fixture
+def cache(mocker: MockerFixture) -> Any:
+    cache = mocker.MagicMock(cache=SimpleCache())
+    cache.set.side_effect = cache.cache.set
+    cache.get.side_effect = cache.cache.get
+    cache.delete_many.side_effect = cache.cache.delete_many
+    mocker.patch.dict(query_cache_manager._cache, {CacheRegion.DATA: cache})
+    return cache
+
+
+@fixture
+def local_cache(mocker: MockerFixture) -> LocalCache:
+    local_cache = LocalCache(max_size=10**6, timeout=60)
+    mocker.patch.object(cache_manager, "_local_data_cache", local_cache)
+    return local_cache
+
+
+def test_metadata_sidecar(cache: Any) -> None:
+    """
+    Test that the metadata of a cached dataframe is read without loading it.
+    """
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    QueryCacheManager.set(
+        "key", {"df": df, "query": "SELECT a"}, region=CacheRegion.DATA
+    )
+    cache.get.reset_mock()
+
+    metadata = QueryCacheManager.get_metadata("key", region=CacheRegion.DATA)
+
+    assert metadata is not None
+    assert metadata["rowcount"] == 3
+    assert metadata["query"] == "SELECT a"
+    assert "df" not in metadata
+    assert QueryCacheManager.has("key", region=CacheRegion.DATA)
+    assert {call.args[0] for call in cache.get.call_args_list} == {"key__metadata"}
+    assert metadata["dttm"] == cache.cache.get("key")["dttm"]
+    assert (
+        QueryCacheManager.get("key", region=CacheRegion.DATA).cache_dttm
+        == metadata["dttm"]
+    )
+
+
+def test_get_missing(cache: Any) -> None:
+    """
+    Test that a missing value is a miss, and raises when it must be cached.
+    """
+    assert not QueryCacheManager.get("key", region=CacheRegion.DATA).is_loaded
+    with pytest.raises(CacheLoadError):
+        QueryCacheManager.get("key", region=CacheRegion.DATA, force_cached=True)
+
+
+def test_get_without_sidecar(cache: Any) -> None:
+    """
+    Test that values cached without a metadata sidecar, e.g. before it was
+    introduced, are still read.
+    """
+    cache.cache.set(
+        "key",
+        {"df": pd.DataFrame({"a": [1]}), "query": "SELECT a", "dttm": "2024-01-01"},
+    )
+
+    query_cache = QueryCacheManager.get(
+        "key", region=CacheRegion.DATA, force_cached=True
+    )
+
+    assert query_cache.is_loaded
+    assert query_cache.df["a"].tolist() == [1]
+    assert query_cache.cache_dttm == "2024-01-01"
+
+
+def test_metadata_without_sidecar(cache: Any) -> None:
+    """
+    Test that values cached without a metadata sidecar are loaded whole.
+    """
+    cache.cache.set("key", {"df": pd.DataFrame({"a": [1]}), "query": "SELECT a"})
+
+    assert QueryCacheManager.get_metadata("key", region=CacheRegion.DATA) == {
+        "query": "SELECT a",
+        "rowcount": 1,
+    }
+    assert QueryCacheManager.has("key", region=CacheRegion.DATA)
+
+
+def test_metadata_missing(cache: Any) -> None:
+    """
+    Test that keys which aren't cached, or were deleted, have no metadata.
+    """
+    assert not QueryCacheManager.has("key", region=CacheRegion.DATA)
+    assert not QueryCacheManager.has(None, region=CacheRegion.DATA)
+
+    QueryCacheManager.set(
+        "key", {"df": pd.DataFrame({"a": [1]}), "query": ""}, region=CacheRegion.DATA
+    )
+    QueryCacheManager.delete("key", region=CacheRegion.DATA)
+
+    assert QueryCacheManager.get_metadata("key", region=CacheRegion.DATA) is None
+    assert cache.cache.get("key__metadata") is None
+
+
+def test_local_cache_write_through(cache: Any, local_cache: LocalCache) -> None:
+    """
+    Test that cached data is served by the local cache without reading the data cache.
+    """
+    QueryCacheManager.set(
+        "key",
+        {"df": pd.DataFrame({"a": [1]}), "query": "SELECT a"},
+        datasource_uid="1__table",
+        region=CacheRegion.DATA,
+    )
+    cache.get.reset_mock()
+
+    query_cache = QueryCacheManager.get("key", region=CacheRegion.DATA)
+
+    assert query_cache.is_loaded
+    assert query_cache.df["a"].tolist() == [1]
+    assert query_cache.query == "SELECT a"
+    assert query_cache.cache_dttm == cache.cache.get("key")["dttm"]
+    assert QueryCacheManager.has("key", region=CacheRegion.DATA)
+    cache.get.assert_not_called()
+
+    local_cache.invalidate("1__table")
+    assert QueryCacheManager.get("key", region=CacheRegion.DATA).is_loaded
+    assert [call.args[0] for call in cache.get.call_args_list] == [
+        "key__metadata",
+        "key",
+    ]
+
+
+def test_local_cache_read_through(cache: Any, local_cache: LocalCache) -> None:
+    """
+    Test that values read from the data cache are kept decoded in the local cache.
+    """
+    local_cache.max_size = 0
+    QueryCacheManager.set(
+        "key", {"df": pd.DataFrame({"a": [1]}), "query": ""}, region=CacheRegion.DATA
+    )
+    local_cache.max_size = 10**6
+
+    QueryCacheManager.get("key", region=CacheRegion.DATA, datasource_uid="1__table")
+    cached = local_cache.get("key")
+
+    assert cached is not None
+    assert isinstance(cached["df"], pd.DataFrame)
+    assert "df_codec" not in cached
+
+    local_cache.invalidate("1__table")
+    assert not local_cache.has("key")
+
+
+def test_local_cache_delete(cache: Any, local_cache: LocalCache) -> None:
+    """
+    Test that deleting a key also deletes it from the local cache.
+    """
+    QueryCacheManager.set(
+        "key", {"df": pd.DataFrame({"a": [1]}), "query": ""}, region=CacheRegion.DATA
+    )
+    QueryCacheManager.delete("key", region=CacheRegion.DATA)
+
+    assert not local_cache.has("key")
+    assert not QueryCacheManager.get("key", region=CacheRegion.DATA).is_loaded
@@ -0,0 +1,68 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from pytest import mark  # noqa: PT013
+from pytest_mock import MockerFixture
+
+from superset.common.query_context_factory import QueryContextFactory
+
+
+@mark.parametrize(("share_datasources", "lookups"), [(False, 3), (True, 2)])
+def test_share_datasources(
+    mocker: MockerFixture, share_datasources: bool, lookups: int
+) -> None:
+    """
+    Test that a factory sharing datasources looks each of them up only once.
+    """
+    get_datasource = mocker.patch(
+        "superset.common.query_context_factory.DatasourceDAO.get_datasource",
+        side_effect=lambda datasource_type, datasource_id: datasource_id,
+    )
+    factory = QueryContextFactory(share_datasources=share_datasources)
+
+    assert factory._convert_to_model({"type": "table", "id": 1}) == 1
+    assert factory._convert_to_model({"type": "table", "id": "1"}) == 1
+    assert factory._convert_to_model({"type": "table", "id": 2}) == 2
+    assert get_datasource.call_count == lookups
+
+
+def test_share_loaded_models(mocker: MockerFixture) -> None:
+    """
+    Test that datasources and charts added to a factory sharing them, e.g. those of
+    a dashboard, aren't looked up, including by its query object factory.
+    """
+    get_datasource = mocker.patch(
+        "superset.common.query_context_factory.DatasourceDAO.get_datasource"
+    )
+    find_chart = mocker.patch(
+        "superset.common.query_context_factory.ChartDAO.find_by_id"
+    )
+    datasource = mocker.MagicMock(type="table", id=1)
+    slice_ = mocker.MagicMock(id=2)
+    factory = QueryContextFactory(share_datasources=True)
+    factory.add_datasource(datasource)
+    factory.add_slice(slice_)
+
+    assert factory._convert_to_model({"type": "table", "id": "1"}) is datasource
+    assert (
+        factory._query_object_factory._convert_to_model({"type": "table", "id": 1})
+        is datasource
+    )
+    assert factory._get_slice("2") is slice_
+    assert factory._get_slice(3) is find_chart.return_value
+    assert factory._get_slice("3") is find_chart.return_value
+    get_datasource.assert_not_called()
+    find_chart.assert_called_once_with(3)
@@ -0,0 +1,417 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from typing import Any
+
+from pandas import DataFrame
+from pytest import fixture, mark  # noqa: PT013
+from pytest_mock import MockerFixture
+
+from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
+from superset.common.query_context import QueryContext
+from superset.common.query_context_processor import (
+    QueryContextProcessor,
+    share_df_payloads,
+)
+from superset.common.query_object import QueryObject
+from superset.exceptions import CreateKeyValueDistributedLockFailedException
+from superset.models.helpers import QueryResult
+
+PIVOT = {
+    "operation": "pivot",
+    "options": {
+        "index": ["a"],
+        "columns": [],
+        "aggregates": {"b": {"operator": "sum"}},
+    },
+}
+
+
+def make_processor(datasource: Any, force: bool = False) -> QueryContextProcessor:
+    return QueryContextProcessor(
+        QueryContext(
+            datasource=datasource,
+            queries=[],
+            result_type=ChartDataResultType.FULL,
+            form_data={},
+            slice_=None,
+            result_format=ChartDataResultFormat.JSON,
+            cache_values={},
+            force=force,
+        )
+    )
+
+
+@mark.parametrize(("shared", "loads"), [(False, 2), (True, 1)])
+def test_share_df_payloads(mocker: MockerFixture, shared: bool, loads: int) -> None:
+    """
+    Test that identical query objects are loaded only once within
+    `share_df_payloads`, and that each gets its own copy of the dataframe.
+    """
+    datasource = mocker.MagicMock(column_names=["a"])
+    processors = [make_processor(datasource) for _ in range(2)]
+    mocker.patch.object(QueryContextProcessor, "query_cache_key", return_value="key")
+    mocker.patch.object(QueryContextProcessor, "get_cache_timeout", return_value=60)
+    mocker.patch.object(
+        QueryContextProcessor, "get_stale_while_revalidate", return_value=0
+    )
+    get_cache = mocker.patch(
+        "superset.common.query_context_processor.QueryCacheManager.get"
+    )
+    get_cache.return_value.df = DataFrame({"a": [1, 2]})
+    query_obj = mocker.MagicMock()
+
+    with share_df_payloads() if shared else nullcontext():
+        payloads = [processor.get_df_payload(query_obj) for processor in processors]
+
+    assert get_cache.call_count == loads
+    assert [payload["cache_key"] for payload in payloads] == ["key", "key"]
+    assert payloads[0]["df"].equals(payloads[1]["df"])
+    if shared:
+        assert payloads[0]["df"] is not payloads[1]["df"]
+
+
+def test_sql_cache_key() -> None:
+    """
+    Test that query objects only differing in their post-processing share the same
+    SQL cache key, but not the same cache key.
+    """
+    query_object = QueryObject(columns=["a"], metrics=["b"])
+    pivoted_query_object = QueryObject(
+        columns=["a"], metrics=["b"], post_processing=[PIVOT]
+    )
+    other_query_object = QueryObject(columns=["a"], metrics=["c"])
+
+    assert query_object.cache_key() != pivoted_query_object.cache_key()
+    assert query_object.sql_cache_key() == pivoted_query_object.sql_cache_key()
+    assert query_object.sql_cache_key() != other_query_object.sql_cache_key()
+    assert query_object.sql_cache_key() != query_object.cache_key()
+
+
+@fixture
+def coalescing(mocker: MockerFixture) -> dict[str, Any]:
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {
+            "CHART_DATA_QUERY_COALESCING": True,
+            "CHART_DATA_QUERY_COALESCING_TIMEOUT": 60,
+            "SUPERSET_WEBSERVER_TIMEOUT": 120,
+        },
+    )
+    mocker.patch("superset.common.query_context_processor.time.sleep")
+    mocker.patch.object(QueryContextProcessor, "get_cache_timeout", return_value=60)
+    mocker.patch.object(
+        QueryContextProcessor, "query_sql_cache_key", return_value="sql_key"
+    )
+    return {
+        "lock": mocker.patch(
+            "superset.common.query_context_processor.CacheDistributedLock"
+        ),
+        "load": mocker.patch.object(QueryContextProcessor, "load_shared_query_result"),
+        "run": mocker.patch.object(
+            QueryContextProcessor,
+            "run_query",
+            side_effect=lambda query_object: QueryResult(
+                DataFrame({"a": ["x", "y"], "b": [1, 2]}), "SELECT", timedelta()
+            ),
+        ),
+        "set": mocker.patch(
+            "superset.common.query_context_processor.QueryCacheManager.set"
+        ),
+    }
+
+
+def test_coalesced_query_result_runs_query(
+    mocker: MockerFixture, coalescing: dict[str, Any]
+) -> None:
+    """
+    Test that the query result is shared through the cache before post-processing,
+    when the lock of the query is acquired.
+    """
+    coalescing["load"].return_value = None
+    processor = make_processor(mocker.MagicMock())
+    query_object = QueryObject(columns=["a"], metrics=["b"], post_processing=[PIVOT])
+
+    result = processor.get_query_result(query_object)
+
+    coalescing["run"].assert_called_once_with(query_object)
+    coalescing["lock"].assert_called_once_with("chart_data_query", 120, key="sql_key")
+    assert coalescing["set"].call_args.kwargs["key"] == "sql_key"
+    assert coalescing["set"].call_args.kwargs["value"]["df"].index.name is None
+    assert coalescing["set"].call_args.kwargs["value"]["sql_rowcount"] == 2
+    assert result.df.index.name == "a"
+
+
+def test_coalesced_query_result_from_cache(
+    mocker: MockerFixture, coalescing: dict[str, Any]
+) -> None:
+    """
+    Test that a shared query result is post-processed without running the query.
+    """
+    coalescing["load"].return_value = QueryResult(
+        DataFrame({"a": ["x", "y"], "b": [1, 2]}), "SELECT", timedelta()
+    )
+    processor = make_processor(mocker.MagicMock())
+    query_object = QueryObject(columns=["a"], metrics=["b"], post_processing=[PIVOT])
+
+    result = processor.get_query_result(query_object)
+
+    coalescing["run"].assert_not_called()
+    coalescing["lock"].assert_not_called()
+    assert result.df.index.name == "a"
+
+
+def test_load_shared_query_result(mocker: MockerFixture) -> None:
+    """
+    Test that the row count and duration of a shared query result are restored.
+    """
+    mocker.patch(
+        "superset.common.query_context_processor.QueryCacheManager.get",
+        return_value=mocker.MagicMock(
+            is_loaded=True,
+            df=DataFrame({"a": ["x"]}),
+            query="SELECT",
+            applied_template_filters=[],
+            applied_filter_columns=[],
+            rejected_filter_columns=[],
+            sql_rowcount=1000,
+            cache_value={"duration": 1.5},
+        ),
+    )
+    processor = make_processor(mocker.MagicMock())
+
+    result = processor.load_shared_query_result("sql_key")
+
+    assert result is not None
+    assert result.sql_rowcount == 1000
+    assert result.duration == timedelta(seconds=1.5)
+
+
+def test_coalesced_query_result_waits(
+    mocker: MockerFixture, coalescing: dict[str, Any]
+) -> None:
+    """
+    Test that the result of an identical query in flight is awaited, instead of
+    running the query again.
+    """
+    coalescing["lock"].side_effect = CreateKeyValueDistributedLockFailedException(
+        "Lock already taken"
+    )
+    shared_result = QueryResult(
+        DataFrame({"a": ["x"], "b": [1]}), "SELECT", timedelta()
+    )
+    coalescing["load"].side_effect = [None, None, shared_result]
+    processor = make_processor(mocker.MagicMock())
+
+    assert processor.get_query_result(QueryObject(columns=["a"])) is shared_result
+    coalescing["run"].assert_not_called()
+    assert coalescing["lock"].call_count == 2
+
+
+def test_coalesced_query_result_times_out(
+    mocker: MockerFixture, coalescing: dict[str, Any]
+) -> None:
+    """
+    Test that the query is run anyway once waiting for an identical query times out.
+    """
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"CHART_DATA_QUERY_COALESCING_TIMEOUT": 0},
+    )
+    coalescing["load"].return_value = None
+    processor = make_processor(mocker.MagicMock())
+
+    processor.get_query_result(QueryObject(columns=["a"]))
+
+    coalescing["run"].assert_called_once()
+    coalescing["set"].assert_not_called()
+
+
+def test_coalesced_query_result_forced(
+    mocker: MockerFixture, coalescing: dict[str, Any]
+) -> None:
+    """
+    Test that a forced query does not use the shared query result.
+    """
+    processor = make_processor(mocker.MagicMock(), force=True)
+
+    processor.get_query_result(QueryObject(columns=["a"]))
+
+    coalescing["load"].assert_not_called()
+    coalescing["run"].assert_called_once()
+    coalescing["set"].assert_called_once()
+
+
+@mark.parametrize(
+    ("dataset_extra", "database_extra", "expected"),
+    [
+        ({}, {}, 0),
+        ({}, {"stale_while_revalidate": 600}, 600),
+        ({"stale_while_revalidate": 60}, {"stale_while_revalidate": 600}, 60),
+        ({"stale_while_revalidate": 0}, {"stale_while_revalidate": 600}, 0),
+        ({"stale_while_revalidate": "soon"}, {"stale_while_revalidate": 600}, 0),
+        ({"stale_while_revalidate": [1]}, {}, 0),
+    ],
+)
+def test_get_stale_while_revalidate(
+    mocker: MockerFixture,
+    dataset_extra: dict[str, Any],
+    database_extra: dict[str, Any],
+    expected: int,
+) -> None:
+    """
+    Test that the dataset setting takes precedence over the database one.
+    """
+    datasource = mocker.MagicMock(extra_dict=dataset_extra)
+    datasource.database.get_extra.return_value = database_extra
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"CHART_DATA_STALE_WHILE_REVALIDATE": 0},
+    )
+
+    assert make_processor(datasource).get_stale_while_revalidate() == expected
+
+
+@fixture
+def revalidation(mocker: MockerFixture) -> dict[str, Any]:
+    return {
+        "lock": mocker.patch(
+            "superset.common.query_context_processor.acquire_cache_lock",
+            return_value="token",
+        ),
+        "unlock": mocker.patch(
+            "superset.common.query_context_processor.release_cache_lock"
+        ),
+        "task": mocker.patch("superset.tasks.async_queries.refresh_chart_data_cache"),
+    }
+
+
+def make_cache(mocker: MockerFixture, age: int) -> Any:
+    cached_at = datetime.utcnow() - timedelta(seconds=age)
+    return mocker.MagicMock(
+        is_loaded=True,
+        cache_dttm=cached_at.isoformat().split(".")[0],
+    )
+
+
+def test_revalidate_if_stale_fresh(
+    mocker: MockerFixture,
+    revalidation: dict[str, Any],
+) -> None:
+    """
+    Test that results cached within their timeout aren't refreshed.
+    """
+    processor = make_processor(mocker.MagicMock())
+
+    assert not processor.revalidate_if_stale(make_cache(mocker, 10), "key", 60)
+    revalidation["lock"].assert_not_called()
+    revalidation["task"].delay.assert_not_called()
+
+
+def test_revalidate_if_stale(
+    mocker: MockerFixture,
+    revalidation: dict[str, Any],
+) -> None:
+    """
+    Test that stale results are refreshed by a forced query context in a task.
+    """
+    mocker.patch("superset.common.query_context_processor.get_user_id", return_value=1)
+    mocker.patch(
+        "superset.common.query_context_processor.security_manager",
+        mocker.MagicMock(**{"get_current_guest_user_if_guest.return_value": None}),
+    )
+    processor = make_processor(mocker.MagicMock())
+    processor._query_context.cache_values = {"queries": [{"metrics": ["count"]}]}
+
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"SQLLAB_ASYNC_TIME_LIMIT_SEC": 3600},
+    )
+    assert processor.revalidate_if_stale(make_cache(mocker, 120), "key", 60)
+    revalidation["lock"].assert_called_once_with(
+        "chart_data_revalidation", 3600, key="key"
+    )
+    revalidation["task"].delay.assert_called_once_with(
+        {"user_id": 1},
+        {"form_data": {}, "queries": [{"metrics": ["count"]}], "force": True},
+        "key",
+        "token",
+    )
+    revalidation["unlock"].assert_not_called()
+
+
+def test_revalidate_if_stale_pending(
+    mocker: MockerFixture,
+    revalidation: dict[str, Any],
+) -> None:
+    """
+    Test that a single refresh is enqueued while one is pending.
+    """
+    revalidation["lock"].return_value = None
+    processor = make_processor(mocker.MagicMock())
+
+    assert processor.revalidate_if_stale(make_cache(mocker, 120), "key", 60)
+    revalidation["task"].delay.assert_not_called()
+
+
+def test_revalidate_if_stale_enqueue_fails(
+    mocker: MockerFixture,
+    revalidation: dict[str, Any],
+) -> None:
+    """
+    Test that the lock is released when the refresh can't be enqueued.
+    """
+    revalidation["task"].delay.side_effect = ConnectionError()
+    mocker.patch("superset.common.query_context_processor.get_user_id")
+    mocker.patch(
+        "superset.common.query_context_processor.security_manager",
+        mocker.MagicMock(**{"get_current_guest_user_if_guest.return_value": None}),
+    )
+    processor = make_processor(mocker.MagicMock())
+
+    assert processor.revalidate_if_stale(make_cache(mocker, 120), "key", 60)
+    revalidation["unlock"].assert_called_once_with(
+        "chart_data_revalidation", "token", key="key"
+    )
+
+
+def test_get_df_payload_stale(mocker: MockerFixture) -> None:
+    """
+    Test that results are cached for their timeout plus the stale window, and
+    served flagged as stale.
+    """
+    datasource = mocker.MagicMock(column_names=["a"])
+    processor = make_processor(datasource)
+    mocker.patch.object(QueryContextProcessor, "query_cache_key", return_value="key")
+    mocker.patch.object(QueryContextProcessor, "get_cache_timeout", return_value=60)
+    mocker.patch.object(
+        QueryContextProcessor, "get_stale_while_revalidate", return_value=600
+    )
+    mocker.patch.object(QueryContextProcessor, "revalidate_if_stale", return_value=True)
+    get_cache = mocker.patch(
+        "superset.common.query_context_processor.QueryCacheManager.get"
+    )
+    get_cache.return_value.df = DataFrame({"a": [1]})
+    get_cache.return_value.is_loaded = False
+    mocker.patch.object(QueryContextProcessor, "get_query_result")
+    mocker.patch.object(QueryContextProcessor, "get_annotation_data", return_value={})
+
+    payload = processor.get_df_payload(QueryObject(columns=["a"]))
+
+    assert payload["is_stale"]
+    assert get_cache.return_value.set_query_result.call_args.kwargs["timeout"] == 660
@@ -14,15 +14,25 @@
 # KIND, either express or implied.  See the License for the
 # specific language governing permissions and limitations
 # under the License.
-from pandas import DataFrame, Series, Timestamp
+import threading
+from datetime import datetime, timedelta
+
+from pandas import DataFrame, date_range, Series, Timestamp
 from pandas.testing import assert_frame_equal
 from pytest import fixture, mark  # noqa: PT013
+from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
 
 from superset.common.chart_data import ChartDataResultFormat, ChartDataResultType
 from superset.common.query_context import QueryContext
-from superset.common.query_context_processor import QueryContextProcessor
+from superset.common.query_context_processor import (
+    get_single_scan_time_ranges,
+    merge_time_ranges,
+    QueryContextProcessor,
+)
 from superset.connectors.sqla.models import BaseDatasource
 from superset.constants import TimeGrain
+from superset.models.helpers import QueryResult
 
 query_context_processor = QueryContextProcessor(
     QueryContext(
@@ -62,6 +72,60 @@ def test_join_column(time_grain: str, expected: str):
     assert_frame_equal(df, result)
 
 
+@mark.parametrize(
+    "time_grain",
+    [
+        TimeGrain.DAY,
+        TimeGrain.WEEK,
+        TimeGrain.WEEK_STARTING_SUNDAY,
+        TimeGrain.WEEK_ENDING_SATURDAY,
+        TimeGrain.WEEK_STARTING_MONDAY,
+        TimeGrain.WEEK_ENDING_SUNDAY,
+        TimeGrain.MONTH,
+        TimeGrain.QUARTER,
+        TimeGrain.YEAR,
+    ],
+)
+@mark.parametrize("time_offset", [None, "1 week ago", "1 year ago", "3 months later"])
+def test_generate_join_keys(time_grain: str, time_offset: str | None) -> None:
+    """
+    Test that the vectorized join keys match the ones generated row by row.
+    """
+    dates = date_range("2019-12-20", "2021-01-10 12:00", freq="13H")
+    values = Series(dates, index=range(100, 100 + len(dates)))
+
+    join_keys = QueryContextProcessor.generate_join_keys(
+        values, time_grain, time_offset
+    )
+
+    assert join_keys.tolist() == [
+        QueryContextProcessor.generate_join_column([value], 0, time_grain, time_offset)
+        for value in values
+    ]
+    assert join_keys.index.equals(values.index)
+
+
+def test_generate_join_keys_not_datetimes() -> None:
+    assert (
+        QueryContextProcessor.generate_join_keys(
+            Series(["2020-01-01", "2020-02-01"]), TimeGrain.MONTH
+        )
+        is None
+    )
+    assert (
+        QueryContextProcessor.generate_join_keys(
+            Series([Timestamp("2020-01-01"), None]), TimeGrain.MONTH
+        )
+        is None
+    )
+    assert (
+        QueryContextProcessor.generate_join_keys(
+            Series(date_range("2020-01-01", periods=2, tz="UTC")), TimeGrain.MONTH
+        )
+        is None
+    )
+
+
 def test_join_column_producer(make_join_column_producer):
     df = DataFrame({"ds": [Timestamp("2020-01-07")]})
     column_name = "join_column"
@@ -185,3 +249,314 @@ def test_join_offset_dfs_with_month_granularity():
     )
 
     assert_frame_equal(expected, result)
+
+
+def test_run_offset_queries_concurrently(mocker: MockerFixture) -> None:
+    """
+    Test that offset queries run concurrently, and results keep their order.
+    """
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"TIME_OFFSET_QUERIES_MAX_WORKERS": 3},
+    )
+    barrier = threading.Barrier(3, timeout=5)
+
+    def query(query_obj: dict[str, str]) -> QueryResult:
+        # fails unless the three queries are running at the same time
+        barrier.wait()
+        return QueryResult(DataFrame(), query_obj["offset"], timedelta(0))
+
+    mocker.patch.object(BaseDatasource, "query", side_effect=query)
+    offsets = ["1 week ago", "1 month ago", "1 year ago"]
+
+    results = query_context_processor.run_offset_queries(
+        [{"offset": offset} for offset in offsets]
+    )
+
+    assert [result.query for result in results] == offsets
+
+
+def test_run_offset_queries_serially(mocker: MockerFixture) -> None:
+    """
+    Test that offset queries run in the current thread with a single worker.
+    """
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"TIME_OFFSET_QUERIES_MAX_WORKERS": 1},
+    )
+    threads = []
+
+    def query(query_obj: dict[str, str]) -> QueryResult:
+        threads.append(threading.current_thread())
+        return QueryResult(DataFrame(), query_obj["offset"], timedelta(0))
+
+    mocker.patch.object(BaseDatasource, "query", side_effect=query)
+
+    results = query_context_processor.run_offset_queries(
+        [{"offset": "1 week ago"}, {"offset": "1 year ago"}]
+    )
+
+    assert [result.query for result in results] == ["1 week ago", "1 year ago"]
+    assert threads == [threading.current_thread()] * 2
+
+
+def test_run_offset_query_persistent_datasource(
+    mocker: MockerFixture, session: Session
+) -> None:
+    """
+    Test that a persistent datasource is loaded in the session of the thread.
+    """
+    from superset import db
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.models.core import Database
+
+    SqlaTable.metadata.create_all(session.get_bind())
+    database = Database(database_name="my_database", sqlalchemy_uri="sqlite://")
+    datasource = SqlaTable(table_name="my_table", database=database)
+    db.session.add(datasource)
+    db.session.flush()
+
+    processor = QueryContextProcessor(
+        QueryContext(
+            datasource=datasource,
+            queries=[],
+            result_type=ChartDataResultType.COLUMNS,
+            form_data={},
+            slice_=None,
+            result_format=ChartDataResultFormat.CSV,
+            cache_values={},
+        )
+    )
+    query = mocker.patch.object(
+        SqlaTable,
+        "query",
+        autospec=True,
+        side_effect=lambda self, query_obj: QueryResult(
+            DataFrame(), self.table_name, timedelta(0)
+        ),
+    )
+    query_by_id = mocker.spy(db.session, "query")
+
+    result = processor._run_offset_query({"offset": "1 week ago"})
+
+    assert result.query == "my_table"
+    query_by_id.assert_called_once_with(SqlaTable)
+    query.assert_called_once()
+
+
+def test_merge_time_ranges() -> None:
+    assert merge_time_ranges(
+        [
+            (datetime(2021, 3, 1), datetime(2021, 4, 1)),
+            (datetime(2020, 1, 1), datetime(2020, 3, 1)),
+            (datetime(2020, 2, 1), datetime(2020, 4, 1)),
+            (datetime(2020, 4, 1), datetime(2020, 5, 1)),
+        ]
+    ) == [
+        (datetime(2020, 1, 1), datetime(2020, 5, 1)),
+        (datetime(2021, 3, 1), datetime(2021, 4, 1)),
+    ]
+
+
+@mark.parametrize(
+    ("time_grain", "time_ranges", "expected"),
+    [
+        # overlapping monthly ranges
+        (
+            TimeGrain.MONTH,
+            [
+                (datetime(2020, 2, 1), datetime(2020, 5, 1)),
+                (datetime(2020, 1, 1), datetime(2020, 4, 1)),
+            ],
+            True,
+        ),
+        # no time grain, the rows are the raw timestamps
+        (
+            None,
+            [
+                (datetime(2020, 2, 1, 12), datetime(2020, 5, 1)),
+                (datetime(2020, 1, 1, 12), datetime(2020, 4, 1)),
+            ],
+            True,
+        ),
+        # months partially in a time range
+        (
+            TimeGrain.MONTH,
+            [
+                (datetime(2020, 2, 15), datetime(2020, 5, 15)),
+                (datetime(2020, 1, 15), datetime(2020, 4, 15)),
+            ],
+            False,
+        ),
+        # weeks depend on the database
+        (
+            TimeGrain.WEEK,
+            [
+                (datetime(2020, 2, 3), datetime(2020, 2, 17)),
+                (datetime(2020, 1, 27), datetime(2020, 2, 10)),
+            ],
+            False,
+        ),
+        # too far apart
+        (
+            TimeGrain.DAY,
+            [
+                (datetime(2020, 2, 1), datetime(2020, 3, 1)),
+                (datetime(2019, 2, 1), datetime(2019, 3, 1)),
+            ],
+            False,
+        ),
+    ],
+)
+def test_get_single_scan_time_ranges(
+    mocker: MockerFixture,
+    time_grain: str | None,
+    time_ranges: list[tuple[datetime, datetime]],
+    expected: bool,
+) -> None:
+    query_objects = [
+        mocker.MagicMock(
+            from_dttm=from_dttm,
+            to_dttm=to_dttm,
+            time_shift=None,
+            granularity="ds",
+        )
+        for from_dttm, to_dttm in time_ranges
+    ]
+
+    result = get_single_scan_time_ranges(query_objects, "ds", time_grain)
+
+    assert result == (time_ranges if expected else None)
+
+
+def test_run_offset_queries_in_single_scan(mocker: MockerFixture) -> None:
+    """
+    Test that the offsets are sliced out of a single query spanning their ranges.
+    """
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"TIME_OFFSET_SINGLE_SCAN": True, "ROW_LIMIT": 100},
+    )
+    mocker.patch.object(
+        QueryContextProcessor, "normalize_df", side_effect=lambda df, _: df
+    )
+    mocker.patch.object(BaseDatasource, "offset", 0)
+    query = mocker.patch.object(
+        BaseDatasource,
+        "query",
+        return_value=QueryResult(
+            DataFrame(
+                {
+                    "ds": [Timestamp(2020, month, 1) for month in range(1, 6)],
+                    "sum__num": [1, 2, 3, 4, 5],
+                }
+            ),
+            "SELECT ...",
+            timedelta(seconds=1),
+        ),
+    )
+    query_objects = [
+        mocker.MagicMock(
+            from_dttm=datetime(2020, 3, 1),
+            to_dttm=datetime(2020, 6, 1),
+            time_shift=None,
+            granularity="ds",
+        ),
+        mocker.MagicMock(
+            from_dttm=datetime(2020, 1, 1),
+            to_dttm=datetime(2020, 4, 1),
+            time_shift=None,
+            granularity="ds",
+        ),
+    ]
+
+    results = query_context_processor.run_offset_queries_in_single_scan(
+        query_objects,
+        [{"row_limit": 100}, {"row_limit": 100}],
+        "ds",
+        TimeGrain.MONTH,
+    )
+
+    query.assert_called_once_with(
+        {
+            "row_limit": 200,
+            "from_dttm": datetime(2020, 1, 1),
+            "to_dttm": datetime(2020, 6, 1),
+        }
+    )
+    assert [result.df["sum__num"].tolist() for result in results] == [
+        [3, 4, 5],
+        [1, 2, 3],
+    ]
+    assert [result.query for result in results] == ["SELECT ...", ""]
+
+    # offsets which might be missing rows of a truncated result are queried again
+    query.reset_mock()
+    query.side_effect = [
+        QueryResult(
+            DataFrame(
+                {
+                    "ds": [Timestamp(2020, month, 1) for month in [1, 1, 2, 2, 3, 4]],
+                    "sum__num": [1, 2, 3, 4, 5, 6],
+                }
+            ),
+            "SELECT ...",
+            timedelta(seconds=1),
+        ),
+        QueryResult(
+            DataFrame({"ds": [Timestamp(2020, 3, 1)], "sum__num": [7]}),
+            "SELECT ... 1 month ago",
+            timedelta(seconds=1),
+        ),
+    ]
+    results = query_context_processor.run_offset_queries_in_single_scan(
+        query_objects,
+        [{"row_limit": 3, "offset": 1}, {"row_limit": 3, "offset": 2}],
+        "ds",
+        TimeGrain.MONTH,
+    )
+
+    assert query.call_args_list[0].args[0]["row_limit"] == 6
+    assert query.call_args_list[1].args[0] == {"row_limit": 3, "offset": 1}
+    assert [result.df["sum__num"].tolist() for result in results] == [
+        [7],
+        [1, 2, 3],
+    ]
+    assert [result.query for result in results] == [
+        "SELECT ... 1 month ago",
+        "SELECT ...",
+    ]
+
+
+def test_run_offset_queries_in_single_scan_other_granularity(
+    mocker: MockerFixture,
+) -> None:
+    """
+    Test that offsets filtering on another column than the time index are queried
+    separately.
+    """
+    mocker.patch.dict(
+        "superset.common.query_context_processor.config",
+        {"TIME_OFFSET_SINGLE_SCAN": True},
+    )
+    query = mocker.patch.object(BaseDatasource, "query")
+    query_objects = [
+        mocker.MagicMock(
+            from_dttm=datetime(2020, month, 1),
+            to_dttm=datetime(2020, month + 1, 1),
+            time_shift=None,
+            granularity="created_at",
+        )
+        for month in (1, 2)
+    ]
+
+    assert (
+        query_context_processor.run_offset_queries_in_single_scan(
+            query_objects,
+            [{"row_limit": 100}, {"row_limit": 100}],
+            "ds",
+            TimeGrain.MONTH,
+        )
+        is None
+    )
+    query.assert_not_called()
@@ -290,3 +290,18 @@ def test_normalize_prequery_result_type_custom_sql() -> None:
         sqla_table._normalize_prequery_result_type(row, dimension, columns_by_name)
         == "Car"
     )
+
+
+def test_render_rls_clause(mocker: MockerFixture) -> None:
+    """
+    Test that only RLS clauses with Jinja templates are rendered.
+    """
+    from superset.connectors.sqla.models import render_rls_clause
+
+    template_processor = mocker.MagicMock()
+    template_processor.process_template.side_effect = lambda sql: sql.upper()
+
+    assert render_rls_clause("a = '{x}'", template_processor) == "a = '{x}'"
+    template_processor.process_template.assert_not_called()
+    for clause in ("a = {{ 1 }}", "{% if 1 %}a{% endif %}", "a {# b #}"):
+        assert render_rls_clause(clause, template_processor) == clause.upper()
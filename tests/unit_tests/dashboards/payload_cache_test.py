@@ -0,0 +1,161 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+# pylint: disable=import-outside-toplevel, redefined-outer-name
+
+from collections.abc import Iterator
+from typing import Any
+
+import pytest
+from flask_caching import Cache
+from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
+
+from superset.extensions import cache_manager
+from superset.superset_typing import FlaskResponse
+
+
+@pytest.fixture
+def cache(app: Any, mocker: MockerFixture) -> Iterator[Cache]:
+    cache = Cache(app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.object(cache_manager, "_cache", cache)
+    mocker.patch.dict(
+        "superset.dashboards.payload_cache.config",
+        {"DASHBOARD_PAYLOAD_CACHE": True},
+    )
+    yield cache
+    cache.clear()
+
+
+def test_get_version(cache: Cache) -> None:
+    """
+    Test that the version of a dashboard is kept until it's invalidated.
+    """
+    from superset.dashboards.payload_cache import get_version, invalidate
+
+    version = get_version(1)
+    assert get_version(1) == version
+    assert get_version(2) != version
+
+    invalidate([1])
+    assert get_version(1) != version
+
+
+def test_invalidate_on_commit(session: Session, cache: Cache) -> None:
+    """
+    Test that changing a chart invalidates its dashboards once committed.
+    """
+    from superset.dashboards.payload_cache import get_version
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+
+    Dashboard.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+    chart = Slice(id=1, slice_name="chart", datasource_type="table")
+    dashboards = [
+        Dashboard(id=1, dashboard_title="dashboard", slices=[chart]),
+        Dashboard(id=2, dashboard_title="other"),
+    ]
+    session.add_all(dashboards)
+    session.commit()
+    versions = {1: get_version(1), 2: get_version(2)}
+
+    chart.slice_name = "renamed"
+    session.flush()
+    assert get_version(1) == versions[1]
+    session.rollback()
+    session.commit()
+    assert get_version(1) == versions[1]
+
+    chart.slice_name = "renamed"
+    session.commit()
+    assert get_version(1) != versions[1]
+    assert get_version(2) == versions[2]
+
+
+def test_get_charts_etag(
+    client: Any,
+    full_api_access: None,
+    cache: Cache,
+    mocker: MockerFixture,
+) -> None:
+    """
+    Test that the charts of a dashboard are cached and revalidated with their ETag.
+    """
+    from superset.dashboards.payload_cache import invalidate
+
+    mocker.patch.dict(
+        "superset.dashboards.api.current_app.config",
+        {"DASHBOARD_PAYLOAD_CACHE": True},
+    )
+    DashboardDAO = mocker.patch("superset.dashboards.api.DashboardDAO")  # noqa: N806
+    DashboardDAO.get_by_id_or_slug.return_value = mocker.MagicMock(id=1)
+    DashboardDAO.get_charts_for_dashboard.return_value = [
+        {"id": 1, "slice_name": "chart"}
+    ]
+
+    def get(etag: str | None = None) -> FlaskResponse:
+        headers = {"If-None-Match": f'"{etag}"'} if etag else {}
+        return client.get("/api/v1/dashboard/1/charts", headers=headers)
+
+    response = get()
+    assert response.status_code == 200
+    assert response.json["result"] == [{"id": 1, "slice_name": "chart"}]
+    etag = response.headers["ETag"].strip('"')
+
+    response = get(etag)
+    assert response.status_code == 304
+    assert get().json["result"] == [{"id": 1, "slice_name": "chart"}]
+    DashboardDAO.get_charts_for_dashboard.assert_called_once()
+
+    invalidate([1])
+    response = get(etag)
+    assert response.status_code == 200
+    assert response.headers["ETag"].strip('"') != etag
+    assert DashboardDAO.get_charts_for_dashboard.call_count == 2
+
+
+def test_invalidate_on_dataset_metrics_update(session: Session, cache: Cache) -> None:
+    """
+    Test that bulk updating the metrics of a dataset invalidates its dashboards.
+    """
+    from superset.connectors.sqla.models import SqlaTable
+    from superset.daos.dataset import DatasetDAO
+    from superset.dashboards.payload_cache import get_version
+    from superset.models.core import Database
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+
+    SqlaTable.metadata.create_all(session.get_bind())
+    database = Database(database_name="db", sqlalchemy_uri="sqlite://")
+    dataset = SqlaTable(table_name="table", database=database)
+    session.add(dataset)
+    session.flush()
+    chart = Slice(
+        slice_name="chart",
+        datasource_type="table",
+        datasource_id=dataset.id,
+    )
+    session.add(Dashboard(id=1, dashboard_title="dashboard", slices=[chart]))
+    session.commit()
+    version = get_version(1)
+
+    DatasetDAO.update_metrics(
+        dataset,
+        [{"metric_name": "count", "expression": "COUNT(*)"}],
+    )
+    assert get_version(1) == version
+    session.commit()
+    assert get_version(1) != version
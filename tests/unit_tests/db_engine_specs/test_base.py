@@ -20,6 +20,7 @@
 from __future__ import annotations
 
 import json
+from itertools import islice
 from textwrap import dedent
 from typing import Any
 
@@ -382,3 +383,108 @@ def test_unmask_encrypted_extra() -> None:
             },
         }
     )
+
+
+def test_fetch_data_chunks(mocker: MockerFixture) -> None:
+    """
+    Test that results are fetched in chunks up to the limit.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    rows = iter([(i,) for i in range(10)])
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", "INT")]
+    cursor.fetchmany.side_effect = lambda size: list(islice(rows, size))
+
+    chunks = list(BaseEngineSpec.fetch_data_chunks(cursor, 4, limit=9))
+
+    assert chunks == [
+        [(0,), (1,), (2,), (3,)],
+        [(4,), (5,), (6,), (7,)],
+        [(8,)],
+    ]
+    assert [call.args for call in cursor.fetchmany.call_args_list] == [
+        (4,),
+        (4,),
+        (1,),
+    ]
+
+
+def test_fetch_data_chunks_not_supported(mocker: MockerFixture) -> None:
+    """
+    Test that engines without chunked fetching return all the rows at once.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class NoChunksEngineSpec(BaseEngineSpec):
+        supports_chunked_fetch = False
+
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", "INT")]
+    cursor.fetchall.return_value = [(1,), (2,), (3,)]
+
+    assert list(NoChunksEngineSpec.fetch_data_chunks(cursor, 2)) == [[(1,), (2,), (3,)]]
+    cursor.fetchmany.assert_not_called()
+
+
+def test_fetch_data_column_type_mutators(mocker: MockerFixture) -> None:
+    """
+    Test that mutators are applied to the values of their columns, vectorized when
+    the engine has a vectorized implementation.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    class MutatingEngineSpec(BaseEngineSpec):
+        column_type_mutators = {
+            types.Integer: lambda val: val * 10,
+            types.String: lambda val: val.upper(),
+        }
+        column_type_vectorized_mutators = {
+            types.String: lambda values: [val.lower() for val in values],
+        }
+
+        @classmethod
+        def get_datatype(cls, type_code: Any) -> str | None:
+            return type_code
+
+    cursor = mocker.MagicMock()
+    cursor.description = [("a", "INTEGER"), ("a", "VARCHAR"), ("b", "FLOAT")]
+    cursor.fetchall.return_value = [(1, "X", 1.5), (2, "Y", 2.5)]
+
+    assert MutatingEngineSpec.fetch_data(cursor) == [(10, "x", 1.5), (20, "y", 2.5)]
+
+    cursor.fetchall.return_value = []
+    assert MutatingEngineSpec.fetch_data(cursor) == []
+
+    # columns returned as is by their vectorized mutator are not rebuilt
+    MutatingEngineSpec.column_type_vectorized_mutators = {
+        types.Integer: lambda values: values,
+        types.String: lambda values: values,
+    }
+    rows = [(1, "X", 1.5), (2, "Y", 2.5)]
+    cursor.fetchall.return_value = rows
+    assert MutatingEngineSpec.fetch_data(cursor) is rows
+
+
+def test_bulk_insert(tmp_path: Any) -> None:
+    """
+    Test that rows are bulk inserted with executemany by default.
+    """
+    import pandas as pd
+    from sqlalchemy import create_engine
+
+    from superset.db_engine_specs.base import BaseEngineSpec
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'bulk_insert.db'}")
+    df = pd.DataFrame({"id": range(3), "name": ["a", None, "c"]})
+    with engine.begin() as connection:
+        df.to_sql(
+            "table",
+            con=connection,
+            index=False,
+            method=BaseEngineSpec.bulk_insert,
+        )
+
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql('SELECT id, name FROM "table"').fetchall()
+    assert [tuple(row) for row in rows] == [(0, "a"), (1, None), (2, "c")]
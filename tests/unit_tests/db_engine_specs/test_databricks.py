@@ -284,3 +284,23 @@ def test_get_prequeries(mocker: MockerFixture) -> None:
         "USE CATALOG `escaped-hyphen`",
         "USE SCHEMA `hyphen-escaped`",
     ]
+
+
+def test_fetch_arrow_table(mocker: MockerFixture) -> None:
+    """
+    Test that results are fetched as Arrow from the Databricks SQL connector.
+    """
+    import pyarrow as pa
+
+    table = pa.table({"a": [1, 2, 3]})
+    cursor = mocker.MagicMock()
+    cursor.fetchall_arrow.return_value = table
+
+    assert DatabricksNativeEngineSpec.fetch_arrow_table(cursor) == table
+
+    cursor.fetchmany_arrow.return_value = table.slice(0, 2)
+    assert DatabricksNativeEngineSpec.fetch_arrow_table(cursor, limit=2).num_rows == 2
+    cursor.fetchmany_arrow.assert_called_once_with(2)
+
+    cursor = mocker.MagicMock(spec=["fetchall"])
+    assert DatabricksNativeEngineSpec.fetch_arrow_table(cursor) is None
@@ -127,3 +127,91 @@ def test_get_parameters_from_uri() -> None:
 
     assert parameters["database"] == "md:my_db"
     assert parameters["access_token"] == "token"  # noqa: S105
+
+
+def test_fetch_arrow_table(mocker: MockerFixture) -> None:
+    """
+    Test that results are fetched as Arrow from the DuckDB cursor.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+
+    table = pa.table({"a": [1, 2, 3]})
+    cursor = mocker.MagicMock()
+    cursor.fetch_arrow_table.return_value = table
+
+    assert DuckDBEngineSpec.fetch_arrow_table(cursor) == table
+
+    batches = iter(pa.table({"a": range(5)}).to_batches(max_chunksize=2))
+    cursor.fetch_record_batch.return_value = pa.RecordBatchReader.from_batches(
+        table.schema, batches
+    )
+    assert DuckDBEngineSpec.fetch_arrow_table(cursor, limit=3).to_pydict() == {
+        "a": [0, 1, 2]
+    }
+    cursor.fetch_record_batch.assert_called_once_with(rows_per_batch=3)
+    # the batches past the limit are not read
+    assert len(list(batches)) == 1
+
+    cursor = mocker.MagicMock(spec=["fetchall"])
+    assert DuckDBEngineSpec.fetch_arrow_table(cursor) is None
+
+
+def test_bulk_insert(mocker: MockerFixture) -> None:
+    """
+    DB Eng Specs (duckdb): Test inserting rows through an Arrow table
+    """
+    from sqlalchemy import MetaData, Table
+    from sqlalchemy.dialects import postgresql
+
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+
+    connection = mocker.MagicMock()
+    connection.dialect = postgresql.dialect()
+    table = mocker.MagicMock()
+    table.table = Table("table", MetaData(), schema="main")
+
+    assert (
+        DuckDBEngineSpec.bulk_insert(
+            table,
+            connection,
+            ["id", "name"],
+            [(1, "a"), (2, None)],
+        )
+        == 2
+    )
+    view, arrow_table = connection.connection.register.call_args.args
+    assert arrow_table.to_pydict() == {"id": [1, 2], "name": ["a", None]}
+    connection.exec_driver_sql.assert_called_once_with(
+        f'INSERT INTO main."table" (id, name) SELECT id, name FROM {view}'  # noqa: S608
+    )
+    connection.connection.unregister.assert_called_once_with(view)
+
+
+def test_bulk_insert_mixed_types(mocker: MockerFixture) -> None:
+    """
+    DB Eng Specs (duckdb): Test inserting rows Arrow can't convert with INSERT
+    """
+    from sqlalchemy import MetaData, Table
+    from sqlalchemy.dialects import postgresql
+
+    from superset.db_engine_specs.duckdb import DuckDBEngineSpec
+
+    connection = mocker.MagicMock()
+    connection.dialect = postgresql.dialect()
+    connection.execute.return_value.rowcount = 2
+    table = mocker.MagicMock()
+    table.table = Table("table", MetaData())
+
+    assert (
+        DuckDBEngineSpec.bulk_insert(
+            table,
+            connection,
+            ["a"],
+            iter([(1,), ("b",)]),
+        )
+        == 2
+    )
+    connection.connection.register.assert_not_called()
+    assert connection.execute.call_args.args[1] == [{"a": 1}, {"a": "b"}]
@@ -262,3 +262,37 @@ def test_column_type_mutator(
     mock_cursor.description = description
 
     assert spec.fetch_data(mock_cursor) == expected_result
+
+
+def test_bulk_insert(tmp_path) -> None:
+    """
+    DB Eng Specs (mysql): Test inserting rows with executemany in batches
+    """
+    import pandas as pd
+    from sqlalchemy import create_engine
+
+    from superset.db_engine_specs.mysql import MySQLEngineSpec
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'bulk_insert.db'}")
+    df = pd.DataFrame({"id": range(5), "name": ["a", None, "c", "d", "e"]})
+    with patch.object(MySQLEngineSpec, "bulk_insert_batch_size", 2):
+        with engine.begin() as connection:
+            assert (
+                df.to_sql(
+                    "table",
+                    con=connection,
+                    index=False,
+                    method=MySQLEngineSpec.bulk_insert,
+                )
+                == 5
+            )
+
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql('SELECT id, name FROM "table"').fetchall()
+    assert [tuple(row) for row in rows] == [
+        (0, "a"),
+        (1, None),
+        (2, "c"),
+        (3, "d"),
+        (4, "e"),
+    ]
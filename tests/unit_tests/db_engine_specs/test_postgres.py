@@ -243,3 +243,73 @@ def test_timegrain_expressions(time_grain: str, expected_result: str) -> None:
         spec.get_timestamp_expr(col=column("col"), pdf=None, time_grain=time_grain)
     )
     assert actual == expected_result
+
+
+def test_bulk_insert(mocker: MockerFixture) -> None:
+    """
+    DB Eng Specs (postgres): Test inserting rows with COPY
+    """
+    from sqlalchemy import MetaData, Table
+    from sqlalchemy.dialects import postgresql
+
+    copied = {}
+
+    def copy_expert(sql: str, buffer: Any) -> None:
+        copied["sql"] = sql
+        copied["data"] = buffer.read()
+
+    connection = mocker.MagicMock()
+    connection.dialect = postgresql.dialect()
+    cursor = connection.connection.cursor.return_value
+    cursor.copy_expert.side_effect = copy_expert
+    cursor.rowcount = 2
+    table = mocker.MagicMock()
+    table.table = Table("my table", MetaData(), schema="public")
+
+    assert (
+        spec.bulk_insert(
+            table,
+            connection,
+            ["id", "Name", "data"],
+            [
+                (1, "a\tb\\c\nd", b"\x01\xff"),
+                (2, None, datetime(2024, 1, 2, 3, 4, 5)),
+            ],
+        )
+        == 2
+    )
+    assert copied == {
+        "sql": 'COPY public."my table" (id, "Name", data) FROM STDIN',
+        "data": ("1\ta\\tb\\\\c\\nd\t\\\\x01ff\n" "2\t\\N\t2024-01-02 03:04:05\n"),
+    }
+    cursor.close.assert_called_once()
+
+
+def test_update_to_sql_kwargs(mocker: MockerFixture) -> None:
+    """
+    DB Eng Specs (postgres): Test uploading with COPY through psycopg2 only
+    """
+    from sqlalchemy import create_engine
+
+    from superset.db_engine_specs.risingwave import RisingWaveDbEngineSpec
+    from superset.sql.parse import Table
+
+    engine = create_engine("postgresql+psycopg2://")
+    kwargs: dict[str, Any] = {}
+    spec.update_to_sql_kwargs(engine, Table("table"), kwargs)
+    assert kwargs == {"name": "table", "method": "multi"}
+
+    mocker.patch.dict("flask.current_app.config", {"DB_BULK_INSERT": True})
+    kwargs = {}
+    spec.update_to_sql_kwargs(engine, Table("table", "schema"), kwargs)
+    assert kwargs == {"name": "table", "schema": "schema", "method": spec.bulk_insert}
+
+    kwargs = {}
+    RisingWaveDbEngineSpec.update_to_sql_kwargs(engine, Table("t"), kwargs)
+    assert kwargs == {"name": "t", "method": "multi"}
+
+    kwargs = {}
+    engine = mocker.MagicMock()
+    engine.dialect.driver = "pg8000"
+    spec.update_to_sql_kwargs(engine, Table("t"), kwargs)
+    assert kwargs == {"name": "t", "method": "multi"}
@@ -396,3 +396,32 @@ def test_unmask_encrypted_extra() -> None:
             },
         }
     )
+
+
+def test_fetch_arrow_table(mocker: MockerFixture) -> None:
+    """
+    Test that results are fetched in the Arrow format from the connector.
+    """
+    import pyarrow as pa
+
+    from superset.db_engine_specs.snowflake import SnowflakeEngineSpec
+
+    table = pa.table({"a": [1, 2, 3]})
+    cursor = mocker.MagicMock()
+    cursor.fetch_arrow_all.return_value = table
+
+    assert SnowflakeEngineSpec.fetch_arrow_table(cursor) == table
+
+    batches = iter([table, table, table])
+    cursor.fetch_arrow_batches.return_value = batches
+    assert SnowflakeEngineSpec.fetch_arrow_table(cursor, limit=4).to_pydict() == {
+        "a": [1, 2, 3, 1]
+    }
+    # the batches past the limit are not downloaded
+    assert len(list(batches)) == 1
+    cursor.fetch_arrow_batches.return_value = iter([])
+    assert SnowflakeEngineSpec.fetch_arrow_table(cursor, limit=4) is None
+
+    # the connector returns nothing when the query produced no rows
+    cursor.fetch_arrow_all.return_value = None
+    assert SnowflakeEngineSpec.fetch_arrow_table(cursor) is None
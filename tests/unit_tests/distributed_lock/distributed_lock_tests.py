@@ -99,3 +99,51 @@ def test_key_value_distributed_lock_expired() -> None:
                 assert _get_lock(MAIN_KEY, session) is None
 
         assert _get_lock(MAIN_KEY, session) is None
+
+
+def test_key_value_distributed_lock_released_on_error() -> None:
+    """
+    Test that the distributed lock is released when the locked block raises.
+    """
+    session = _get_other_session()
+
+    def fail() -> None:
+        with KeyValueDistributedLock("ns", a=1, b=2):
+            assert _get_lock(MAIN_KEY, session) == LOCK_VALUE
+            raise ValueError("error")
+
+    with freeze_time("2021-01-01"):
+        with pytest.raises(ValueError, match="error"):
+            fail()
+
+        assert _get_lock(MAIN_KEY, session) is None
+
+
+def test_cache_distributed_lock(app: Any, mocker: Any) -> None:
+    """
+    Test that cache locks are exclusive until released or expired, and that an
+    expired lock acquired again isn't released by its former holder.
+    """
+    from flask_caching import Cache
+
+    from superset.distributed_lock import (
+        acquire_cache_lock,
+        CacheDistributedLock,
+        release_cache_lock,
+    )
+    from superset.extensions import cache_manager
+
+    cache = Cache(app, config={"CACHE_TYPE": "SimpleCache"})
+    mocker.patch.object(cache_manager, "_data_cache", cache)
+
+    with CacheDistributedLock("ns", 60, a=1):
+        with pytest.raises(CreateKeyValueDistributedLockFailedException):
+            with CacheDistributedLock("ns", 60, a=1):
+                pass
+        assert acquire_cache_lock("ns", 60, a=2)
+    assert (token := acquire_cache_lock("ns", 60, a=1))
+
+    release_cache_lock("ns", "expired", a=1)
+    assert acquire_cache_lock("ns", 60, a=1) is None
+    release_cache_lock("ns", token, a=1)
+    assert acquire_cache_lock("ns", 60, a=1)
@@ -0,0 +1,60 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from pytest_mock import MockerFixture
+
+from superset.extensions.engine_registry import EngineKey, EngineRegistry
+
+
+def get_key(database_id: int) -> EngineKey:
+    return EngineKey(database_id, None, None, None, "hash")
+
+
+def test_engine_registry(mocker: MockerFixture) -> None:
+    """
+    Test that engines are reused and the least recently used one is disposed.
+    """
+    mocker.patch.dict("flask.current_app.config", {"DB_ENGINE_REGISTRY_MAX_ENGINES": 2})
+    registry = EngineRegistry()
+    engines = [mocker.MagicMock() for _ in range(3)]
+
+    assert registry.get(get_key(1), lambda: engines[0]) is engines[0]
+    assert registry.get(get_key(2), lambda: engines[1]) is engines[1]
+    assert registry.get(get_key(1), mocker.MagicMock()) is engines[0]
+    assert registry.get(get_key(3), lambda: engines[2]) is engines[2]
+
+    engines[0].dispose.assert_not_called()
+    engines[1].dispose.assert_called_once()
+
+    registry.dispose(3)
+    engines[2].dispose.assert_called_once()
+    engines[0].dispose.assert_not_called()
+
+
+def test_engine_registry_fork(mocker: MockerFixture) -> None:
+    """
+    Test that engines inherited from the parent process are neither used nor disposed.
+    """
+    registry = EngineRegistry()
+    engine = mocker.MagicMock()
+    registry.get(get_key(1), lambda: engine)
+
+    mocker.patch("superset.extensions.engine_registry.os.getpid", return_value=-1)
+    other = mocker.MagicMock()
+    assert registry.get(get_key(1), lambda: other) is other
+    registry.dispose()
+    engine.dispose.assert_not_called()
+    other.dispose.assert_called_once()
@@ -17,8 +17,9 @@
 from unittest.mock import Mock
 
 import sshtunnel
+from pytest_mock import MockerFixture
 
-from superset.extensions.ssh import SSHManagerFactory
+from superset.extensions.ssh import SSHManager, SSHManagerFactory
 
 
 def test_ssh_tunnel_timeout_setting() -> None:
@@ -28,9 +29,62 @@ def test_ssh_tunnel_timeout_setting() -> None:
         "SSH_TUNNEL_LOCAL_BIND_ADDRESS": "test",
         "SSH_TUNNEL_TIMEOUT_SEC": 123.0,
         "SSH_TUNNEL_PACKET_TIMEOUT_SEC": 321.0,
+        "SSH_TUNNEL_KEEPALIVE_SEC": 30.0,
+        "SSH_TUNNEL_IDLE_TIMEOUT_SEC": 300.0,
         "SSH_TUNNEL_MANAGER_CLASS": "superset.extensions.ssh.SSHManager",
     }
     factory = SSHManagerFactory()
     factory.init_app(app)
     assert sshtunnel.TUNNEL_TIMEOUT == 123.0
     assert sshtunnel.SSH_TIMEOUT == 321.0
+
+
+def test_persistent_tunnel(mocker: MockerFixture) -> None:
+    """
+    Test that persistent tunnels are reused, reopened once inactive and closed once
+    unused.
+    """
+    app = Mock()
+    app.config = {
+        "SSH_TUNNEL_LOCAL_BIND_ADDRESS": "127.0.0.1",
+        "SSH_TUNNEL_TIMEOUT_SEC": 10.0,
+        "SSH_TUNNEL_PACKET_TIMEOUT_SEC": 1.0,
+        "SSH_TUNNEL_KEEPALIVE_SEC": 30.0,
+        "SSH_TUNNEL_IDLE_TIMEOUT_SEC": 300.0,
+    }
+    manager = SSHManager(app)
+    create_tunnel = mocker.patch.object(
+        manager,
+        "create_tunnel",
+        side_effect=lambda *args, **kwargs: mocker.MagicMock(is_active=True),
+    )
+    ssh_tunnel = mocker.MagicMock(
+        id=1,
+        server_address="bastion",
+        server_port=22,
+        username="superset",
+        password="password",  # noqa: S106
+        private_key=None,
+        private_key_password=None,
+    )
+    uri = "postgresql://user:password@db:5432/db"
+
+    with manager.persistent_tunnel(ssh_tunnel, uri) as server:
+        pass
+    with manager.persistent_tunnel(ssh_tunnel, uri) as other:
+        assert other is server
+    create_tunnel.assert_called_once_with(ssh_tunnel, uri, set_keepalive=30.0)
+    server.start.assert_called_once()
+
+    server.is_active = False
+    with manager.persistent_tunnel(ssh_tunnel, uri) as other:
+        assert other is not server
+        server.stop.assert_called_once_with(force=True)
+
+        manager.close_idle_tunnels(idle_timeout=0)
+        other.stop.assert_not_called()
+
+    manager.close_idle_tunnels(idle_timeout=60)
+    other.stop.assert_not_called()
+    manager.close_idle_tunnels(idle_timeout=0)
+    other.stop.assert_called_once_with(force=True)
@@ -18,7 +18,8 @@
 from __future__ import annotations
 
 import csv
-from datetime import datetime
+import random
+from datetime import date, datetime
 from io import BytesIO, StringIO
 from typing import Any, Generator
 
@@ -97,3 +98,23 @@ def admin_user() -> User:
 def after_each() -> Generator[None, None, None]:
     yield
     db.session.rollback()
+
+
+def random_csv_values(seed: int, size: int = 500) -> list[Any]:
+    """
+    Generate strings made of characters relevant to the escaping rules, mixed with
+    some values that are not strings.
+    """
+    rng = random.Random(seed)  # noqa: S311
+    alphabet = ["-", "@", "+", "|", "=", "%", '"', "'", " ", "\t", "\n", "0", "9", "."]
+    alphabet += ["a", "Z", "é"]
+    others = [None, 1, -1.5, b"=bytes", date(2024, 1, 1), True]
+
+    values: list[Any] = []
+    for _ in range(size):
+        if rng.random() < 0.1:
+            values.append(rng.choice(others))
+        else:
+            length = rng.randint(0, 6)
+            values.append("".join(rng.choice(alphabet) for _ in range(length)))
+    return values
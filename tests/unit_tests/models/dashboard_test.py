@@ -0,0 +1,125 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+import pytest
+from pytest_mock import MockerFixture
+from sqlalchemy import event
+from sqlalchemy.orm.session import Session
+
+from superset.utils import json
+
+
+def create_dashboard(session: Session, datasets: int) -> int:
+    """
+    Create a dashboard with two charts on each of `datasets` datasets.
+    """
+    from superset.connectors.sqla.models import SqlaTable, SqlMetric, TableColumn
+    from superset.models.core import Database
+    from superset.models.dashboard import Dashboard
+    from superset.models.slice import Slice
+
+    SqlaTable.metadata.create_all(session.get_bind())  # pylint: disable=no-member
+
+    database = Database(database_name="db", sqlalchemy_uri="sqlite://")
+    slices = []
+    for i in range(datasets):
+        table = SqlaTable(
+            table_name=f"table_{i}",
+            database=database,
+            columns=[
+                TableColumn(column_name=name, type="INTEGER")
+                for name in ("a", "b", "c")
+            ],
+            metrics=[
+                SqlMetric(metric_name=name, expression="COUNT(*)")
+                for name in ("count", "unused")
+            ],
+        )
+        session.add(table)
+        session.flush()
+        for j in range(2):
+            slices.append(
+                Slice(
+                    slice_name=f"chart_{i}_{j}",
+                    datasource_type="table",
+                    datasource_id=table.id,
+                    viz_type="table",
+                    params=json.dumps({"metrics": ["count"]}),
+                    query_context=json.dumps(
+                        {
+                            "datasource": {"id": table.id, "type": "table"},
+                            "queries": [{"columns": ["a"], "metrics": ["count"]}],
+                            "form_data": {"slice_id": i * 2 + j + 1},
+                        }
+                    ),
+                )
+            )
+
+    dashboard = Dashboard(dashboard_title="dashboard", slices=slices)
+    session.add(dashboard)
+    session.commit()
+    dashboard_id = dashboard.id
+    session.expunge_all()
+    return dashboard_id
+
+
+@contextmanager
+def count_statements(session: Session) -> Iterator[list[str]]:
+    statements: list[str] = []
+
+    def before_cursor_execute(  # pylint: disable=too-many-arguments
+        conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        statements.append(statement)
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
+
+@pytest.mark.parametrize("datasets", [1, 10])
+def test_datasets_trimmed_for_slices_statements(
+    mocker: MockerFixture,
+    session: Session,
+    datasets: int,
+) -> None:
+    """
+    Test that the datasets of a dashboard are loaded in a number of SQL statements
+    independent of the number of datasets and charts.
+    """
+    from superset.models.dashboard import Dashboard
+
+    # the `select_star` of each dataset opens an engine, looking up its SSH tunnel
+    mocker.patch(
+        "superset.daos.database.DatabaseDAO.get_ssh_tunnel",
+        return_value=None,
+    )
+
+    dashboard = session.query(Dashboard).get(create_dashboard(session, datasets))
+
+    with count_statements(session) as statements:
+        result = dashboard.datasets_trimmed_for_slices()
+
+    assert len(result) == datasets
+    assert [metric["metric_name"] for metric in result[0]["metrics"]] == ["count"]
+    assert [column["column_name"] for column in result[0]["columns"]] == ["a"]
+    assert len(statements) <= 6
@@ -21,6 +21,7 @@ from datetime import datetime, timezone
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from numpy.core.multiarray import array
 from pytest_mock import MockerFixture
 
@@ -164,3 +165,92 @@ def test_timezone_series(mocker: MockerFixture) -> None:
         [pd.Timestamp("2023-01-01 00:00:00+0000", tz="UTC")]
     ]
     logger.exception.assert_not_called()
+
+
+def test_columnar_rows_match_arrow_types() -> None:
+    """
+    Test that rows are transposed into one Arrow array per column.
+    """
+    data = [
+        (1, "a", 1.5, None, {"x": 1}),
+        (2, "b", None, True, {"x": 2}),
+    ]
+    description = [
+        ("int", None),
+        ("str", None),
+        ("float", None),
+        ("bool", None),
+        ("nested", None),
+    ]
+    result_set = SupersetResultSet(data, description, BaseEngineSpec)  # type: ignore
+
+    assert [field.type for field in result_set.pa_table.schema] == [
+        pa.int64(),
+        pa.string(),
+        pa.float64(),
+        pa.bool_(),
+        pa.string(),
+    ]
+    assert result_set.pa_table.column("nested").to_pylist() == [
+        "{'x': 1}",
+        "{'x': 2}",
+    ]
+
+
+def test_columnar_rows_mixed_types_are_stringified() -> None:
+    """
+    Test that a column Arrow can't convert falls back to stringified values.
+    """
+    data = [(1, "a"), (2, 3)]
+    description = [("a", None), ("b", None)]
+    result_set = SupersetResultSet(data, description, BaseEngineSpec)  # type: ignore
+
+    assert result_set.pa_table.column("a").to_pylist() == [1, 2]
+    assert result_set.pa_table.column("b").to_pylist() == ["a", "3"]
+
+
+def test_iterator_rows() -> None:
+    """
+    Test that rows returned by an iterator are read.
+    """
+    description = [("a", None), ("b", None)]
+    result_set = SupersetResultSet(
+        ((i, str(i)) for i in range(3)),  # type: ignore
+        description,  # type: ignore
+        BaseEngineSpec,
+    )
+
+    assert result_set.pa_table.column("a").to_pylist() == [0, 1, 2]
+    assert result_set.pa_table.column("b").to_pylist() == ["0", "1", "2"]
+
+    result_set = SupersetResultSet(iter([]), description, BaseEngineSpec)  # type: ignore
+    assert result_set.size == 0
+
+
+def test_arrow_table_input() -> None:
+    """
+    Test that Arrow data returned by a driver is used without row conversion.
+    """
+    table = pa.table(
+        {
+            "a": pa.array([1, 2]),
+            "b": pa.array(["x", "y"]),
+            "c": pa.array([[1, 2], [3]]),
+        }
+    )
+    result_set = SupersetResultSet(table, None, BaseEngineSpec)
+
+    assert result_set.pa_table.column_names == ["a", "b", "c"]
+    assert result_set.pa_table.column("a").type == pa.int64()
+    assert result_set.pa_table.column("c").to_pylist() == ["[1, 2]", "[3]"]
+    assert result_set.to_pandas_df().to_dict(orient="list") == {
+        "a": [1, 2],
+        "b": ["x", "y"],
+        "c": ["[1, 2]", "[3]"],
+    }
+
+    batch = table.to_batches()[0]
+    description = [("a", "INT"), ("a", "STRING"), ("c", "STRING")]
+    result_set = SupersetResultSet(batch, description, BaseEngineSpec)  # type: ignore
+    assert result_set.pa_table.column_names == ["a", "a__1", "c"]
+    assert result_set.size == 2
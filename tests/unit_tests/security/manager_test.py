@@ -18,10 +18,13 @@
 # pylint: disable=invalid-name, unused-argument, redefined-outer-name
 
 import json
+from collections.abc import Iterator
+from typing import Any
 
 import pytest
 from flask_appbuilder.security.sqla.models import Role, User
 from pytest_mock import MockerFixture
+from sqlalchemy.orm.session import Session
 
 from superset.common.query_object import QueryObject
 from superset.connectors.sqla.models import Database, SqlaTable
@@ -1169,3 +1172,163 @@ def test_get_catalogs_accessible_by_user_schema_access(
     catalogs = {"catalog1", "catalog2"}
 
     assert sm.get_catalogs_accessible_by_user(database, catalogs) == {"catalog2"}
+
+
+def test_share_rls_filters(mocker: MockerFixture, app_context: None) -> None:
+    """
+    Test that the RLS filters of a table are only looked up once within
+    `share_rls_filters`.
+    """
+    sm = SupersetSecurityManager(appbuilder)
+    mocker.patch.object(sm, "get_user_roles", return_value=[])
+    session = mocker.patch.object(
+        SupersetSecurityManager, "get_session", new_callable=mocker.PropertyMock
+    ).return_value
+    filters = session.query.return_value.filter.return_value.filter.return_value.all
+    filters.return_value = ["filter"]
+    table = mocker.MagicMock(id=1)
+    other_table = mocker.MagicMock(id=2)
+
+    with override_user(User(username="alice")):
+        with sm.share_rls_filters():
+            assert sm.get_rls_filters(table) == ["filter"]
+            assert sm.get_rls_filters(table) == ["filter"]
+            assert filters.call_count == 1
+            assert sm.get_rls_filters(other_table) == ["filter"]
+            assert filters.call_count == 2
+
+        assert sm.get_rls_filters(table) == ["filter"]
+        assert filters.call_count == 3
+
+
+@pytest.fixture
+def snapshot_cache(app: Any, mocker: MockerFixture) -> Iterator[None]:
+    from flask_caching import Cache
+
+    from superset.extensions import cache_manager
+    from superset.security.snapshot_cache import (
+        permission_snapshots,
+        rls_filter_snapshots,
+    )
+
+    mocker.patch.object(
+        cache_manager, "_cache", Cache(app, config={"CACHE_TYPE": "SimpleCache"})
+    )
+    mocker.patch.dict(
+        app.config,
+        {"PERMISSION_SNAPSHOT_CACHE": True, "RLS_FILTER_CACHE": True},
+    )
+    yield
+    permission_snapshots.invalidate()
+    rls_filter_snapshots.invalidate()
+
+
+def test_can_access_permission_snapshot(
+    mocker: MockerFixture,
+    session: Session,
+    snapshot_cache: None,
+) -> None:
+    """
+    Test that access checks are looked up in the snapshot of the user's roles, which
+    is reloaded once the permissions of a role change.
+    """
+    from flask_appbuilder import Model
+    from flask_appbuilder.security.sqla.models import (
+        Permission,
+        PermissionView,
+        ViewMenu,
+    )
+
+    Model.metadata.create_all(session.get_bind())
+    read, write = Permission(name="can_read"), Permission(name="can_write")
+    chart = ViewMenu(name="Chart")
+    can_read_chart = PermissionView(permission=read, view_menu=chart)
+    can_write_chart = PermissionView(permission=write, view_menu=chart)
+    role = Role(name="Reader", permissions=[can_read_chart])
+    session.add_all([role, can_write_chart])
+    session.commit()
+
+    sm = appbuilder.sm
+    load = mocker.spy(sm, "_load_permission_snapshot")
+    user = mocker.MagicMock(is_anonymous=False, roles=[role])
+    with override_user(user):
+        assert sm.can_access("can_read", "Chart")
+        assert not sm.can_access("can_write", "Chart")
+        assert sm.user_view_menu_names("can_read") == {"Chart"}
+        assert load.call_count == 1
+
+        role.permissions.append(can_write_chart)
+        session.commit()
+        assert sm.can_access("can_write", "Chart")
+        assert load.call_count == 2
+
+
+def test_get_rls_filters_cache(
+    mocker: MockerFixture,
+    session: Session,
+    snapshot_cache: None,
+) -> None:
+    """
+    Test that the RLS filters of a table and set of roles are cached until a filter
+    changes.
+    """
+    from superset.connectors.sqla.models import RowLevelSecurityFilter
+    from superset.utils.core import RowLevelSecurityFilterType
+
+    SqlaTable.metadata.create_all(session.get_bind())
+    role = Role(name="Reader")
+    table = SqlaTable(
+        table_name="t",
+        database=Database(database_name="db", sqlalchemy_uri="sqlite://"),
+    )
+    rls_filter = RowLevelSecurityFilter(
+        name="rls",
+        filter_type=RowLevelSecurityFilterType.REGULAR,
+        clause="a = 1",
+        roles=[role],
+        tables=[table],
+    )
+    session.add(rls_filter)
+    session.commit()
+
+    sm = appbuilder.sm
+    load = mocker.spy(sm, "_load_rls_filters")
+    user = mocker.MagicMock(id=None, is_anonymous=False, roles=[role])
+    with override_user(user):
+        assert [f.clause for f in sm.get_rls_filters(table)] == ["a = 1"]
+        assert [f.clause for f in sm.get_rls_filters(table)] == ["a = 1"]
+        assert load.call_count == 1
+
+        rls_filter.clause = "a = 2"
+        session.commit()
+        assert [f.clause for f in sm.get_rls_filters(table)] == ["a = 2"]
+        assert load.call_count == 2
+
+        rls_filter.roles = []
+        session.commit()
+        assert sm.get_rls_filters(table) == []
+
+
+def test_snapshot_cache_max_snapshots(
+    app: Any,
+    mocker: MockerFixture,
+    snapshot_cache: None,
+) -> None:
+    """
+    Test that each process keeps a bounded number of snapshots, dropping the least
+    recently used.
+    """
+    from superset.security.snapshot_cache import SnapshotCache
+
+    mocker.patch.dict(app.config, {"RLS_FILTER_CACHE_MAX_SNAPSHOTS": 2})
+    snapshots = SnapshotCache(
+        "test_snapshot",
+        "RLS_FILTER_CACHE_TIMEOUT",
+        "RLS_FILTER_CACHE_MAX_SNAPSHOTS",
+    )
+
+    assert snapshots.get("a", lambda: "A") == "A"
+    assert snapshots.get("b", lambda: "B") == "B"
+    assert snapshots.get("a", mocker.MagicMock()) == "A"
+    assert snapshots.get("c", lambda: "C") == "C"
+    assert list(snapshots._snapshots) == ["a", "c"]
@@ -17,6 +17,7 @@
 # pylint: disable=import-outside-toplevel, invalid-name, unused-argument, too-many-locals
 
 import json
+from itertools import islice
 from unittest import mock
 from uuid import UUID
 
@@ -28,8 +29,12 @@ from sqlalchemy.orm.session import Session
 
 from superset import db
 from superset.common.db_query_status import QueryStatus
-from superset.errors import ErrorLevel, SupersetErrorType
-from superset.exceptions import OAuth2Error, SupersetErrorException
+from superset.errors import ErrorLevel, SupersetError, SupersetErrorType
+from superset.exceptions import (
+    InvalidPayloadFormatError,
+    OAuth2Error,
+    SupersetErrorException,
+)
 from superset.models.core import Database
 from superset.sql_lab import execute_sql_statements, get_sql_results
 from superset.utils.core import override_user
@@ -53,6 +58,7 @@ def test_execute_sql_statement(mocker: MockerFixture, app: None) -> None:
     database.mutate_sql_based_on_config.return_value = "SELECT 42 AS answer LIMIT 2"
     db_engine_spec = database.db_engine_spec
     db_engine_spec.is_select_query.return_value = True
+    db_engine_spec.fetch_arrow_table.return_value = None
     db_engine_spec.fetch_data.return_value = [(42,)]
 
     cursor = mocker.MagicMock()
@@ -75,6 +81,162 @@ def test_execute_sql_statement(mocker: MockerFixture, app: None) -> None:
     SupersetResultSet.assert_called_with([(42,)], cursor.description, db_engine_spec)
 
 
+def test_execute_sql_statement_arrow(mocker: MockerFixture, app: None) -> None:
+    """
+    Test that `execute_sql_statement` uses Arrow data when the driver returns it.
+    """
+    import pyarrow as pa
+
+    from superset.sql_lab import execute_sql_statement
+
+    query = mocker.MagicMock()
+    query.limit = 1
+    query.select_as_cta_used = False
+    database = query.database
+    database.allow_dml = False
+    database.mutate_sql_based_on_config.return_value = "SELECT 42 AS answer LIMIT 2"
+    db_engine_spec = database.db_engine_spec
+    db_engine_spec.is_select_query.return_value = True
+    db_engine_spec.fetch_arrow_table.return_value = pa.table({"answer": [42, 43]})
+
+    cursor = mocker.MagicMock()
+    SupersetResultSet = mocker.patch("superset.sql_lab.SupersetResultSet")  # noqa: N806
+
+    execute_sql_statement(
+        "SELECT 42 AS answer",
+        query,
+        cursor=cursor,
+        log_params={},
+        apply_ctas=False,
+    )
+
+    db_engine_spec.fetch_arrow_table.assert_called_with(cursor, 2)
+    db_engine_spec.fetch_data.assert_not_called()
+    data = SupersetResultSet.call_args[0][0]
+    assert data.to_pydict() == {"answer": [42]}
+
+
+def test_execute_sql_statement_chunked_results(
+    mocker: MockerFixture, app: None
+) -> None:
+    """
+    Test that `execute_sql_statement` streams results to the backend in chunks.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.sql_lab import execute_sql_statement, ResultsChunkWriter
+    from superset.sqllab.limiting_factor import LimitingFactor
+    from superset.views.utils import _read_results_chunks
+
+    backend: dict[str, bytes] = {}
+    results_backend = mocker.MagicMock()
+    results_backend.set.side_effect = lambda key, value, timeout: backend.update(
+        {key: value}
+    )
+    results_backend.get.side_effect = backend.get
+    mocker.patch("superset.sql_lab.results_backend", new=results_backend)
+    mocker.patch("superset.views.utils.results_backend", new=results_backend)
+
+    rows = iter([(i, f"row {i}") for i in range(10)])
+    cursor = mocker.MagicMock()
+    cursor.description = [("id", "INT"), ("name", "STRING")]
+    cursor.fetchmany.side_effect = lambda size: list(islice(rows, size))
+
+    query = mocker.MagicMock()
+    query.limit = 5
+    query.select_as_cta_used = False
+    query.limiting_factor = LimitingFactor.DROPDOWN
+    database = query.database
+    database.allow_dml = False
+    database.mutate_sql_based_on_config.return_value = "SELECT * FROM t LIMIT 6"
+    database.db_engine_spec = BaseEngineSpec
+
+    results_writer = ResultsChunkWriter("key", 2, 60)
+    result_set = execute_sql_statement(
+        "SELECT * FROM t",
+        query,
+        cursor=cursor,
+        log_params={},
+        results_writer=results_writer,
+    )
+
+    assert result_set is None
+    assert results_writer.chunk_rows == [2, 2, 1]
+    assert results_writer.rows == 5
+    assert [column["column_name"] for column in results_writer.columns] == [
+        "id",
+        "name",
+    ]
+    assert sorted(backend) == ["key-chunk-0", "key-chunk-1", "key-chunk-2"]
+    assert query.limiting_factor == LimitingFactor.DROPDOWN
+
+    df = _read_results_chunks("key", results_writer.chunk_rows, chunk=1)
+    assert df["id"].tolist() == [2, 3]
+
+    df = _read_results_chunks("key", results_writer.chunk_rows, rows=3)
+    assert df["id"].tolist() == [0, 1, 2, 3]
+
+    df = _read_results_chunks("key", results_writer.chunk_rows)
+    assert df["name"].tolist() == [f"row {i}" for i in range(5)]
+
+    with pytest.raises(InvalidPayloadFormatError):
+        _read_results_chunks("key", results_writer.chunk_rows, chunk=3)
+
+
+def test_execute_sql_statement_chunked_results_column_types(
+    mocker: MockerFixture, app: None
+) -> None:
+    """
+    Test that column types unknown in the first chunk are taken from later chunks.
+    """
+    from superset.db_engine_specs.base import BaseEngineSpec
+    from superset.result_set import SupersetResultSet
+    from superset.sql_lab import ResultsChunkWriter
+
+    mocker.patch("superset.sql_lab.results_backend")
+
+    description = [("id", None, None, None, None, None, None)]
+    results_writer = ResultsChunkWriter("key", 2, 60)
+    results_writer.write(SupersetResultSet([(None,)], description, BaseEngineSpec))
+    assert results_writer.columns[0]["type"] is None
+
+    results_writer.write(SupersetResultSet([(1,)], description, BaseEngineSpec))
+    assert results_writer.columns[0]["type"] == "INT"
+
+
+def test_execute_sql_statement_generic_error(mocker: MockerFixture) -> None:
+    """
+    Test that errors other than results being too large are handled generically.
+    """
+    from superset.sql_lab import execute_sql_statement, SqlLabException
+
+    query = mocker.MagicMock()
+    query.limit = None
+    query.select_as_cta_used = False
+    query.status = "running"
+    database = query.database
+    database.allow_dml = False
+    database.mutate_sql_based_on_config.return_value = "SELECT 42 AS answer"
+    db_engine_spec = database.db_engine_spec
+    db_engine_spec.execute_with_cursor.side_effect = SupersetErrorException(
+        SupersetError(
+            message="Boom",
+            error_type=SupersetErrorType.GENERIC_DB_ENGINE_ERROR,
+            level=ErrorLevel.ERROR,
+        )
+    )
+    db_engine_spec.extract_error_message.return_value = "Boom"
+    mocker.patch("superset.sql_lab.db")
+
+    with pytest.raises(SqlLabException, match="Boom"):
+        execute_sql_statement(
+            "SELECT 42 AS answer",
+            query,
+            cursor=mocker.MagicMock(),
+            log_params={},
+            apply_ctas=False,
+        )
+
+
 def test_execute_sql_statement_with_rls(
     mocker: MockerFixture,
 ) -> None:
@@ -96,6 +258,7 @@ def test_execute_sql_statement_with_rls(
     database.mutate_sql_based_on_config.return_value = sql_statement_with_rls_and_limit
     db_engine_spec = database.db_engine_spec
     db_engine_spec.is_select_query.return_value = True
+    db_engine_spec.fetch_arrow_table.return_value = None
     db_engine_spec.fetch_data.return_value = [(42,)]
 
     cursor = mocker.MagicMock()
@@ -53,3 +53,24 @@ def test_load_chart_data_into_cache_with_error(
     mock_async_query_manager.update_job.assert_called_once_with(
         job_metadata, "error", errors=expected_errors
     )
+
+
+@mock.patch("superset.distributed_lock.release_cache_lock")
+@mock.patch("superset.tasks.async_queries.security_manager")
+@mock.patch("superset.tasks.async_queries.ChartDataQueryContextSchema")
+def test_refresh_chart_data_cache_releases_lock(
+    mock_query_context_schema_cls, mock_security_manager, mock_release_lock
+):
+    """Test that the revalidation lock is released, even when the refresh fails"""
+    from superset.tasks.async_queries import refresh_chart_data_cache
+
+    mock_query_context = mock.MagicMock()
+    mock_query_context.get_payload.side_effect = ChartDataQueryFailedError(_("Error"))
+    mock_query_context_schema_cls.return_value.load.return_value = mock_query_context
+
+    with pytest.raises(ChartDataQueryFailedError):
+        refresh_chart_data_cache({"user_id": 1}, {"force": True}, "key", "token")
+
+    mock_release_lock.assert_called_once_with(
+        "chart_data_revalidation", "token", key="key"
+    )
@@ -0,0 +1,75 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from flask import current_app, g, has_request_context
+
+from superset.utils.concurrency import get_database_semaphore, run_in_app_context
+
+
+def test_run_in_app_context() -> None:
+    """
+    Test that the app context and `g` are available to the wrapped function.
+    """
+    g.user = "admin"
+
+    def get_context() -> tuple[str, str]:
+        return current_app.name, g.user
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(run_in_app_context(get_context)) for _ in range(2)]
+        results = [future.result() for future in futures]
+
+    assert results == [(current_app.name, "admin")] * 2
+
+
+def test_run_in_app_context_request() -> None:
+    """
+    Test that the form data of the request is passed on, but not the request.
+    """
+    from superset.views.utils import get_form_data
+
+    def get_request_form_data() -> tuple[bool, dict[str, Any]]:
+        form_data, _ = get_form_data()
+        return has_request_context(), form_data
+
+    with current_app.test_request_context(
+        "/", json={"queries": [{"url_params": {"foo": "bar"}}]}
+    ):
+        wrapped = run_in_app_context(get_request_form_data)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        in_request, form_data = executor.submit(wrapped).result()
+
+    assert not in_request
+    assert form_data["url_params"] == {"foo": "bar"}
+
+
+def test_get_database_semaphore() -> None:
+    """
+    Test that a database always gets the same semaphore.
+    """
+    semaphore = get_database_semaphore(1234, 2)
+
+    assert get_database_semaphore(1234, 5) is semaphore
+    assert get_database_semaphore(4321, 2) is not semaphore
+    assert semaphore.acquire(blocking=False)
+    assert semaphore.acquire(blocking=False)
+    assert not semaphore.acquire(blocking=False)
+    semaphore.release()
+    semaphore.release()
@@ -15,11 +15,14 @@
 # specific language governing permissions and limitations
 # under the License.
 
+from typing import Any
+
 import pandas as pd
 import pyarrow as pa
-import pytest  # noqa: F401
+import pytest
 
 from superset.utils import csv
+from tests.unit_tests.fixtures.common import random_csv_values
 
 
 def test_escape_value():
@@ -95,3 +98,66 @@ def test_df_to_escaped_csv():
 
     df = pa.array([1, None]).to_pandas(integer_object_nulls=True).to_frame()
     assert csv.df_to_escaped_csv(df, encoding="utf8", index=False) == '0\n1\n""\n'
+
+
+def test_df_to_escaped_csv_chunks():
+    df = pd.DataFrame(
+        data={
+            "=name": ["a", "=func()", "-10", "|pipe", "b"],
+            "value": [1, 2, 3, 4, 5],
+        },
+        index=[10, 11, 12, 13, 14],
+    )
+
+    chunks = list(csv.df_to_escaped_csv_chunks(df, chunk_size=2, index=False))
+
+    assert chunks == [
+        "'=name,value\na,1\n'=func(),2\n",
+        "-10,3\n'\\\\|pipe,4\n",
+        "b,5\n",
+    ]
+    assert "".join(chunks) == csv.df_to_escaped_csv(df, index=False)
+
+    # the original frame is left untouched
+    assert df["=name"].tolist() == ["a", "=func()", "-10", "|pipe", "b"]
+
+
+def test_df_to_escaped_csv_chunks_empty():
+    df = pd.DataFrame({"a": [], "b": []})
+
+    assert list(csv.df_to_escaped_csv_chunks(df, index=False)) == ["a,b\n"]
+    assert list(csv.df_to_escaped_csv_chunks(df, index=False, header=False)) == [""]
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_escape_values_matches_escape_value(seed: int) -> None:
+    values = random_csv_values(seed)
+    series = pd.Series(values, dtype=object)
+
+    escaped = csv.escape_values(series)
+
+    assert escaped.tolist() == [
+        csv.escape_value(value) if isinstance(value, str) else value for value in values
+    ]
+    assert series.tolist() == values
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [],
+        [None, 1, 2.5],
+        ["a", "b"],
+        ["=a", "-1", "|b", None],
+        ["\u3000=a", "\x1c-b", "\ud800=c", "é=d"],
+    ],
+)
+def test_escape_values_edge_cases(values: list[Any]) -> None:
+    series = pd.Series(values, dtype=object, index=range(10, 10 + len(values)))
+
+    escaped = csv.escape_values(series)
+
+    assert escaped.tolist() == [
+        csv.escape_value(value) if isinstance(value, str) else value for value in values
+    ]
+    assert escaped.index.tolist() == series.index.tolist()
@@ -18,10 +18,12 @@
 from datetime import datetime, timezone
 
 import pandas as pd
+import pytest
 from pandas.api.types import is_numeric_dtype
 
 from superset.utils.core import GenericDataType
-from superset.utils.excel import apply_column_types, df_to_excel
+from superset.utils.excel import apply_column_types, df_to_excel, quote_formulas
+from tests.unit_tests.fixtures.common import random_csv_values
 
 
 def test_timezone_conversion() -> None:
@@ -47,6 +49,21 @@ def test_quote_formulas() -> None:
     ]
 
 
+@pytest.mark.parametrize("seed", range(20))
+def test_quote_formulas_random_values(seed: int) -> None:
+    """
+    Test that formulas are quoted the same way as with the value by value check.
+    """
+    values = random_csv_values(seed)
+    df = pd.DataFrame({"a": values, "b": list(reversed(values)), "c": 1})
+
+    expected = df.applymap(
+        lambda x: f"'{x}" if isinstance(x, str) and len(x) and x[0] in "=+-@" else x
+    )
+
+    pd.testing.assert_frame_equal(quote_formulas(df), expected)
+
+
 def test_column_data_types_with_one_numeric_column():
     df = pd.DataFrame(
         {
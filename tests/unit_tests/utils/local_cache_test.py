@@ -0,0 +1,140 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+import pandas as pd
+from freezegun import freeze_time
+from pytest_mock import MockerFixture
+
+from superset.utils.local_cache import get_value_size, LocalCache
+
+
+def make_value(rows: int) -> dict[str, pd.DataFrame]:
+    return {"df": pd.DataFrame({"a": range(rows)})}
+
+
+def test_local_cache_disabled() -> None:
+    """
+    Test that nothing is cached without a size.
+    """
+    cache = LocalCache(max_size=0, timeout=60)
+    cache.set("key", make_value(1))
+
+    assert cache.get("key") is None
+    assert len(cache) == 0
+
+
+def test_local_cache_copies_dataframes() -> None:
+    """
+    Test that callers can mutate the dataframes they set and get.
+    """
+    cache = LocalCache(max_size=10**6, timeout=60)
+    value = make_value(3)
+    cache.set("key", value)
+    value["df"]["a"] = 0
+
+    cached = cache.get("key")
+    assert cached is not None
+    assert cached["df"]["a"].tolist() == [0, 1, 2]
+    cached["df"].columns = ["b"]
+    assert cache.get("key")["df"].columns.tolist() == ["a"]  # type: ignore
+
+
+def test_local_cache_evicts_least_recently_used() -> None:
+    """
+    Test that entries are evicted in LRU order once over the size.
+    """
+    size = get_value_size(make_value(100))
+    cache = LocalCache(max_size=int(size * 2.5), timeout=60)
+    cache.set("a", make_value(100))
+    cache.set("b", make_value(100))
+    cache.get("a")
+    cache.set("c", make_value(100))
+
+    assert cache.has("a")
+    assert not cache.has("b")
+    assert cache.has("c")
+    assert cache.size == 2 * size
+
+
+def test_local_cache_skips_oversized_values() -> None:
+    """
+    Test that values larger than the cache replace nothing.
+    """
+    cache = LocalCache(max_size=get_value_size(make_value(10)), timeout=60)
+    cache.set("small", make_value(10))
+    cache.set("large", make_value(1000))
+
+    assert cache.has("small")
+    assert not cache.has("large")
+
+
+def test_local_cache_timeout() -> None:
+    """
+    Test that entries expire after their timeout, capped at the cache timeout.
+    """
+    cache = LocalCache(max_size=10**6, timeout=60)
+    with freeze_time("2024-01-01 00:00:00") as frozen:
+        cache.set("short", make_value(1), timeout=10)
+        cache.set("long", make_value(1), timeout=3600)
+        cache.set("default", make_value(1))
+
+        frozen.tick(30)
+        assert cache.get("short") is None
+        assert cache.get("long") is not None
+
+        frozen.tick(31)
+        assert cache.get("long") is None
+        assert cache.get("default") is None
+    assert cache.size == 0
+
+
+def test_local_cache_invalidate() -> None:
+    """
+    Test that the entries of a datasource are invalidated.
+    """
+    cache = LocalCache(max_size=10**6, timeout=60)
+    cache.set("a", make_value(1), datasource_uid="1__table")
+    cache.set("b", make_value(1), datasource_uid="1__table")
+    cache.set("c", make_value(1), datasource_uid="2__table")
+
+    cache.invalidate("1__table")
+
+    assert not cache.has("a")
+    assert not cache.has("b")
+    assert cache.has("c")
+    assert cache.size == get_value_size(make_value(1))
+
+
+def test_local_cache_stats(mocker: MockerFixture) -> None:
+    """
+    Test that hits, misses and evictions are reported.
+    """
+    stats_logger = mocker.MagicMock()
+    cache = LocalCache(
+        max_size=get_value_size(make_value(1)),
+        timeout=60,
+        stats_logger=stats_logger,
+    )
+    cache.get("a")
+    cache.set("a", make_value(1))
+    cache.get("a")
+    cache.set("b", make_value(1))
+
+    assert [call.args[0] for call in stats_logger.incr.call_args_list] == [
+        "local_cache_miss",
+        "local_cache_hit",
+        "local_cache_eviction",
+    ]
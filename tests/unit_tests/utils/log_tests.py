@@ -16,7 +16,13 @@
 # under the License.
 
 
-from superset.utils.log import get_logger_from_status
+import threading
+from datetime import datetime
+
+from pytest_mock import MockerFixture
+from sqlalchemy import create_engine, select
+
+from superset.utils.log import AsyncDBEventLogger, get_logger_from_status
 
 
 def test_log_from_status_exception() -> None:
@@ -35,3 +41,74 @@ def test_log_from_status_info() -> None:
     (func, log_level) = get_logger_from_status(300)
     assert func.__name__ == "info"
     assert log_level == "info"
+
+
+def test_async_db_event_logger(mocker: MockerFixture) -> None:
+    """
+    Test that the async event logger inserts logs in batches, and the queued ones on
+    shutdown.
+    """
+    insert = mocker.patch.object(AsyncDBEventLogger, "_insert")
+    event_logger = AsyncDBEventLogger(batch_size=2, flush_interval=60)
+
+    for slice_id in range(5):
+        event_logger.log(1, "action", None, 10, slice_id, None, records=[{}])
+    event_logger.shutdown(timeout=10)
+
+    batches = [call.args[0] for call in insert.call_args_list]
+    assert [len(batch) for batch in batches] == [2, 2, 1]
+    assert [log["slice_id"] for batch in batches for log in batch] == list(range(5))
+    assert batches[0][0]["json"] == "{}"
+    assert batches[0][0]["dttm"] is not None
+
+
+def test_async_db_event_logger_flush_interval(mocker: MockerFixture) -> None:
+    """
+    Test that the async event logger inserts logs once the flush interval elapses.
+    """
+    inserted = threading.Event()
+    mocker.patch.object(
+        AsyncDBEventLogger, "_insert", side_effect=lambda batch: inserted.set()
+    )
+    event_logger = AsyncDBEventLogger(batch_size=100, flush_interval=0.01)
+
+    event_logger.log(1, "action", None, 10, None, None, records=[{}])
+    assert inserted.wait(timeout=10)
+    event_logger.shutdown(timeout=10)
+
+
+def test_async_db_event_logger_full(mocker: MockerFixture) -> None:
+    """
+    Test that the async event logger drops logs once its queue is full.
+    """
+    mocker.patch.object(AsyncDBEventLogger, "_start")
+    event_logger = AsyncDBEventLogger(max_queue_size=1, put_timeout=0)
+
+    event_logger.log(1, "action", None, 10, None, None, records=[{}, {}])
+    assert event_logger._queue.qsize() == 1
+
+
+def test_async_db_event_logger_insert(mocker: MockerFixture) -> None:
+    """
+    Test that the async event logger inserts batches into the logs table.
+    """
+    from superset import db
+    from superset.models.core import Log
+
+    engine = create_engine("sqlite://")
+    Log.metadata.create_all(engine)
+    mocker.patch.object(
+        type(db), "engine", new_callable=mocker.PropertyMock, return_value=engine
+    )
+
+    event_logger = AsyncDBEventLogger()
+    event_logger._insert(
+        [
+            {"action": "a", "slice_id": 1, "dttm": datetime(2024, 1, 1)},
+            {"action": "b", "slice_id": 2, "dttm": datetime(2024, 1, 1)},
+        ]
+    )
+
+    with engine.connect() as connection:
+        rows = connection.execute(select(Log.action, Log.slice_id)).all()
+    assert sorted(rows) == [("a", 1), ("b", 2)]
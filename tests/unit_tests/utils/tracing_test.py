@@ -0,0 +1,108 @@
+# Licensed to the Apache Software Foundation (ASF) under one
+# or more contributor license agreements.  See the NOTICE file
+# distributed with this work for additional information
+# regarding copyright ownership.  The ASF licenses this file
+# to you under the Apache License, Version 2.0 (the
+# "License"); you may not use this file except in compliance
+# with the License.  You may obtain a copy of the License at
+#
+#   http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing,
+# software distributed under the License is distributed on an
+# "AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+# KIND, either express or implied.  See the License for the
+# specific language governing permissions and limitations
+# under the License.
+from concurrent.futures import ThreadPoolExecutor
+
+from superset.utils.concurrency import run_in_app_context
+from superset.utils.tracing import (
+    get_current_span,
+    get_server_timing,
+    Span,
+    span,
+    start_trace,
+    traced,
+)
+
+
+def test_span_without_trace() -> None:
+    """
+    Test that spans are not recorded when no trace is started.
+    """
+    with span("query") as current:
+        assert current is None
+        assert get_current_span() is None
+
+
+def test_start_trace() -> None:
+    """
+    Test that spans are nested under the span open when they're opened.
+    """
+
+    @traced("query")
+    def query() -> None:
+        with span("db_execute"):
+            pass
+        with span("db_fetch"):
+            pass
+
+    with start_trace("total") as trace:
+        with span("security"):
+            pass
+        query()
+
+    assert get_current_span() is None
+    assert trace.end is not None
+    tree = trace.to_dict()
+    assert tree["name"] == "total"
+    assert [child["name"] for child in tree["children"]] == ["security", "query"]
+    assert [child["name"] for child in tree["children"][1]["children"]] == [
+        "db_execute",
+        "db_fetch",
+    ]
+    assert all(child["start_ms"] >= 0 for child in tree["children"])
+
+
+def test_start_trace_thread() -> None:
+    """
+    Test that spans opened by functions run on other threads are recorded.
+    """
+
+    def query() -> None:
+        with span("query"):
+            pass
+
+    with start_trace("total") as trace:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            for future in [executor.submit(run_in_app_context(query)) for _ in "ab"]:
+                future.result()
+
+    assert [child.name for child in trace.children] == ["query", "query"]
+
+
+def test_get_server_timing() -> None:
+    """
+    Test that the durations of spans with the same name are added up, unless nested.
+    """
+    trace = Span(
+        "total",
+        start=0,
+        end=1,
+        children=[
+            Span("templating", start=0, end=0.1),
+            Span(
+                "query",
+                start=0.1,
+                end=0.6,
+                children=[Span("query", start=0.2, end=0.3)],
+            ),
+            Span("templating", start=0.6, end=0.7),
+            Span("cache get", start=0.7, end=0.75),
+        ],
+    )
+
+    assert get_server_timing(trace) == (
+        "total;dur=1000.0, templating;dur=200.0, query;dur=500.0, cache_get;dur=50.0"
+    )